@@ -1,18 +1,109 @@
-from typing import Dict, Type
+from typing import TYPE_CHECKING, Any, List, Type
 
+from .elastic import export_elastic_mapping as _export_elastic_mapping
 from .export import export_schema as _export_schema
 from .models.base import ExtendedDatasetProfileBase
-
-# import all models from the v0 version as this is the current version
-from .models.v0 import *  # noqa: F403
-from .models.v0 import ExtendedDatasetProfile
+from .models.registry import SchemaVersions
+from .validate import validate_edps as _validate_edps
 from .version import CURRENT_VERSION
 from .version import __version__ as __version__
 
-schema_versions: Dict[int, Type[ExtendedDatasetProfileBase]] = {CURRENT_VERSION.major: ExtendedDatasetProfile}
+if TYPE_CHECKING:
+    from .models.v0 import *  # noqa: F403
+
+    CURRENT_SCHEMA: Type[ExtendedDatasetProfile]  # noqa: F405
+
+# The names of the models of the current version, which are provided by __getattr__.
+_MODEL_NAMES = (
+    "ArchiveDataSet",
+    "AssetGrowthRate",
+    "AssetImmutability",
+    "AssetProcessingStatus",
+    "AssetReference",
+    "AssetTransferType",
+    "AssetUpdatePeriod",
+    "AudioDataSet",
+    "Augmentation",
+    "Chunk",
+    "CorrelationSummary",
+    "DataSetCompression",
+    "DataSetType",
+    "DataSpace",
+    "DatasetTreeNode",
+    "DateTimeColumn",
+    "DocumentDataSet",
+    "EmbeddedTable",
+    "ExtendedDatasetProfile",
+    "FileProperties",
+    "FileReference",
+    "ImageColorMode",
+    "ImageDPI",
+    "ImageDataSet",
+    "JsonReference",
+    "Language",
+    "License",
+    "ModificationState",
+    "Numeric",
+    "NumericColumn",
+    "Publisher",
+    "Resolution",
+    "SemiStructuredDataSet",
+    "StringColumn",
+    "StructuredDataSet",
+    "TemporalConsistency",
+    "TemporalCover",
+    "TimeBasedGraph",
+    "Trend",
+    "UnstructuredTextDataSet",
+    "VideoDataSet",
+    "VideoPixelFormat",
+    "WordFrequency",
+)
+
+# Star imports resolve the models through __getattr__, so they are still imported lazily.
+__all__ = [
+    "CURRENT_SCHEMA",
+    "CURRENT_VERSION",
+    "ExtendedDatasetProfileBase",
+    "export_elastic_mapping",
+    "export_schema",
+    "schema_versions",
+    "validate_edps",
+    *_MODEL_NAMES,
+]
+
+# v0 is the current schema. The v1 models validate the major version of this package, so they are only
+# registered under that major, if it differs from v0. The models of a version only get imported on first use.
+_CURRENT_MAJOR = 0
+_modules = {_CURRENT_MAJOR: "extended_dataset_profile.models.v0"}
+if CURRENT_VERSION.major != _CURRENT_MAJOR:
+    _modules[CURRENT_VERSION.major] = "extended_dataset_profile.models.v1"
+schema_versions = SchemaVersions(_modules, default=_CURRENT_MAJOR)
+
 
-CURRENT_SCHEMA = schema_versions[CURRENT_VERSION.major]
+def __getattr__(name: str) -> Any:
+    """Lazily provide CURRENT_SCHEMA and all models of the current version."""
+    if name == "CURRENT_SCHEMA":
+        value: Any = schema_versions[_CURRENT_MAJOR]
+    elif name in _MODEL_NAMES:
+        value = getattr(schema_versions.module(_CURRENT_MAJOR), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), "CURRENT_SCHEMA", *_MODEL_NAMES})
 
 
 def export_schema():
-    return _export_schema(CURRENT_SCHEMA)
+    return _export_schema(schema_versions[_CURRENT_MAJOR], schema_versions)
+
+
+def export_elastic_mapping():
+    return _export_elastic_mapping(schema_versions[_CURRENT_MAJOR], schema_versions)
+
+
+def validate_edps():
+    return _validate_edps(schema_versions)
@@ -0,0 +1,32 @@
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Annotated, Any, Dict, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+def strip_optional(annotation: Any) -> Any:
+    """Remove `Annotated` and `Optional` from a type annotation, e.g. `Optional[Annotated[str, ...]]` becomes `str`."""
+    if get_origin(annotation) is Annotated:
+        return strip_optional(get_args(annotation)[0])
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return strip_optional(args[0])
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def json_keys(model: Type[BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    """Field names and their JSON pointer encoded keys in the serialized form of the model."""
+    keys = []
+    for name, field in model.model_fields.items():
+        key = field.serialization_alias or field.alias or name
+        keys.append((name, key.replace("~", "~0").replace("/", "~1")))
+    return tuple(keys)
+
+
+@lru_cache(maxsize=None)
+def field_names(model: Type[BaseModel]) -> Dict[str, str]:
+    """The field names of the model by their JSON pointer encoded keys, the inverse of `json_keys`."""
+    return {key: name for name, key in json_keys(model)}
@@ -0,0 +1,183 @@
+"""
+Compact binary encoding of EDPs based on MessagePack.
+
+Models are encoded as maps from field IDs to values instead of repeating the key strings of every field. The ID of
+a field is its position in the model definition, so new fields must only be appended to models to keep older
+encodings readable. Datetimes, timedeltas and paths are stored as MessagePack extension types, all other values as
+their JSON representation.
+
+Requires the optional "binary" dependencies (`msgpack`).
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from pathlib import PurePosixPath
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AnyUrl, BaseModel
+
+from extended_dataset_profile.construct import construct_trusted
+from extended_dataset_profile.types.version import Version
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+EXT_DATETIME = 1
+EXT_TIMEDELTA = 2
+EXT_PATH = 3
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_INT64 = struct.Struct("<q")
+_AWARE_DATETIME = struct.Struct("<qq")
+
+_Decoder = Callable[[Any], Any]
+
+_DECODERS: Dict[Any, Optional[_Decoder]] = {}
+
+
+def to_bytes(model: BaseModel) -> bytes:
+    """Encode a model (usually an EDP) to its compact binary representation."""
+    return cast(bytes, _msgpack().packb(model, default=_encode, use_bin_type=True, datetime=False))
+
+
+def from_bytes(data: bytes, model: Type[ModelT], trusted: bool = False) -> ModelT:
+    """
+    Decode a model from the binary representation created by `to_bytes`.
+
+    The decoded data gets validated by the model. Pass `trusted` for data created by your own code to build the
+    model with `construct_trusted` instead.
+    """
+    values = _msgpack().unpackb(data, ext_hook=_decode_extension, strict_map_key=False, raw=False)
+    fields = _model_decoder(model)(values)
+    if trusted:
+        return construct_trusted(model, fields)
+    return model.model_validate(fields)
+
+
+def _msgpack():
+    if msgpack is None:
+        raise ImportError('The binary EDP encoding requires msgpack, install the "binary" extra.')
+    return msgpack
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        values = value.__dict__
+        return {
+            field_id: values[name]
+            for field_id, name, omit_none in _encoded_fields(type(value))
+            if not omit_none or values[name] is not None
+        }
+    if isinstance(value, datetime):
+        return _encode_datetime(value)
+    if isinstance(value, timedelta):
+        return msgpack.ExtType(EXT_TIMEDELTA, _INT64.pack(value // _MICROSECOND))
+    if isinstance(value, PurePosixPath):
+        return msgpack.ExtType(EXT_PATH, str(value).encode())
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (AnyUrl, Version)):
+        return str(value)
+    raise TypeError(f"Objects of type {type(value).__name__} can not be encoded")
+
+
+def _encode_datetime(value: datetime) -> Any:
+    local = (value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+    offset = value.utcoffset()
+    if offset is None:
+        return msgpack.ExtType(EXT_DATETIME, _INT64.pack(local))
+    return msgpack.ExtType(EXT_DATETIME, _AWARE_DATETIME.pack(local, offset // _MICROSECOND))
+
+
+def _decode_extension(code: int, data: bytes) -> Any:
+    if code == EXT_DATETIME:
+        if len(data) == _INT64.size:
+            return _EPOCH + timedelta(microseconds=_INT64.unpack(data)[0])
+        local, offset = _AWARE_DATETIME.unpack(data)
+        return (_EPOCH + timedelta(microseconds=local)).replace(tzinfo=timezone(timedelta(microseconds=offset)))
+    if code == EXT_TIMEDELTA:
+        return timedelta(microseconds=_INT64.unpack(data)[0])
+    if code == EXT_PATH:
+        return PurePosixPath(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+@lru_cache(maxsize=None)
+def _encoded_fields(model: Type[BaseModel]) -> Tuple[Tuple[int, str, bool], ...]:
+    """Field IDs and names of a model. Fields defaulting to None are omitted while they are None."""
+    return tuple(
+        (field_id, name, field.default is None and field.default_factory is None)
+        for field_id, (name, field) in enumerate(model.model_fields.items())
+    )
+
+
+@lru_cache(maxsize=None)
+def _model_decoder(model: Type[BaseModel]) -> _Decoder:
+    fields: List[Tuple[str, Optional[_Decoder]]] = [
+        (name, _decoder(field.annotation)) for name, field in model.model_fields.items()
+    ]
+
+    def decode(values: Any) -> Any:
+        if not isinstance(values, dict):
+            # Left to the model validation to report.
+            return values
+        result = {}
+        for field_id, value in values.items():
+            if not isinstance(field_id, int) or not 0 <= field_id < len(fields):
+                raise ValueError(f"Unknown field ID {field_id!r} of {model.__name__}")
+            name, decoder = fields[field_id]
+            result[name] = value if decoder is None or value is None else decoder(value)
+        return result
+
+    return decode
+
+
+def _decoder(annotation: Any) -> Optional[_Decoder]:
+    """Get the cached function renaming the field IDs of the models inside values of the given type."""
+    if annotation in _DECODERS:
+        return _DECODERS[annotation]
+    decoder = _DECODERS[annotation] = _create_decoder(annotation)
+    return decoder
+
+
+def _create_decoder(annotation: Any) -> Optional[_Decoder]:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _decoder(get_args(annotation)[0])
+    if origin in (Union, UnionType):
+        # EDPs have no unions of multiple models, so values of unions need at most a single decoder.
+        decoders = [_decoder(arg) for arg in get_args(annotation) if arg is not NoneType]
+        return next((decoder for decoder in decoders if decoder is not None), None)
+    if origin in (list, set, frozenset, tuple):
+        args = get_args(annotation)
+        item_decoder = _decoder(args[0]) if args else None
+        if item_decoder is None:
+            return None
+        return lambda values: [item_decoder(value) for value in values]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_decoder(annotation)
+    return None
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import math
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Iterable, Iterator, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from extended_dataset_profile.models.base.cache import derived_cache
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True, allow_nan=False)
+_MAX_EXACT_FLOAT = 2**53
+
+
+def canonical_json(model: BaseModel) -> bytes:
+    """
+    Serialize a model to canonical JSON, which is identical for all equal models.
+
+    Keys are sorted and there is no whitespace. Sets are sorted, floats without fraction are written as integers
+    and datetimes with timezone are converted to UTC. Non finite floats are written as null.
+    """
+    return encode_canonical(canonical_value(model))
+
+
+def canonical_value(model: BaseModel) -> Any:
+    """The canonical JSON compatible python representation of a model, see `canonical_json`."""
+    return canonicalize(model.model_dump(mode="python", by_alias=True))
+
+
+def content_hash(model: BaseModel) -> str:
+    """
+    SHA-256 hex digest of the canonical JSON of a model.
+
+    The hash is cached for the model instance. Call `clear_derived_cache` after modifying the model in place.
+    """
+    cache = derived_cache(model)
+    digest = cache.get("content_hash")
+    if digest is None:
+        hasher = hashlib.sha256()
+        for chunk in _ENCODER.iterencode(canonical_value(model)):
+            hasher.update(chunk.encode())
+        digest = cache["content_hash"] = hasher.hexdigest()
+    return digest
+
+
+def unique_by_content(models: Iterable[ModelT]) -> Iterator[ModelT]:
+    """Lazily yield the models, skipping every model with the same content as an earlier one."""
+    seen = set()
+    for model in models:
+        digest = content_hash(model)
+        if digest not in seen:
+            seen.add(digest)
+            yield model
+
+
+def encode_canonical(value: Any) -> bytes:
+    """Encode a value returned by `canonicalize` as canonical JSON."""
+    return _ENCODER.encode(value).encode()
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    The canonical JSON compatible representation of a python value, like a field value of a model.
+
+    Sets become sorted lists, floats without fraction integers, datetimes with timezone UTC strings and enums their
+    values. Models are dumped by their aliases.
+    """
+    if isinstance(value, dict):
+        return {str(key): canonicalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonicalize(item) for item in value), key=_sort_key)
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        return _canonical_float(value)
+    if isinstance(value, Enum):
+        return canonicalize(value.value)
+    if isinstance(value, (int, str)):
+        return value
+    if isinstance(value, datetime):
+        return _canonical_datetime(value)
+    if isinstance(value, BaseModel):
+        return canonicalize(value.model_dump(mode="python", by_alias=True))
+    return to_jsonable_python(value, fallback=str)
+
+
+def _canonical_float(value: float) -> Any:
+    if not math.isfinite(value):
+        return None
+    if value.is_integer() and abs(value) <= _MAX_EXACT_FLOAT:
+        return int(value)
+    return value
+
+
+def _canonical_datetime(value: datetime) -> str:
+    if value.utcoffset() is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        suffix = "Z"
+    else:
+        suffix = ""
+    return value.isoformat(timespec="microseconds" if value.microsecond else "seconds") + suffix
+
+
+def _sort_key(value: Any) -> str:
+    return _ENCODER.encode(value)
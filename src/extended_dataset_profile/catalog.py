@@ -0,0 +1,329 @@
+"""
+Embedded SQLite catalog of EDPs.
+
+The searchable parts of every EDP are stored in normalized tables (assets, asset references, datasets and columns)
+with secondary indexes, next to the serialized EDP. Queries only touch the indexed tables and return entries that
+load and validate their EDP on first access.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+from extended_dataset_profile.tree import DATASET_FIELDS
+
+EdpT = TypeVar("EdpT", bound=ExtendedDatasetProfileBase)
+
+COLUMN_FIELDS = ("numericColumns", "datetimeColumns", "stringColumns")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    asset_hash TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    volume INTEGER NOT NULL,
+    temporal_earliest TEXT,
+    temporal_latest TEXT
+);
+CREATE TABLE IF NOT EXISTS documents (
+    asset INTEGER PRIMARY KEY REFERENCES assets (id) ON DELETE CASCADE,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS asset_data_types (
+    data_type TEXT NOT NULL,
+    asset INTEGER NOT NULL REFERENCES assets (id) ON DELETE CASCADE,
+    PRIMARY KEY (data_type, asset)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS asset_refs (
+    asset INTEGER NOT NULL REFERENCES assets (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    asset_id TEXT NOT NULL,
+    data_space_name TEXT NOT NULL,
+    publisher_name TEXT NOT NULL,
+    publish_date TEXT NOT NULL,
+    PRIMARY KEY (asset, position)
+);
+CREATE TABLE IF NOT EXISTS datasets (
+    id INTEGER PRIMARY KEY,
+    asset INTEGER NOT NULL REFERENCES assets (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    row_count INTEGER,
+    width INTEGER,
+    height INTEGER
+);
+CREATE TABLE IF NOT EXISTS columns (
+    dataset INTEGER NOT NULL REFERENCES datasets (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_temporal_cover ON assets (temporal_earliest, temporal_latest);
+CREATE INDEX IF NOT EXISTS asset_data_types_asset ON asset_data_types (asset);
+CREATE INDEX IF NOT EXISTS asset_refs_data_space ON asset_refs (data_space_name, asset);
+CREATE INDEX IF NOT EXISTS asset_refs_publish_date ON asset_refs (publish_date, asset);
+CREATE INDEX IF NOT EXISTS datasets_asset ON datasets (asset);
+CREATE INDEX IF NOT EXISTS datasets_kind ON datasets (kind, width, height);
+CREATE INDEX IF NOT EXISTS columns_name ON columns (name, dataset);
+CREATE INDEX IF NOT EXISTS columns_dataset ON columns (dataset);
+"""
+
+
+class CatalogEntry(Generic[EdpT]):
+    """A query result. The indexed fields are available directly, the EDP is only loaded when accessed."""
+
+    __slots__ = ("_catalog", "_row_id", "asset_hash", "name", "volume", "_edp")
+
+    def __init__(self, catalog: "EdpCatalog[EdpT]", row_id: int, asset_hash: str, name: str, volume: int):
+        self._catalog = catalog
+        self._row_id = row_id
+        self.asset_hash = asset_hash
+        self.name = name
+        self.volume = volume
+        self._edp: Optional[EdpT] = None
+
+    @property
+    def edp(self) -> EdpT:
+        if self._edp is None:
+            self._edp = self._catalog._load(self._row_id)
+        return self._edp
+
+    def __repr__(self) -> str:
+        return f"CatalogEntry(asset_hash={self.asset_hash!r}, name={self.name!r})"
+
+
+class CatalogQuery(Generic[EdpT]):
+    """
+    Filters on the indexed fields of the catalog. Every filter returns a new query, all filters must match.
+    """
+
+    def __init__(self, catalog: "EdpCatalog[EdpT]", conditions: Tuple[str, ...] = (), parameters: Tuple[Any, ...] = ()):
+        self._catalog = catalog
+        self._conditions = conditions
+        self._parameters = parameters
+
+    def with_data_type(self, data_type: Union[str, Enum]) -> "CatalogQuery[EdpT]":
+        """Assets containing datasets of the type (see `DataSetType`)."""
+        return self._where(
+            "EXISTS (SELECT 1 FROM asset_data_types t WHERE t.data_type = ? AND t.asset = a.id)", _value(data_type)
+        )
+
+    def in_data_space(self, name: str) -> "CatalogQuery[EdpT]":
+        """Assets with a reference to the data space of that name."""
+        return self._where("EXISTS (SELECT 1 FROM asset_refs r WHERE r.data_space_name = ? AND r.asset = a.id)", name)
+
+    def published_between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> "CatalogQuery[EdpT]":
+        """Assets with a reference published in the closed range. Either bound may be omitted."""
+        conditions = []
+        parameters = []
+        if start is not None:
+            conditions.append("r.publish_date >= ?")
+            parameters.append(_timestamp(start))
+        if end is not None:
+            conditions.append("r.publish_date <= ?")
+            parameters.append(_timestamp(end))
+        return self._where(
+            f"EXISTS (SELECT 1 FROM asset_refs r WHERE {' AND '.join((*conditions, 'r.asset = a.id'))})",  # noqa: S608
+            *parameters,
+        )
+
+    def covering(self, start: datetime, end: Optional[datetime] = None) -> "CatalogQuery[EdpT]":
+        """Assets whose temporal cover overlaps the range, or contains the point in time without an end."""
+        return self._where(
+            "a.temporal_earliest <= ? AND a.temporal_latest >= ?",
+            _timestamp(end if end is not None else start),
+            _timestamp(start),
+        )
+
+    def with_image_larger_than(self, width: int, height: int) -> "CatalogQuery[EdpT]":
+        """Assets with an image dataset of at least the resolution, e.g. `3840, 2160` for 4K."""
+        return self._with_dataset_larger_than("imageDatasets", width, height)
+
+    def with_video_larger_than(self, width: int, height: int) -> "CatalogQuery[EdpT]":
+        """Assets with a video dataset of at least the resolution."""
+        return self._with_dataset_larger_than("videoDatasets", width, height)
+
+    def with_min_rows(self, row_count: int) -> "CatalogQuery[EdpT]":
+        """Assets with a structured dataset of at least that many rows."""
+        return self._where(
+            "EXISTS (SELECT 1 FROM datasets d WHERE d.kind = 'structuredDatasets' AND d.row_count >= ?"
+            " AND d.asset = a.id)",
+            row_count,
+        )
+
+    def with_column(self, name: str) -> "CatalogQuery[EdpT]":
+        """Assets with a structured dataset containing a column of that name."""
+        return self._where(
+            "EXISTS (SELECT 1 FROM columns c JOIN datasets d ON d.id = c.dataset WHERE c.name = ? AND d.asset = a.id)",
+            name,
+        )
+
+    def count(self) -> int:
+        (count,) = self._catalog._connection.execute(
+            f"SELECT count(*) FROM assets a{self._where_clause()}",  # noqa: S608
+            self._parameters,
+        ).fetchone()
+        return int(count)
+
+    def all(self) -> List[CatalogEntry[EdpT]]:
+        return list(self)
+
+    def first(self) -> Optional[CatalogEntry[EdpT]]:
+        return next(iter(self._select(" LIMIT 1")), None)
+
+    def __iter__(self) -> Iterator[CatalogEntry[EdpT]]:
+        return iter(self._select(""))
+
+    def _select(self, suffix: str) -> List[CatalogEntry[EdpT]]:
+        rows = self._catalog._connection.execute(
+            f"SELECT a.id, a.asset_hash, a.name, a.volume FROM assets a{self._where_clause()} ORDER BY a.id{suffix}",  # noqa: S608
+            self._parameters,
+        ).fetchall()
+        return [CatalogEntry(self._catalog, *row) for row in rows]
+
+    def _where(self, condition: str, *parameters: Any) -> "CatalogQuery[EdpT]":
+        # The conditions are constants of this module, all values are passed as parameters.
+        return CatalogQuery(self._catalog, (*self._conditions, condition), (*self._parameters, *parameters))
+
+    def _where_clause(self) -> str:
+        if not self._conditions:
+            return ""
+        return " WHERE " + " AND ".join(f"({condition})" for condition in self._conditions)
+
+    def _with_dataset_larger_than(self, kind: str, width: int, height: int) -> "CatalogQuery[EdpT]":
+        return self._where(
+            "EXISTS (SELECT 1 FROM datasets d WHERE d.kind = ? AND d.width >= ? AND d.height >= ? AND d.asset = a.id)",
+            kind,
+            width,
+            height,
+        )
+
+
+class EdpCatalog(Generic[EdpT]):
+    """
+    SQLite catalog of EDPs of one schema, identified by their `assetSha256Hash`.
+
+    Adding an EDP with a hash that is already in the catalog replaces it. Use the catalog as context manager to
+    close the database afterwards.
+    """
+
+    def __init__(self, path: Union[Path, str], schema: Type[EdpT]):
+        self.schema = schema
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def add(self, edp: EdpT) -> None:
+        self.add_all((edp,))
+
+    def add_all(self, edps: Iterable[EdpT]) -> int:
+        """Add the EDPs in a single transaction and return their count."""
+        count = 0
+        with self._connection:
+            for edp in edps:
+                self._insert(edp)
+                count += 1
+        return count
+
+    def remove(self, asset_hash: str) -> bool:
+        """Remove the EDP with the asset hash. Returns False if there was no such EDP."""
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM assets WHERE asset_hash = ?", (asset_hash,))
+        return cursor.rowcount > 0
+
+    def get(self, asset_hash: str) -> Optional[EdpT]:
+        row = self._connection.execute("SELECT id FROM assets WHERE asset_hash = ?", (asset_hash,)).fetchone()
+        return self._load(row[0]) if row is not None else None
+
+    def query(self) -> CatalogQuery[EdpT]:
+        return CatalogQuery(self)
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT count(*) FROM assets").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "EdpCatalog[EdpT]":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load(self, row_id: int) -> EdpT:
+        row = self._connection.execute("SELECT data FROM documents WHERE asset = ?", (row_id,)).fetchone()
+        if row is None:
+            raise KeyError("The EDP was removed from the catalog")
+        return self.schema.model_validate_json(row[0])
+
+    def _insert(self, edp: Any) -> None:
+        connection = self._connection
+        connection.execute("DELETE FROM assets WHERE asset_hash = ?", (edp.assetSha256Hash,))
+        cover = edp.temporalCover
+        cursor = connection.execute(
+            "INSERT INTO assets (asset_hash, name, volume, temporal_earliest, temporal_latest) VALUES (?, ?, ?, ?, ?)",
+            (
+                edp.assetSha256Hash,
+                edp.name,
+                edp.volume,
+                _timestamp(cover.earliest) if cover is not None else None,
+                _timestamp(cover.latest) if cover is not None else None,
+            ),
+        )
+        asset = cursor.lastrowid
+        connection.execute(
+            "INSERT INTO documents (asset, data) VALUES (?, ?)",
+            (asset, edp.__pydantic_serializer__.to_json(edp, by_alias=True)),
+        )
+        connection.executemany(
+            "INSERT INTO asset_data_types (data_type, asset) VALUES (?, ?)",
+            [(_value(data_type), asset) for data_type in edp.dataTypes],
+        )
+        connection.executemany(
+            "INSERT INTO asset_refs (asset, position, asset_id, data_space_name, publisher_name, publish_date)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (asset, position, ref.assetId, ref.dataSpace.name, ref.publisher.name, _timestamp(ref.publishDate))
+                for position, ref in enumerate(edp.assetRefs)
+            ],
+        )
+        # The names of the dataset lists are stored as the kind of a dataset.
+        for kind in DATASET_FIELDS:
+            for position, dataset in enumerate(getattr(edp, kind)):
+                width, height = _resolution(dataset)
+                cursor = connection.execute(
+                    "INSERT INTO datasets (asset, kind, position, row_count, width, height) VALUES (?, ?, ?, ?, ?, ?)",
+                    (asset, kind, position, getattr(dataset, "rowCount", None), width, height),
+                )
+                if kind == "structuredDatasets":
+                    connection.executemany(
+                        "INSERT INTO columns (dataset, kind, name) VALUES (?, ?, ?)",
+                        [
+                            (cursor.lastrowid, column_kind, column.name)
+                            for column_kind in COLUMN_FIELDS
+                            for column in getattr(dataset, column_kind)
+                        ],
+                    )
+
+
+def _resolution(dataset: Any) -> Sequence[Optional[int]]:
+    resolution = getattr(dataset, "resolution", None)
+    if resolution is None:
+        return None, None
+    return resolution.width, resolution.height
+
+
+def _timestamp(value: datetime) -> str:
+    """Fixed width ISO format in UTC, so timestamps can be compared as strings. Naive datetimes are taken as UTC."""
+    if value.utcoffset() is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="microseconds")
+
+
+def _value(value: Union[str, Enum]) -> str:
+    return value.value if isinstance(value, Enum) else value
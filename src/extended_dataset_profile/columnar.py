@@ -0,0 +1,309 @@
+"""
+Export of the column statistics of structured datasets to columnar Arrow IPC or Parquet files.
+
+Every exported table has one row per column of a structured dataset. The rows are keyed by the asset hash and the
+reference of their dataset, followed by the flattened statistics of the column model. Nested models are flattened
+with dotted names (e.g. "temporalCover.earliest"), lists of models are left out. Numeric statistics are stored as
+float64, with timedeltas converted to seconds.
+
+Requires the optional "arrow" dependencies (`pyarrow`).
+"""
+
+from datetime import datetime, timedelta
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path, PurePosixPath
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AnyUrl, BaseModel
+
+from extended_dataset_profile.annotations import strip_optional
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+
+try:
+    import pyarrow  # type: ignore[import-untyped]
+    import pyarrow.ipc  # type: ignore[import-untyped]
+    import pyarrow.parquet  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+ColumnarFormat = Literal["arrow", "parquet"]
+
+NUMERIC_COLUMNS = "numeric_columns"
+DATETIME_COLUMNS = "datetime_columns"
+STRING_COLUMNS = "string_columns"
+
+KEY_COLUMNS = ("assetSha256Hash", "dataset", "datasetName")
+"""Columns identifying the asset and dataset of every row."""
+
+_COLUMN_FIELDS = {
+    NUMERIC_COLUMNS: "numericColumns",
+    DATETIME_COLUMNS: "datetimeColumns",
+    STRING_COLUMNS: "stringColumns",
+}
+_FILE_EXTENSIONS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+_Getter = Callable[[Any], Any]
+
+
+class ColumnStatisticsWriter:
+    """
+    Streams the column statistics of EDPs into one file per column type.
+
+    The rows are buffered column by column and written as a record batch whenever `batch_size` rows of a table are
+    collected, so the memory usage does not depend on the number of EDPs.
+    """
+
+    def __init__(self, output_dir: Path, format: ColumnarFormat = "parquet", batch_size: int = 65536):
+        if format not in _FILE_EXTENSIONS:
+            raise ValueError(f'Unknown format "{format}", expected one of: {", ".join(_FILE_EXTENSIONS)}')
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        _pyarrow()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.format = format
+        self.batch_size = batch_size
+        self.paths = {table: output_dir / f"{table}{_FILE_EXTENSIONS[format]}" for table in _COLUMN_FIELDS}
+        # The tables get the fields of the column models of the first EDP.
+        self._buffers: Optional[Dict[str, _TableBuffer]] = None
+        self._writers: Dict[str, Any] = {}
+
+    def add(self, edp: ExtendedDatasetProfileBase) -> None:
+        if self._buffers is None:
+            self._buffers = _create_buffers(type(edp))
+        _add_rows(self._buffers, edp)
+        for table, buffer in self._buffers.items():
+            if buffer.rows >= self.batch_size:
+                self._write(table, buffer)
+
+    def close(self) -> Dict[str, Path]:
+        """Write the remaining rows and close all files. Returns the path of every table."""
+        if self._buffers is None:
+            self._buffers = _create_buffers(_current_schema())
+        for table, buffer in self._buffers.items():
+            self._write(table, buffer)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        return self.paths
+
+    def __enter__(self) -> "ColumnStatisticsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        for writer in self._writers.values():
+            writer.close()
+
+    def _write(self, table: str, buffer: "_TableBuffer") -> None:
+        writer = self._writers.get(table)
+        if writer is None:
+            writer = self._writers[table] = self._open(self.paths[table], buffer.schema.arrow)
+        if buffer.rows:
+            writer.write_batch(buffer.flush())
+
+    def _open(self, path: Path, schema: Any) -> Any:
+        if self.format == "parquet":
+            return pyarrow.parquet.ParquetWriter(path, schema)
+        return pyarrow.ipc.new_file(path, schema)
+
+
+def write_column_statistics(
+    edps: Iterable[ExtendedDatasetProfileBase], output_dir: Path, format: ColumnarFormat = "parquet", **options
+) -> Dict[str, Path]:
+    """Write the column statistics of all EDPs to `output_dir`, see `ColumnStatisticsWriter`."""
+    with ColumnStatisticsWriter(output_dir, format, **options) as writer:
+        for edp in edps:
+            writer.add(edp)
+    return writer.paths
+
+
+def column_statistics_tables(edps: Iterable[ExtendedDatasetProfileBase]) -> Dict[str, Any]:
+    """Collect the column statistics of all EDPs into in-memory Arrow tables."""
+    _pyarrow()
+    buffers: Optional[Dict[str, _TableBuffer]] = None
+    for edp in edps:
+        if buffers is None:
+            buffers = _create_buffers(type(edp))
+        _add_rows(buffers, edp)
+    if buffers is None:
+        buffers = _create_buffers(_current_schema())
+    return {table: pyarrow.Table.from_batches([buffer.flush()]) for table, buffer in buffers.items()}
+
+
+class _TableSchema(NamedTuple):
+    arrow: Any
+    getters: Tuple[_Getter, ...]
+
+
+class _TableBuffer:
+    """Rows of a table that are not written yet, stored as one list per column."""
+
+    def __init__(self, schema: _TableSchema):
+        self.schema = schema
+        self._reset()
+
+    def _reset(self) -> None:
+        self.rows = 0
+        self._keys: List[List[Any]] = [[] for _ in KEY_COLUMNS]
+        self._values: List[List[Any]] = [[] for _ in self.schema.getters]
+
+    def extend(self, keys: Sequence[Any], columns: Sequence[BaseModel]) -> None:
+        if not columns:
+            return
+        for values, key in zip(self._keys, keys):
+            values.extend([key] * len(columns))
+        for values, getter in zip(self._values, self.schema.getters):
+            values.extend(map(getter, columns))
+        self.rows += len(columns)
+
+    def flush(self) -> Any:
+        arrays = [
+            pyarrow.array(values, type=field.type)
+            for values, field in zip(self._keys + self._values, self.schema.arrow)
+        ]
+        self._reset()
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema.arrow)
+
+
+def _current_schema() -> Type[BaseModel]:
+    from extended_dataset_profile import CURRENT_SCHEMA
+
+    return CURRENT_SCHEMA
+
+
+def _create_buffers(edp_type: Type[BaseModel]) -> Dict[str, _TableBuffer]:
+    return {table: _TableBuffer(schema) for table, schema in _table_schemas(edp_type).items()}
+
+
+@lru_cache(maxsize=None)
+def _table_schemas(edp_type: Type[BaseModel]) -> Mapping[str, _TableSchema]:
+    """The schema of every table, built from the column models of the structured datasets of the EDP model."""
+    dataset_type = _item_type(edp_type.model_fields["structuredDatasets"].annotation)
+    return {
+        table: _table_schema(_item_type(dataset_type.model_fields[field].annotation))
+        for table, field in _COLUMN_FIELDS.items()
+    }
+
+
+def _add_rows(buffers: Dict[str, _TableBuffer], edp: Any) -> None:
+    edp_type: Type[BaseModel] = type(edp)
+    schemas = _table_schemas(edp_type)
+    for table, buffer in buffers.items():
+        if buffer.schema is not schemas[table] and buffer.schema.arrow != schemas[table].arrow:
+            raise ValueError(
+                f"The {table} of {edp_type.__module__}.{edp_type.__qualname__} have other fields than the EDPs "
+                "added before, write them to a separate output."
+            )
+    dataset_names = {node.dataset.reference: node.name for node in edp.datasetTree}
+    for index, dataset in enumerate(edp.structuredDatasets):
+        reference = f"#/structuredDatasets/{index}"
+        keys = (edp.assetSha256Hash, reference, dataset_names.get(reference))
+        for table, field in _COLUMN_FIELDS.items():
+            buffers[table].extend(keys, getattr(dataset, field))
+
+
+@lru_cache(maxsize=None)
+def _table_schema(model: Type[BaseModel]) -> _TableSchema:
+    fields = [pyarrow.field(key, pyarrow.string(), nullable=key == "datasetName") for key in KEY_COLUMNS]
+    getters = []
+    for name, arrow_type, getter in _flatten(model):
+        fields.append(pyarrow.field(name, arrow_type))
+        getters.append(getter)
+    return _TableSchema(pyarrow.schema(fields), tuple(getters))
+
+
+def _flatten(model: Type[BaseModel]) -> Iterator[Tuple[str, Any, _Getter]]:
+    for name, field in model.model_fields.items():
+        annotation = strip_optional(field.annotation)
+        get = attrgetter(name)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            for sub_name, arrow_type, sub_getter in _flatten(annotation):
+                yield f"{name}.{sub_name}", arrow_type, _nested_getter(get, sub_getter)
+            continue
+        column = _arrow_column(annotation)
+        if column is not None:
+            arrow_type, convert = column
+            yield name, arrow_type, get if convert is None else _converting_getter(get, convert)
+
+
+def _nested_getter(get: _Getter, sub_getter: _Getter) -> _Getter:
+    def getter(value: Any) -> Any:
+        child = get(value)
+        return None if child is None else sub_getter(child)
+
+    return getter
+
+
+def _converting_getter(get: _Getter, convert: _Getter) -> _Getter:
+    def getter(value: Any) -> Any:
+        child = get(value)
+        return None if child is None else convert(child)
+
+    return getter
+
+
+def _arrow_column(annotation: Any) -> Optional[Tuple[Any, Optional[_Getter]]]:
+    """Arrow type of a field together with the conversion of its values, or None for unsupported fields."""
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        # Numeric statistics, like min or mean.
+        return pyarrow.float64(), _float
+    if origin in (list, set, frozenset):
+        item = _arrow_column(strip_optional(get_args(annotation)[0]))
+        if item is None:
+            return None
+        item_type, convert = item
+        return pyarrow.list_(item_type), None if convert is None else lambda values: [convert(v) for v in values]
+    if not isinstance(annotation, type):
+        return None
+    if annotation is bool:
+        return pyarrow.bool_(), None
+    if annotation is int:
+        return pyarrow.int64(), None
+    if annotation is float:
+        return pyarrow.float64(), None
+    if annotation is datetime:
+        return pyarrow.timestamp("us"), None
+    if issubclass(annotation, Enum):
+        return pyarrow.string(), attrgetter("value")
+    if issubclass(annotation, (str, PurePosixPath, AnyUrl)):
+        return pyarrow.string(), None if annotation is str else str
+    return None
+
+
+def _float(value: Any) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+def _item_type(annotation: Any) -> Any:
+    return get_args(annotation)[0]
+
+
+def _pyarrow():
+    if pyarrow is None:
+        raise ImportError('The columnar export requires pyarrow, install the "arrow" extra.')
+    return pyarrow
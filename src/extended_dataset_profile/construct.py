@@ -0,0 +1,154 @@
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from pathlib import PurePosixPath
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AliasChoices, AnyUrl, BaseModel
+from pydantic.fields import FieldInfo
+
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+from extended_dataset_profile.types.version import Version
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_Converter = Callable[[Any], Any]
+
+_CONVERTERS: Dict[Any, _Converter] = {}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def construct_trusted(model: Type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    """
+    Build a model from trusted data without validating it.
+
+    Unlike `model_construct`, nested dictionaries are turned into their submodels (e.g. `StructuredDataSet` or
+    `DatasetTreeNode`). Enums, paths, URLs, versions and ISO formatted datetimes get converted to their types,
+    all other values are used as they are. Only use this for data that is known to be valid, like EDPs created
+    by your own code. Missing schema versions are set to the version of the model.
+    """
+    return cast(ModelT, _model_converter(model)(data))
+
+
+class TrustedConstructor(Generic[ModelT]):
+    """
+    Builds models from trusted data, but fully validates every n-th document to still catch corrupted data.
+    """
+
+    def __init__(self, model: Type[ModelT], validate_every: Optional[int] = None):
+        if validate_every is not None and validate_every < 1:
+            raise ValueError("validate_every must be at least 1")
+        self.model = model
+        self.validate_every = validate_every
+        self.count = 0
+
+    def __call__(self, data: Mapping[str, Any]) -> ModelT:
+        self.count += 1
+        if self.validate_every is not None and self.count % self.validate_every == 0:
+            return self.model.model_validate(data)
+        return construct_trusted(self.model, data)
+
+
+def _field_keys(name: str, field: FieldInfo) -> Tuple[str, ...]:
+    keys = [name]
+    if field.alias is not None:
+        keys.append(field.alias)
+    if isinstance(field.validation_alias, str):
+        keys.append(field.validation_alias)
+    elif isinstance(field.validation_alias, AliasChoices):
+        keys.extend(choice for choice in field.validation_alias.choices if isinstance(choice, str))
+    return tuple(dict.fromkeys(keys))
+
+
+@lru_cache(maxsize=None)
+def _model_converter(model: Type[BaseModel]) -> _Converter:
+    fields: List[Tuple[str, Tuple[str, ...], _Converter]] = []
+    for name, field in model.model_fields.items():
+        fields.append((name, _field_keys(name, field), _converter(field.annotation)))
+    default_version = model._get_version() if issubclass(model, ExtendedDatasetProfileBase) else None
+
+    def convert(data: Any) -> BaseModel:
+        if isinstance(data, model):
+            return data
+        values = {}
+        for name, keys, converter in fields:
+            for key in keys:
+                if key in data:
+                    values[name] = converter(data[key])
+                    break
+        if default_version is not None and "schemaVersion" not in values:
+            values["schemaVersion"] = default_version
+        return model.model_construct(**values)
+
+    return convert
+
+
+def _converter(annotation: Any) -> _Converter:
+    """Get the cached function converting trusted data to the given type."""
+    converter = _CONVERTERS.get(annotation)
+    if converter is None:
+        converter = _CONVERTERS[annotation] = _create_converter(annotation)
+    return converter
+
+
+def _create_converter(annotation: Any) -> _Converter:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _converter(get_args(annotation)[0])
+    if origin in (Union, UnionType):
+        return _union_converter(get_args(annotation))
+    if origin in (list, set, frozenset, tuple):
+        args = get_args(annotation)
+        item_converter = _converter(args[0]) if args else _identity
+        container: Callable[[Any], Any] = origin
+        if item_converter is _identity:
+            return container
+        return lambda values: container(item_converter(value) for value in values)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model_converter(annotation)
+        if issubclass(annotation, (Enum, PurePosixPath, AnyUrl, Version)):
+            return _type_converter(annotation, annotation)
+        if annotation is datetime:
+            return _type_converter(datetime, datetime.fromisoformat)
+    return _identity
+
+
+def _type_converter(annotation: type, factory: Callable[[Any], Any]) -> _Converter:
+    def convert(value: Any) -> Any:
+        return value if isinstance(value, annotation) else factory(value)
+
+    return convert
+
+
+def _union_converter(args: Tuple[Any, ...]) -> _Converter:
+    types = [arg for arg in args if arg is not NoneType]
+    if len(types) != 1:
+        # Unions of multiple types (like numerics) can not be dispatched without validation.
+        return _identity
+    converter = _converter(types[0])
+
+    def convert(value: Any) -> Any:
+        return None if value is None else converter(value)
+
+    return convert
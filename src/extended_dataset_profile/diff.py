@@ -0,0 +1,134 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from extended_dataset_profile.annotations import json_keys
+
+PatchOperation = Dict[str, Any]
+"""A single JSON Patch (RFC 6902) operation, like `{"op": "replace", "path": "/name", "value": "new name"}`."""
+
+DEFAULT_NATURAL_KEYS: Mapping[str, str] = {
+    "AssetReference": "assetId",
+    "DatasetTreeNode": "name",
+    "NumericColumn": "name",
+    "DateTimeColumn": "name",
+    "StringColumn": "name",
+}
+"""Fields identifying the items of lists of a model, by the name of the model class."""
+
+
+def diff_edps(
+    old: BaseModel, new: BaseModel, natural_keys: Mapping[str, str] = DEFAULT_NATURAL_KEYS
+) -> List[PatchOperation]:
+    """
+    Compute the JSON Patch operations transforming the serialized `old` EDP into the serialized `new` one.
+
+    Models are compared field by field. Items of lists of models with a natural key (see `DEFAULT_NATURAL_KEYS`)
+    are matched by that key, so reordered, inserted or removed items only result in move, add and remove operations
+    plus the changes within the matched items. Other lists are compared by position and sets are replaced as a
+    whole. The paths use the serialized (alias) keys and the operations are meant to be applied in order.
+    """
+    operations: List[PatchOperation] = []
+    _diff_model(old, new, "", operations, natural_keys)
+    return operations
+
+
+def _diff_value(old: Any, new: Any, path: str, operations: List[PatchOperation], natural_keys: Mapping[str, str]):
+    if old is new:
+        return
+    if isinstance(old, BaseModel) and type(old) is type(new):
+        _diff_model(old, new, path, operations, natural_keys)
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, operations, natural_keys)
+    elif old != new or type(old) is not type(new):
+        operations.append({"op": "replace", "path": path, "value": _json(new)})
+
+
+def _diff_model(
+    old: BaseModel, new: BaseModel, path: str, operations: List[PatchOperation], natural_keys: Mapping[str, str]
+):
+    old_values = old.__dict__
+    new_values = new.__dict__
+    for name, key in json_keys(type(old)):
+        _diff_value(old_values[name], new_values[name], f"{path}/{key}", operations, natural_keys)
+
+
+def _diff_list(
+    old: List[Any], new: List[Any], path: str, operations: List[PatchOperation], natural_keys: Mapping[str, str]
+):
+    key_field = _natural_key(old, new, natural_keys)
+    if key_field is None:
+        _diff_positional(old, new, path, operations, natural_keys)
+    else:
+        _diff_keyed(old, new, key_field, path, operations, natural_keys)
+
+
+def _natural_key(old: Sequence[Any], new: Sequence[Any], natural_keys: Mapping[str, str]) -> Optional[str]:
+    """The key field of the items, if all items are models of the same type and their keys are unique."""
+    items = [*old, *new]
+    if not items or not isinstance(items[0], BaseModel):
+        return None
+    item_type = type(items[0])
+    key_field = natural_keys.get(item_type.__name__)
+    if key_field is None or any(type(item) is not item_type for item in items):
+        return None
+    for values in (old, new):
+        keys = {getattr(item, key_field) for item in values}
+        if len(keys) != len(values):
+            return None
+    return key_field
+
+
+def _diff_positional(
+    old: List[Any], new: List[Any], path: str, operations: List[PatchOperation], natural_keys: Mapping[str, str]
+):
+    common = min(len(old), len(new))
+    for index in range(common):
+        _diff_value(old[index], new[index], f"{path}/{index}", operations, natural_keys)
+    for index in range(len(old) - 1, common - 1, -1):
+        operations.append({"op": "remove", "path": f"{path}/{index}"})
+    for index in range(common, len(new)):
+        operations.append({"op": "add", "path": f"{path}/{index}", "value": _json(new[index])})
+
+
+def _diff_keyed(
+    old: List[Any],
+    new: List[Any],
+    key_field: str,
+    path: str,
+    operations: List[PatchOperation],
+    natural_keys: Mapping[str, str],
+):
+    old_items = {getattr(item, key_field): item for item in old}
+    new_keys = {getattr(item, key_field) for item in new}
+
+    # Removing from the back keeps the indices of the remaining removals valid.
+    current = []
+    for index in range(len(old) - 1, -1, -1):
+        key = getattr(old[index], key_field)
+        if key in new_keys:
+            current.append(key)
+        else:
+            operations.append({"op": "remove", "path": f"{path}/{index}"})
+    current.reverse()
+
+    # Build the new order from the front, so all items before the current index are already in place.
+    for index, item in enumerate(new):
+        key = getattr(item, key_field)
+        if key not in old_items:
+            operations.append({"op": "add", "path": f"{path}/{index}", "value": _json(item)})
+            current.insert(index, key)
+        elif current[index] != key:
+            source = current.index(key, index + 1)
+            operations.append({"op": "move", "from": f"{path}/{source}", "path": f"{path}/{index}"})
+            current.insert(index, current.pop(source))
+
+    for index, item in enumerate(new):
+        old_item = old_items.get(getattr(item, key_field))
+        if old_item is not None:
+            _diff_value(old_item, item, f"{path}/{index}", operations, natural_keys)
+
+
+def _json(value: Any) -> Any:
+    return to_jsonable_python(value, by_alias=True)
@@ -0,0 +1,259 @@
+import json
+from argparse import ArgumentParser
+from datetime import datetime
+from enum import Enum
+from pathlib import Path, PurePosixPath
+from types import UnionType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+from urllib.request import Request, urlopen
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel
+
+from extended_dataset_profile.annotations import strip_optional
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+from extended_dataset_profile.models.registry import SchemaVersions
+from extended_dataset_profile.types.version import Version
+
+Mapping = Dict[str, Any]
+
+_KEYWORD_TYPES = (str, PurePosixPath, AnyUrl, UUID, Version, Enum)
+_SCALAR_MAPPINGS: Dict[type, Mapping] = {
+    bool: {"type": "boolean"},
+    int: {"type": "long"},
+    float: {"type": "double"},
+}
+_DATE_MAPPING: Mapping = {"type": "date"}
+# Numerics may be integers, floats or timedeltas. The latter are serialized as ISO 8601 durations, which
+# elastic can not index as numbers, so only those values get ignored.
+_NUMERIC_MAPPING: Mapping = {"type": "double", "ignore_malformed": True}
+
+
+class ElasticMappingOptions(NamedTuple):
+    """
+    Fields of the mapping that deviate from the defaults, given as dotted paths of JSON keys.
+    """
+
+    text_fields: FrozenSet[str] = frozenset(
+        {"name", "description", "documentDatasets.title", "documentDatasets.subject", "documentDatasets.keywords"}
+    )
+    """String fields with full text search, all others are keywords. Text fields get an additional keyword."""
+    disabled_fields: FrozenSet[str] = frozenset(
+        {"unstructuredTextDatasets.wordCloud", "semiStructuredDatasets.jsonSchema"}
+    )
+    """Fields that are only stored in the source, but not indexed."""
+    object_fields: FrozenSet[str] = frozenset({"datasetTree"})
+    """
+    Lists of models that are indexed as plain objects instead of nested documents. Their entries can not be
+    queried independently, but they do not count towards the limit of nested documents (e.g. large trees).
+    """
+    dynamic: Literal["strict", "false", "true"] = "strict"
+
+
+DEFAULT_OPTIONS = ElasticMappingOptions()
+
+
+def get_elastic_mapping(
+    schema: Type[ExtendedDatasetProfileBase], options: ElasticMappingOptions = DEFAULT_OPTIONS
+) -> Mapping:
+    """
+    Elastic search index mapping of an EDP model.
+
+    The model gets walked like the static index check in the tests: Models become objects, lists of models nested
+    documents and all other types their closest elastic field type. Field names are the serialized JSON keys.
+    """
+    return {"dynamic": options.dynamic, "properties": _properties(schema, "", options)}
+
+
+def write_elastic_mapping(
+    schema: Type[ExtendedDatasetProfileBase], output: Path, options: ElasticMappingOptions = DEFAULT_OPTIONS
+) -> None:
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump({"mappings": get_elastic_mapping(schema, options)}, file, indent=2)
+
+
+def write_all_elastic_mappings(versions: SchemaVersions, output_dir: Path) -> Dict[int, Path]:
+    """Write one mapping file per registered major version into the output directory."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {major: output_dir / f"edp_mapping_v{major}.json" for major in versions}
+    for major, path in paths.items():
+        write_elastic_mapping(versions[major], path)
+    return paths
+
+
+def export_elastic_mapping(schema: Type[ExtendedDatasetProfileBase], versions: Optional[SchemaVersions] = None):
+    args = _get_args(all_versions_available=versions is not None)
+    output: Path = args.output
+    if versions is not None and args.all_versions:
+        write_all_elastic_mappings(versions, output)
+        return
+    if output.is_dir():
+        output /= "edp_mapping.json"
+    write_elastic_mapping(schema, output)
+
+
+def _get_args(all_versions_available: bool):
+    parser = ArgumentParser(description="Export the elastic search index mapping of extended dataset profiles")
+    parser.add_argument(
+        "-o", "--output", type=Path, required=True, help="Path of the mapping file or directory to write it to"
+    )
+    if all_versions_available:
+        parser.add_argument(
+            "--all-versions",
+            action="store_true",
+            help="Write one mapping per major version into the output directory",
+        )
+    return parser.parse_args()
+
+
+def _properties(model: Type[BaseModel], path: str, options: ElasticMappingOptions) -> Mapping:
+    properties = {}
+    for name, field in model.model_fields.items():
+        key = field.serialization_alias or field.alias or name
+        field_path = f"{path}.{key}" if path else key
+        if field.annotation is None:
+            raise TypeError(f'The field "{field_path}" is missing a type annotation!')
+        properties[key] = _field_mapping(field.annotation, field_path, options)
+    return properties
+
+
+def _field_mapping(annotation: Any, path: str, options: ElasticMappingOptions) -> Mapping:
+    annotation = strip_optional(annotation)
+    origin = get_origin(annotation)
+    is_list = origin in (list, set, frozenset)
+    if is_list:
+        annotation = strip_optional(get_args(annotation)[0])
+    is_model = isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+    if path in options.disabled_fields:
+        if is_model:
+            return {"type": "object", "enabled": False}
+        return {**_value_mapping(annotation, path, options), "index": False, "doc_values": False}
+    if is_model:
+        mapping: Mapping = {"properties": _properties(annotation, path, options)}
+        if is_list and path not in options.object_fields:
+            return {"type": "nested", **mapping}
+        return mapping
+    return _value_mapping(annotation, path, options)
+
+
+def _value_mapping(annotation: Any, path: str, options: ElasticMappingOptions) -> Mapping:
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return {"type": "keyword"}
+    if origin in (Union, UnionType):
+        # Numeric is the only union allowed in EDPs, see the static index check in the tests.
+        return dict(_NUMERIC_MAPPING)
+    if origin is not None:
+        raise TypeError(f'Can not map the field "{path}" of type "{annotation}" to elastic search.')
+    if annotation in _SCALAR_MAPPINGS:
+        return dict(_SCALAR_MAPPINGS[annotation])
+    if annotation is datetime:
+        return dict(_DATE_MAPPING)
+    if isinstance(annotation, type) and issubclass(annotation, _KEYWORD_TYPES):
+        if path in options.text_fields:
+            return {"type": "text", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}}
+        return {"type": "keyword"}
+    raise TypeError(f'Can not map the field "{path}" of type "{annotation}" to elastic search.')
+
+
+class BulkIndexError(ValueError):
+    """Raised when elastic search rejected some documents of a bulk request."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__(f"{len(errors)} documents could not be indexed, first error: {errors[0]}")
+        self.errors = errors
+
+
+class BulkBodyWriter:
+    """
+    Builds the NDJSON bodies of elastic search `_bulk` requests for EDPs.
+
+    Every document is written as an index action with the asset hash as `_id`, followed by the serialized EDP.
+    Batches are limited to `max_documents` documents and `max_bytes` bytes, only a single document exceeding
+    `max_bytes` gets its own batch. The serialized documents are appended to one buffer per call instead of building
+    a new string per line.
+    """
+
+    def __init__(self, index: Optional[str] = None, max_bytes: int = 5 * 1024 * 1024, max_documents: int = 1000):
+        if max_bytes < 1 or max_documents < 1:
+            raise ValueError("max_bytes and max_documents must be at least 1")
+        self.max_bytes = max_bytes
+        self.max_documents = max_documents
+        action = {"index": {"_index": index, "_id": ""}} if index is not None else {"index": {"_id": ""}}
+        # The action line only differs by the id, so it is encoded once and split around the id.
+        self._action_prefix, self._action_suffix = json.dumps(action, separators=(",", ":")).encode().split(b'""')
+        self._action_prefix += b'"'
+        self._action_suffix = b'"' + self._action_suffix + b"\n"
+
+    def batches(self, edps: Iterable[ExtendedDatasetProfileBase]) -> Iterator[bytes]:
+        """Lazily yield the request bodies for all EDPs."""
+        # Every call gets its own buffer, so batches of an abandoned call are never sent again.
+        buffer = bytearray()
+        count = 0
+        for edp in edps:
+            start = len(buffer)
+            buffer += self._action_prefix
+            buffer += _escape_id(edp.assetSha256Hash)  # type: ignore[attr-defined]
+            buffer += self._action_suffix
+            buffer += edp.__pydantic_serializer__.to_json(edp, by_alias=True)
+            buffer += b"\n"
+            if count and len(buffer) > self.max_bytes:
+                yield bytes(buffer[:start])
+                del buffer[:start]
+                count = 0
+            count += 1
+            if count >= self.max_documents or len(buffer) >= self.max_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+                count = 0
+        if buffer:
+            yield bytes(buffer)
+
+
+def index_edps(
+    url: str, edps: Iterable[ExtendedDatasetProfileBase], index: Optional[str] = None, timeout: float = 60, **limits
+) -> int:
+    """
+    Index the EDPs through the `_bulk` endpoint of the elastic search instance at `url`.
+
+    Returns the number of indexed documents and raises a `BulkIndexError` when any document got rejected.
+    The batch limits are passed to `BulkBodyWriter`.
+    """
+    if not url.startswith(("http://", "https://")):
+        raise ValueError(f'Expected a http(s) URL, got "{url}"')
+    count = 0
+    errors: List[Dict[str, Any]] = []
+    for body in BulkBodyWriter(index, **limits).batches(edps):
+        request = Request(  # noqa: S310
+            f"{url.rstrip('/')}/_bulk", data=body, headers={"Content-Type": "application/x-ndjson"}, method="POST"
+        )
+        with urlopen(request, timeout=timeout) as response:  # noqa: S310
+            result = json.load(response)
+        for item in result["items"]:
+            status = next(iter(item.values()))
+            if "error" in status:
+                errors.append(status)
+            else:
+                count += 1
+    if errors:
+        raise BulkIndexError(errors)
+    return count
+
+
+def _escape_id(document_id: str) -> bytes:
+    return json.dumps(document_id)[1:-1].encode()
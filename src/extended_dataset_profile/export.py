@@ -1,23 +1,61 @@
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
 
 from pydantic import TypeAdapter
+from pydantic.json_schema import JsonSchemaMode
 
 from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+from extended_dataset_profile.models.registry import SchemaVersions
 
+_SCHEMA_ADAPTER = TypeAdapter(Dict[str, Any])
 
-def export_schema(schema: Type[ExtendedDatasetProfileBase]):
-    args = _get_args()
+
+@lru_cache(maxsize=32)
+def get_json_schema(
+    schema: Type[ExtendedDatasetProfileBase], by_alias: bool = True, mode: JsonSchemaMode = "validation"
+) -> bytes:
+    """
+    Serialized JSON schema of an EDP model.
+
+    Generating the schema is expensive, so the result is cached per model and options.
+    """
+    return _SCHEMA_ADAPTER.dump_json(schema.model_json_schema(by_alias=by_alias, mode=mode))
+
+
+def write_json_schema(schema: Type[ExtendedDatasetProfileBase], output: Path) -> None:
+    with open(output, "wb") as file:
+        file.write(get_json_schema(schema))
+
+
+def write_all_json_schemas(versions: SchemaVersions, output_dir: Path) -> Dict[int, Path]:
+    """Write one schema file per registered major version into the output directory."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {major: output_dir / f"edp_schema_v{major}.json" for major in versions}
+    for major, path in paths.items():
+        write_json_schema(versions[major], path)
+    return paths
+
+
+def export_schema(schema: Type[ExtendedDatasetProfileBase], versions: Optional[SchemaVersions] = None):
+    args = _get_args(all_versions_available=versions is not None)
     output: Path = args.output
+    if versions is not None and args.all_versions:
+        write_all_json_schemas(versions, output)
+        return
     if output.is_dir():
         output /= "edp_schema.json"
-    adapter = TypeAdapter(Dict[str, Any])
-    with open(output, "wb") as file:
-        file.write(adapter.dump_json(schema.model_json_schema(by_alias=True)))
+    write_json_schema(schema, output)
 
 
-def _get_args():
+def _get_args(all_versions_available: bool):
     parser = ArgumentParser()
     parser.add_argument("-o", "--output", type=Path, required=True, help="PurePosixPath to output the schema to")
+    if all_versions_available:
+        parser.add_argument(
+            "--all-versions",
+            action="store_true",
+            help="Write one schema per major version into the output directory",
+        )
     return parser.parse_args()
@@ -0,0 +1,69 @@
+from typing import Any, List
+
+from extended_dataset_profile.tree import parse_dataset_reference, parse_tree_reference
+
+CHECK_REFERENCES = "check_references"
+"""Validation context key enabling the reference integrity check of EDP models.
+
+Example: `model_validate(data, context={CHECK_REFERENCES: True})`
+"""
+
+_UNVISITED, _VISITING, _DONE = 0, 1, 2
+
+
+class ReferenceIntegrityError(ValueError):
+    """Raised if references inside an EDP do not resolve or the dataset tree contains cycles."""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__("Invalid references: " + "; ".join(problems))
+
+
+def find_reference_problems(edp: Any) -> List[str]:
+    """
+    Check all references of the dataset tree in linear time.
+
+    Every dataset reference must point to an existing item of one of the dataset lists, every parent reference
+    must point to a node of the dataset tree and the parent links must not form cycles. The references are checked
+    against the lengths of the lists, using the parsed segments of the references.
+    """
+    nodes = edp.datasetTree
+    problems: List[str] = []
+    parents: List[int] = [-1] * len(nodes)
+    for position, node in enumerate(nodes):
+        dataset = parse_dataset_reference(node.dataset)
+        if dataset is None:
+            problems.append(f'datasetTree/{position}: dataset "{node.dataset.reference}" is not a dataset')
+        elif dataset[1] >= len(getattr(edp, dataset[0])):
+            problems.append(f'datasetTree/{position}: dataset "{node.dataset.reference}" does not exist')
+        if node.parent is None:
+            continue
+        parent = parse_tree_reference(node.parent)
+        if parent is None or parent >= len(nodes):
+            problems.append(f'datasetTree/{position}: parent "{node.parent.reference}" is not a dataset tree node')
+        else:
+            parents[position] = parent
+
+    # Every node has at most one parent, so each walk up the tree either ends at a root, an already checked node
+    # or runs into a node of the current walk, which closes a cycle. Every node is walked over only once.
+    states = [_UNVISITED] * len(nodes)
+    for start in range(len(nodes)):
+        walk = []
+        current = start
+        while current >= 0 and states[current] == _UNVISITED:
+            states[current] = _VISITING
+            walk.append(current)
+            current = parents[current]
+        if current >= 0 and states[current] == _VISITING:
+            cycle = walk[walk.index(current) :]
+            problems.append(f"datasetTree: parents form a cycle through the nodes {cycle}")
+        for position in walk:
+            states[position] = _DONE
+    return problems
+
+
+def check_reference_integrity(edp: Any) -> None:
+    """Raise a ReferenceIntegrityError, if any reference of the dataset tree is invalid."""
+    problems = find_reference_problems(edp)
+    if problems:
+        raise ReferenceIntegrityError(problems)
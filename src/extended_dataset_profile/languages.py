@@ -0,0 +1,133 @@
+import unicodedata
+from functools import lru_cache
+from importlib.resources import files
+from typing import Annotated, Any, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional
+
+from pydantic import AfterValidator
+
+_ISO639_3_TABLE = "data/iso639_3.tsv"
+
+
+def _read_iso639_3_table() -> Iterator[List[str]]:
+    """Yield the tab separated rows (code, english name, ISO 639-1 code or empty) of the packaged ISO 639-3 table."""
+    text = files(__package__).joinpath(_ISO639_3_TABLE).read_text(encoding="utf-8")
+    for line in text.splitlines():
+        if line:
+            yield line.split("\t")
+
+
+@lru_cache(maxsize=None)
+def iso639_3_codes() -> FrozenSet[str]:
+    """
+    All ISO 639-3 language codes.
+
+    The table is shared between all schema versions and only gets loaded on first use,
+    so importing the models does not pay for it.
+    """
+    return frozenset(row[0] for row in _read_iso639_3_table())
+
+
+class LanguageInfo(NamedTuple):
+    """
+    Metadata of an ISO 639-3 language.
+    """
+
+    code: str
+    """ISO 639-3 code of the language."""
+    name: str
+    """English reference name of the language."""
+    iso639_1: Optional[str]
+    """Two letter ISO 639-1 code, if the language has one."""
+
+
+class _LanguageIndex(NamedTuple):
+    by_code: Dict[str, LanguageInfo]
+    by_name: Dict[str, LanguageInfo]
+    by_iso639_1: Dict[str, LanguageInfo]
+
+
+def normalize_language_name(name: str) -> str:
+    """Normalize a language name for lookups by ignoring case, diacritics and redundant whitespace."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    return " ".join("".join(char for char in decomposed if not unicodedata.combining(char)).casefold().split())
+
+
+@lru_cache(maxsize=None)
+def _language_index() -> _LanguageIndex:
+    languages = [LanguageInfo(code, name, iso639_1 or None) for code, name, iso639_1 in _read_iso639_3_table()]
+    by_name: Dict[str, LanguageInfo] = {}
+    # Some names are used by multiple languages. Prefer the widely used ones, which have an ISO 639-1 code.
+    for language in sorted(languages, key=lambda language: language.iso639_1 is None):
+        by_name.setdefault(normalize_language_name(language.name), language)
+    return _LanguageIndex(
+        by_code={language.code: language for language in languages},
+        by_name=by_name,
+        by_iso639_1={language.iso639_1: language for language in languages if language.iso639_1 is not None},
+    )
+
+
+class LanguageRegistry:
+    """
+    The language codes accepted by a schema version.
+
+    Every registry is backed by the one shared ISO 639-3 table. A schema version that needs to differ from the
+    standard can derive an overlay registry, which only stores the added and removed codes.
+    """
+
+    def __init__(self, additions: Iterable[str] = (), removals: Iterable[str] = ()):
+        self._additions = frozenset(code.lower() for code in additions)
+        self._removals = frozenset(code.lower() for code in removals) - self._additions
+        self.Language: Any = Annotated[str, AfterValidator(self._validate)]
+        """Pydantic type of a language code, which gets normalized to lower case."""
+
+    def overlay(self, additions: Iterable[str] = (), removals: Iterable[str] = ()) -> "LanguageRegistry":
+        """Derive a registry, which accepts the additional codes and rejects the removed ones."""
+        additions = frozenset(code.lower() for code in additions)
+        removals = frozenset(code.lower() for code in removals)
+        return LanguageRegistry(
+            additions=(self._additions - removals) | additions,
+            removals=(self._removals - additions) | removals,
+        )
+
+    def is_iso639_3(self, text: str) -> bool:
+        if text in self._additions:
+            return True
+        return text not in self._removals and text in iso639_3_codes()
+
+    def __contains__(self, text: object) -> bool:
+        return isinstance(text, str) and self.is_iso639_3(text)
+
+    def info(self, code: str) -> Optional[LanguageInfo]:
+        """Look up the metadata of an ISO 639-3 code. Codes added by an overlay have no metadata."""
+        code = code.lower()
+        if code in self._removals:
+            return None
+        return _language_index().by_code.get(code)
+
+    def name(self, code: str) -> Optional[str]:
+        """English name of the language with the given ISO 639-3 code."""
+        info = self.info(code)
+        return None if info is None else info.name
+
+    def code_for_name(self, name: str) -> Optional[str]:
+        """ISO 639-3 code of the language with the given english name. Case and diacritics are ignored."""
+        return self._code(_language_index().by_name.get(normalize_language_name(name)))
+
+    def from_iso639_1(self, code: str) -> Optional[str]:
+        """ISO 639-3 code of the language with the given two letter ISO 639-1 code."""
+        return self._code(_language_index().by_iso639_1.get(code.lower()))
+
+    def _code(self, info: Optional[LanguageInfo]) -> Optional[str]:
+        if info is None or info.code in self._removals:
+            return None
+        return info.code
+
+    def _validate(self, text: str) -> str:
+        text = text.lower()
+        if not self.is_iso639_3(text):
+            raise ValueError(f'"{text}" is not a ISO369-3 language string!')
+        return text
+
+
+LANGUAGE_REGISTRY = LanguageRegistry()
+"""Registry of all standard ISO 639-3 languages."""
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
-from extended_dataset_profile.types.version import Version
+from extended_dataset_profile.canonical import content_hash
+from extended_dataset_profile.integrity import CHECK_REFERENCES, check_reference_integrity
+from extended_dataset_profile.types.version import Version, parse_version
 
 
 class ExtendedDatasetProfileBase(ABC, BaseModel):
@@ -21,9 +23,21 @@ class ExtendedDatasetProfileBase(ABC, BaseModel):
     def parse_version(cls, value: Any) -> Version:
         if isinstance(value, Version):
             version = value
+        elif isinstance(value, str):
+            version = parse_version(value)
         else:
             version = Version(value)
         expected_major = cls._get_version().major
         if expected_major != version.major:
             raise ValueError(f"schemaVersion {value} does not match expected major version '{expected_major}'")
         return version
+
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the canonical JSON of this EDP, cached per instance. See `canonical.content_hash`."""
+        return content_hash(self)
+
+    @model_validator(mode="after")
+    def _check_reference_integrity(self, info: ValidationInfo):
+        if info.context and info.context.get(CHECK_REFERENCES):
+            check_reference_integrity(self)
+        return self
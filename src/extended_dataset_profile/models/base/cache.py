@@ -0,0 +1,28 @@
+import weakref
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+_CACHES: Dict[int, Dict[str, Any]] = {}
+
+
+def derived_cache(model: BaseModel) -> Dict[str, Any]:
+    """
+    Cache for data derived from a model instance, like indexes.
+
+    The cache is kept outside of the model, so it neither changes model equality nor gets shared by copies of the
+    model. It is dropped together with the model. Models are mutable, so call `clear_derived_cache` after modifying
+    a model in place.
+    """
+    key = id(model)
+    cache = _CACHES.get(key)
+    if cache is None:
+        cache = _CACHES[key] = {}
+        weakref.finalize(model, _CACHES.pop, key, None)
+    return cache
+
+
+def clear_derived_cache(model: BaseModel) -> None:
+    cache = _CACHES.get(id(model))
+    if cache is not None:
+        cache.clear()
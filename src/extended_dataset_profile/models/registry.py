@@ -0,0 +1,89 @@
+import re
+from importlib import import_module
+from types import ModuleType
+from typing import Dict, Iterator, Mapping, Optional, Type, Union
+
+from pydantic import ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError
+
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+
+# EDP keys are static and "schemaVersion" is only used at the top level. Inside of JSON strings the quotes
+# would be escaped, so this can only match the actual schemaVersion field.
+_SCHEMA_VERSION_REGEX = re.compile(rb'"schemaVersion"\s*:\s*"v?(\d+)')
+
+
+def read_schema_major(raw: Union[str, bytes]) -> Optional[int]:
+    """Read the major schema version of a raw EDP JSON document without parsing the document."""
+    if isinstance(raw, str):
+        raw = raw.encode()
+    match = _SCHEMA_VERSION_REGEX.search(raw)
+    return None if match is None else int(match.group(1))
+
+
+class SchemaVersions(Mapping[int, Type[ExtendedDatasetProfileBase]]):
+    """
+    Maps the major schema versions to their EDP model.
+
+    The module of a major version is imported on its first lookup, so processes only pay the import and
+    pydantic schema building cost for the versions they actually use.
+    """
+
+    def __init__(self, modules: Mapping[int, str], default: Optional[int] = None):
+        self._modules = dict(modules)
+        self._models: Dict[int, Type[ExtendedDatasetProfileBase]] = {}
+        self.default = default
+        """Major version used for documents without schemaVersion."""
+
+    def module(self, major: int) -> ModuleType:
+        """Import and return the module defining the models of the given major version."""
+        return import_module(self._modules[major])
+
+    def is_loaded(self, major: int) -> bool:
+        return major in self._models
+
+    def model_for_json(self, raw: Union[str, bytes]) -> Type[ExtendedDatasetProfileBase]:
+        """
+        Select the model matching the major schemaVersion of a raw JSON document.
+
+        Raises a ValidationError, if the document has no schemaVersion and there is no default or if
+        its major version is not registered.
+        """
+        major = read_schema_major(raw)
+        if major is None:
+            major = self.default
+        if major is None:
+            raise _schema_version_error("missing", "Field required", raw)
+        if major not in self:
+            raise _schema_version_error(
+                "schema_version", f"Major schema version {major} is not registered", raw, major=major
+            )
+        return self[major]
+
+    def validate_json(self, raw: Union[str, bytes]) -> ExtendedDatasetProfileBase:
+        """Validate a raw JSON document with the model of its major schemaVersion."""
+        return self.model_for_json(raw).model_validate_json(raw)
+
+    def __getitem__(self, major: int) -> Type[ExtendedDatasetProfileBase]:
+        model = self._models.get(major)
+        if model is None:
+            model = self._models[major] = self.module(major).ExtendedDatasetProfile
+        return model
+
+    def __contains__(self, major: object) -> bool:
+        return major in self._modules
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
+def _schema_version_error(error_type: str, message: str, raw: Union[str, bytes], **context) -> ValidationError:
+    error: InitErrorDetails = {
+        "type": PydanticCustomError(error_type, message, context or None),
+        "loc": ("schemaVersion",),
+        "input": raw,
+    }
+    return ValidationError.from_exception_data("ExtendedDatasetProfile", [error])
@@ -1,11 +1,32 @@
 import re
-from typing import Any
+import sys
+from functools import lru_cache
+from typing import Any, Tuple, Union
 
-from pydantic import AliasChoices, BaseModel, Field, field_validator
+from pydantic import AliasChoices, BaseModel, Field, PrivateAttr, field_validator
 
 _JSON_KEY_CHARACTERS = r"a-zA-Z0-9_-"
 _JSON_REFERENCE_REGEX = re.compile(f"#(\\/[{_JSON_KEY_CHARACTERS}]+)+")
 
+JsonReferenceSegments = Tuple[Union[str, int], ...]
+
+
+@lru_cache(maxsize=65536)
+def parse_json_reference(value: str) -> JsonReferenceSegments:
+    """
+    Split a JSON reference into its keys, with list indices converted to integers.
+    Segments with leading zeros are no list indices (RFC 6901) and stay strings.
+
+    The result is cached, so all equal references share the same interned segments.
+    """
+    if _JSON_REFERENCE_REGEX.fullmatch(value) is None:
+        raise ValueError(f'The string "{value}" is not a JSON reference!')
+    return tuple(int(segment) if _is_index(segment) else sys.intern(segment) for segment in value[2:].split("/"))
+
+
+def _is_index(segment: str) -> bool:
+    return segment.isdigit() and (segment == "0" or not segment.startswith("0"))
+
 
 class JsonReference(BaseModel):
     """
@@ -17,12 +38,42 @@ class JsonReference(BaseModel):
         validation_alias=AliasChoices("$ref", "reference"),
         description="The JSON keys that lead to the referred value.",
     )
+    # The reference that _segments were parsed from, to notice assignments that bypass __setattr__.
+    _parsed_reference: str = PrivateAttr(default="")
+    _segments: JsonReferenceSegments = PrivateAttr(default=())
 
     @field_validator("reference", mode="after")
     @classmethod
     def _validate_json_reference(cls, value: Any):
         if not isinstance(value, str):
             raise ValueError("Json reference must be of type str")
-        if _JSON_REFERENCE_REGEX.fullmatch(value) is None:
-            raise ValueError(f'The string "{value}" is not a JSON reference!')
+        parse_json_reference(value)
         return value
+
+    def model_post_init(self, context: Any) -> None:
+        self._parse()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "reference":
+            self._parse()
+
+    @property
+    def segments(self) -> JsonReferenceSegments:
+        """The parsed keys of this reference. List indices are integers."""
+        if self._parsed_reference is not self.reference:
+            # The reference was replaced without __setattr__, e.g. by validate_assignment or model_copy.
+            self._parse()
+        return self._segments
+
+    def _parse(self) -> None:
+        self._segments = parse_json_reference(self.reference)
+        self._parsed_reference = self.reference
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JsonReference):
+            return self.reference == other.reference
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.reference)
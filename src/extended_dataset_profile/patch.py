@@ -0,0 +1,201 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Type, TypeVar, cast, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined, to_jsonable_python
+
+from extended_dataset_profile.annotations import field_names, strip_optional
+from extended_dataset_profile.diff import PatchOperation
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_REMOVE = object()
+
+
+class PatchError(ValueError):
+    """Raised for malformed patch operations, paths that do not exist and failed "test" operations."""
+
+
+def apply_patch(edp: ModelT, operations: Iterable[PatchOperation]) -> ModelT:
+    """
+    Apply JSON Patch (RFC 6902) operations, like the ones from `diff_edps`, to an EDP.
+
+    The EDP is not modified. Instead, only the models and lists on the path to a change get copied, all other parts
+    of the returned EDP are shared with the original, so they must not be modified in place afterwards. New and
+    changed values are validated right away, like an assignment to the changed field. Changed lists are validated
+    by their containing model after all operations were applied, since only the patched EDP has to be valid and
+    not every intermediate state (e.g. when the only asset reference gets removed and another one added). Thus the
+    costs depend on the changes and not on the size of the EDP.
+    """
+    state = _PatchState()
+    for operation in operations:
+        edp = _apply_operation(edp, operation, state)
+    return cast(ModelT, state.validate_lists(edp))
+
+
+class _PatchState:
+    """The models and lists created while patching and the list fields whose validation is deferred."""
+
+    def __init__(self):
+        # The created objects are kept alive, so their ids can not be reused during the patch.
+        self.created: Dict[int, Any] = {}
+        self.pending: Dict[int, Set[str]] = {}
+
+    def add(self, new: Any, old: Any = None) -> Any:
+        self.created[id(new)] = new
+        names = self.pending.pop(id(old), None)
+        if names is not None:
+            self.pending[id(new)] = names
+        return new
+
+    def defer(self, model: BaseModel, name: str) -> None:
+        self.pending.setdefault(id(model), set()).add(name)
+
+    def validate_lists(self, node: Any) -> Any:
+        """Validate the changed lists by their models and return the node with the validated copies."""
+        if id(node) not in self.created:
+            return node
+        if isinstance(node, list):
+            items = [self.validate_lists(item) for item in node]
+            return items if any(new is not old for new, old in zip(items, node)) else node
+        if not isinstance(node, BaseModel):
+            return node
+        values = node.__dict__
+        names = self.pending.get(id(node), set())
+        update = {}
+        for name, value in values.items():
+            new_value = self.validate_lists(value)
+            if new_value is not value or name in names:
+                update[name] = new_value
+        if not update:
+            return node
+        copy = node.model_copy(update={name: value for name, value in update.items() if name not in names})
+        for name in names:
+            copy.__pydantic_validator__.validate_assignment(copy, name, update[name])
+        return copy
+
+
+def _apply_operation(root: ModelT, operation: PatchOperation, state: _PatchState) -> ModelT:
+    try:
+        op = operation["op"]
+        path = _parse_pointer(operation["path"])
+        if op == "test":
+            if to_jsonable_python(_get(root, path), by_alias=True) != operation["value"]:
+                raise PatchError(f'Test of "{operation["path"]}" failed')
+            return root
+        if op in ("add", "replace"):
+            value = operation["value"]
+        elif op in ("move", "copy"):
+            source = _parse_pointer(operation["from"])
+            value = _get(root, source)
+            if op == "move":
+                if path[: len(source)] == source and len(path) > len(source):
+                    raise PatchError(f'Can not move "{operation["from"]}" into itself')
+                root = _update(root, source, "remove", _REMOVE, state)
+            op = "add"
+        elif op == "remove":
+            value = _REMOVE
+        else:
+            raise PatchError(f'Unknown patch operation "{op}"')
+    except KeyError as error:
+        raise PatchError(f"Patch operation {operation} is missing {error}") from None
+    if not path:
+        if op == "remove":
+            raise PatchError("The whole EDP can not be removed")
+        return type(root).model_validate(value)
+    return cast(ModelT, _update(root, path, op, value, state))
+
+
+def _update(node: Any, path: List[str], op: str, value: Any, state: _PatchState, item_type: Any = None) -> Any:
+    """Return a copy of the node with the operation applied at the path relative to it."""
+    key = path[0]
+    if isinstance(node, BaseModel):
+        name = _field_name(node, key)
+        if len(path) == 1:
+            return state.add(_assign(node, name, _remove_field(node, name) if value is _REMOVE else value), node)
+        child = node.__dict__[name]
+        new_child = _update(child, path[1:], op, value, state, _item_adapter(type(node), name))
+        new = state.add(node.model_copy(update={name: new_child}), node)
+        if isinstance(child, list) and len(path) == 2:
+            # Constraints of the list, like a minimum length, are only checked once all operations were applied.
+            state.defer(new, name)
+        return new
+    if isinstance(node, list):
+        items = list(node)
+        if len(path) > 1:
+            index = _index(items, key)
+            items[index] = _update(items[index], path[1:], op, value, state)
+        elif op == "add":
+            items.insert(_index(items, key, insert=True), _validate_item(item_type, value))
+        elif op == "replace":
+            items[_index(items, key)] = _validate_item(item_type, value)
+        else:
+            del items[_index(items, key)]
+        return state.add(items)
+    raise PatchError(f'Can not resolve "{key}" in a value of type {type(node).__name__}')
+
+
+def _validate_item(adapter: Optional[TypeAdapter], value: Any) -> Any:
+    return adapter.validate_python(value) if adapter is not None else value
+
+
+@lru_cache(maxsize=None)
+def _item_adapter(model_type: Type[BaseModel], name: str) -> Optional[TypeAdapter]:
+    """Adapter for the items of a list field, so added items are validated before the list is."""
+    annotation = strip_optional(model_type.model_fields[name].annotation)
+    if get_origin(annotation) is not list:
+        return None
+    return TypeAdapter(get_args(annotation)[0])
+
+
+def _assign(model: BaseModel, name: str, value: Any) -> BaseModel:
+    copy = model.model_copy()
+    copy.__pydantic_validator__.validate_assignment(copy, name, value)
+    return copy
+
+
+def _remove_field(model: BaseModel, name: str) -> Any:
+    field = type(model).model_fields[name]
+    if field.default_factory is not None:
+        return field.default_factory()  # type: ignore[call-arg]
+    if field.default is PydanticUndefined:
+        raise PatchError(f'The required field "{name}" can not be removed')
+    return field.default
+
+
+def _get(node: Any, path: List[str]) -> Any:
+    for key in path:
+        if isinstance(node, BaseModel):
+            node = node.__dict__[_field_name(node, key)]
+        elif isinstance(node, list):
+            node = node[_index(node, key)]
+        else:
+            raise PatchError(f'Can not resolve "{key}" in a value of type {type(node).__name__}')
+    return node
+
+
+def _field_name(model: BaseModel, key: str) -> str:
+    name = field_names(type(model)).get(key)
+    if name is None:
+        raise PatchError(f'{type(model).__name__} has no field "{key}"')
+    return name
+
+
+def _index(items: List[Any], key: str, insert: bool = False) -> int:
+    if insert and key == "-":
+        return len(items)
+    if not key.isdigit() or (key != "0" and key.startswith("0")):
+        raise PatchError(f'"{key}" is not a valid list index')
+    index = int(key)
+    if index > len(items) or (index == len(items) and not insert):
+        raise PatchError(f"List index {index} is out of range")
+    return index
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    # The parts stay escaped, since the field names are looked up by their escaped keys.
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise PatchError(f'"{pointer}" is not a JSON pointer')
+    return pointer[1:].split("/")
@@ -0,0 +1,135 @@
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from extended_dataset_profile.annotations import field_names, json_keys
+from extended_dataset_profile.models.base.cache import derived_cache
+
+Reference = Union[str, Any]
+"""A JSON reference string like "#/structuredDatasets/3" or a JsonReference model of any schema version."""
+
+
+class ResolvedTreeNode(NamedTuple):
+    """A node of the dataset tree together with the objects its references point to."""
+
+    node: Any
+    dataset: Any
+    parent: Optional[Any]
+
+
+class ReferenceIndex:
+    """
+    Maps the JSON references of all models and lists inside an EDP to the objects.
+
+    The index gets built in a single pass over the model. Afterwards every reference resolves in constant time.
+    References to plain values (like "#/name") are resolved through their indexed parent.
+    """
+
+    def __init__(self, model: BaseModel):
+        objects: Dict[str, Any] = {}
+        stack: List[Tuple[str, Any]] = [("#", model)]
+        while stack:
+            pointer, value = stack.pop()
+            objects[pointer] = value
+            if isinstance(value, list):
+                stack.extend(
+                    (f"{pointer}/{index}", child)
+                    for index, child in enumerate(value)
+                    if isinstance(child, (BaseModel, list))
+                )
+            else:
+                model_type: Type[BaseModel] = type(value)
+                fields = value.__dict__
+                for name, key in _container_keys(model_type):
+                    child = fields[name]
+                    if child is not None:
+                        stack.append((f"{pointer}/{key}", child))
+        self._objects = objects
+        self._pointers: Dict[int, str] = {id(value): pointer for pointer, value in objects.items()}
+
+    def resolve(self, reference: Reference) -> Any:
+        """Return the object a reference points to. Raises a KeyError for unresolvable references."""
+        pointer = _pointer(reference)
+        try:
+            return self._objects[pointer]
+        except KeyError:
+            pass
+        parent_pointer, _, key = pointer.rpartition("/")
+        parent = self._objects.get(parent_pointer)
+        if isinstance(parent, BaseModel):
+            name = field_names(type(parent)).get(key)
+            if name is not None:
+                return getattr(parent, name)
+        elif isinstance(parent, list) and key.isdigit() and int(key) < len(parent):
+            return parent[int(key)]
+        raise KeyError(f'Unresolvable JSON reference "{pointer}"')
+
+    def get(self, reference: Reference, default: Any = None) -> Any:
+        try:
+            return self.resolve(reference)
+        except KeyError:
+            return default
+
+    def pointer_of(self, value: Any) -> Optional[str]:
+        """Return the JSON reference of an indexed model or list object."""
+        pointer = self._pointers.get(id(value))
+        if pointer is None or self._objects[pointer] is not value:
+            return None
+        return pointer
+
+    def __contains__(self, reference: Reference) -> bool:
+        return self.get(reference, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+_MISSING = object()
+
+
+def get_reference_index(edp: BaseModel) -> ReferenceIndex:
+    """Return the reference index of an EDP. It is built on first use and cached for the instance."""
+    cache = derived_cache(edp)
+    index = cache.get("references")
+    if index is None:
+        index = cache["references"] = ReferenceIndex(edp)
+    return index
+
+
+def resolve_reference(edp: BaseModel, reference: Reference) -> Any:
+    return get_reference_index(edp).resolve(reference)
+
+
+def resolve_tree(edp: Any) -> List[ResolvedTreeNode]:
+    """Resolve the dataset and parent references of all nodes in the dataset tree of an EDP."""
+    index = get_reference_index(edp)
+    return [
+        ResolvedTreeNode(
+            node=node,
+            dataset=index.resolve(node.dataset),
+            parent=None if node.parent is None else index.resolve(node.parent),
+        )
+        for node in edp.datasetTree
+    ]
+
+
+def _pointer(reference: Reference) -> str:
+    return reference if isinstance(reference, str) else reference.reference
+
+
+@lru_cache(maxsize=None)
+def _container_keys(model: Type[BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    """Like `json_keys`, but only for the fields that can contain models or lists."""
+    return tuple(
+        (name, key) for name, key in json_keys(model) if _may_hold_container(model.model_fields[name].annotation)
+    )
+
+
+def _may_hold_container(annotation: Any) -> bool:
+    if get_origin(annotation) is list or (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return True
+    return get_origin(annotation) in (Union, UnionType) and any(
+        _may_hold_container(arg) for arg in get_args(annotation)
+    )
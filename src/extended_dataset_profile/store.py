@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, Type, TypeVar
+
+from pydantic import BaseModel
+
+from extended_dataset_profile.canonical import canonicalize, content_hash, encode_canonical
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+
+EdpT = TypeVar("EdpT", bound=ExtendedDatasetProfileBase)
+
+BLOB_KEY = "$blob"
+
+DEFAULT_BLOB_MODELS: FrozenSet[str] = frozenset({"DataSpace", "Publisher", "License", "StructuredDataSet"})
+"""Names of the model classes that are stored as separate objects, since they are often shared between EDPs."""
+
+
+class EdpStore:
+    """
+    Local content-addressed store of EDPs.
+
+    Every EDP is stored as an object named by its `content_hash()`. Submodels listed in `blob_models` are stored
+    as separate objects named by their own content hash and replaced by `{"$blob": <hash>}` in the containing
+    object, so identical submodels of all stored EDPs only exist once. Objects are zlib compressed canonical JSON
+    in git-like paths (`objects/ab/cdef...`). Reading an EDP rebuilds the document from its objects.
+    """
+
+    def __init__(self, root: Path, blob_models: FrozenSet[str] = DEFAULT_BLOB_MODELS):
+        self.root = root
+        self.blob_models = blob_models
+        self._objects = root / "objects"
+
+    def put(self, edp: ExtendedDatasetProfileBase) -> str:
+        """Store the EDP and return its content hash, which is the key to read it again."""
+        return self._put_model(edp)
+
+    def get(self, digest: str, schema: Type[EdpT]) -> EdpT:
+        """
+        Rebuild and validate the EDP stored under the digest. Raises a `KeyError` if there is no such EDP.
+
+        The objects only contain the canonical JSON, e.g. timedeltas of numeric fields are ISO 8601 strings, so the
+        EDP is always validated to restore the types of the values.
+        """
+        return schema.model_validate(self._resolve(self._read(digest), {}))
+
+    def __contains__(self, digest: object) -> bool:
+        return isinstance(digest, str) and _is_digest(digest) and self._path(digest).is_file()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the digests of all objects, including the shared submodels."""
+        if not self._objects.is_dir():
+            return
+        for directory in sorted(self._objects.iterdir()):
+            for path in sorted(directory.iterdir()):
+                if not path.name.startswith("."):
+                    yield directory.name + path.name
+
+    def _put_model(self, model: BaseModel) -> str:
+        digest = content_hash(model)
+        path = self._path(digest)
+        if not path.exists():
+            self._write(path, encode_canonical(self._reduce(model)))
+        return digest
+
+    def _reduce(self, value: Any) -> Any:
+        """The canonical representation of the value, with the shared submodels replaced by references."""
+        if isinstance(value, BaseModel):
+            values = value.__dict__
+            return {
+                field.serialization_alias or field.alias or name: self._reduce_field(values[name])
+                for name, field in type(value).model_fields.items()
+            }
+        return canonicalize(value)
+
+    def _reduce_field(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            if type(value).__name__ in self.blob_models:
+                return {BLOB_KEY: self._put_model(value)}
+            return self._reduce(value)
+        if isinstance(value, (list, tuple)):
+            return [self._reduce_field(item) for item in value]
+        return canonicalize(value)
+
+    def _resolve(self, value: Any, blobs: Dict[str, Any]) -> Any:
+        if isinstance(value, dict):
+            digest = value.get(BLOB_KEY)
+            if isinstance(digest, str) and len(value) == 1:
+                # Shared submodels are decoded once per document, their dictionaries are not modified afterwards.
+                blob = blobs.get(digest)
+                if blob is None:
+                    blob = blobs[digest] = self._resolve(self._read(digest), blobs)
+                return blob
+            return {key: self._resolve(item, blobs) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item, blobs) for item in value]
+        return value
+
+    def _read(self, digest: str) -> Any:
+        try:
+            data = self._path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+        return json.loads(zlib.decompress(data))
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see a partial object.
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(zlib.compress(data))
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def _path(self, digest: str) -> Path:
+        if not _is_digest(digest):
+            raise ValueError(f'"{digest}" is not a SHA-256 hex digest')
+        return self._objects / digest[:2] / digest[2:]
+
+
+def _is_digest(value: str) -> bool:
+    return len(value) == 64 and all(character in "0123456789abcdef" for character in value)
@@ -0,0 +1,211 @@
+import codecs
+from functools import lru_cache
+from json import JSONDecodeError, JSONDecoder
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+
+EdpT = TypeVar("EdpT", bound=ExtendedDatasetProfileBase)
+
+_WHITESPACE = " \t\n\r"
+
+
+class StreamedItem(NamedTuple):
+    """A validated item of one of the streamed lists of an EDP."""
+
+    field: str
+    position: int
+    value: BaseModel
+
+
+class EdpStreamParser(Generic[EdpT]):
+    """
+    Parses a single large EDP JSON document incrementally.
+
+    Iterating the parser yields the items of the top-level lists of models (like `structuredDatasets` or
+    `datasetTree`) one by one, each validated as soon as it was read completely. All other fields are collected and
+    validated as `header` once the document is finished, with the streamed lists left empty. Thus the memory usage
+    is bounded by the largest item instead of the whole document.
+
+    By default all top-level lists of models without constraints get streamed, constrained lists (like the
+    `assetRefs`, which must not be empty) are part of the header.
+    """
+
+    def __init__(
+        self,
+        source: Union[Path, IO[bytes], IO[str]],
+        schema: Type[EdpT],
+        stream_fields: Optional[Iterable[str]] = None,
+        chunk_size: int = 1 << 16,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.source = source
+        self.schema = schema
+        self.chunk_size = chunk_size
+        fields = _streamable_fields(schema)
+        if stream_fields is not None:
+            unknown = set(stream_fields) - set(fields)
+            if unknown:
+                raise ValueError(f"Can not stream the fields {sorted(unknown)}, they are no lists of models")
+            fields = {name: adapter for name, adapter in fields.items() if name in stream_fields}
+        self._adapters = fields
+        self._header: Optional[EdpT] = None
+
+    @property
+    def header(self) -> EdpT:
+        """All fields but the streamed lists. Only available after iterating all items."""
+        if self._header is None:
+            raise RuntimeError("The header is only available after all items were read")
+        return self._header
+
+    def __iter__(self) -> Iterator[StreamedItem]:
+        if isinstance(self.source, Path):
+            with open(self.source, "rb") as file:
+                yield from self._parse(_JsonReader(file, self.chunk_size))
+        else:
+            yield from self._parse(_JsonReader(self.source, self.chunk_size))
+
+    def _parse(self, reader: "_JsonReader") -> Iterator[StreamedItem]:
+        header: Dict[str, Any] = {}
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.expect("}")
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise reader.error("Expected an object key")
+                reader.expect(":")
+                adapter = self._adapters.get(key)
+                if adapter is not None and reader.peek() == "[":
+                    yield from self._items(reader, key, adapter)
+                    header[key] = []
+                else:
+                    header[key] = reader.value()
+                if reader.expect(",}") == "}":
+                    break
+        if reader.peek() != "":
+            raise reader.error("Unexpected data after the EDP")
+        for key in self._adapters:
+            header.setdefault(key, [])
+        self._header = self.schema.model_validate(header)
+
+    def _items(self, reader: "_JsonReader", key: str, adapter: TypeAdapter) -> Iterator[StreamedItem]:
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+        position = 0
+        while True:
+            yield StreamedItem(key, position, adapter.validate_python(reader.value()))
+            position += 1
+            if reader.expect(",]") == "]":
+                return
+
+
+class _JsonReader:
+    """Reads consecutive JSON values and structural characters from a stream, one buffered chunk at a time."""
+
+    def __init__(self, stream: Union[IO[bytes], IO[str]], chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._offset = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Return the next non whitespace character without consuming it or an empty string at the end."""
+        while True:
+            buffer = self._buffer
+            position = self._position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self._position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """Consume the next non whitespace character, which must be one of the given characters."""
+        character = self.peek()
+        if not character or character not in characters:
+            raise self.error(f"Expected one of {characters!r}")
+        self._position += 1
+        return character
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._position)
+            except JSONDecodeError:
+                value, end = None, None
+            # Numbers and literals are only known to be complete, if they are followed by another character.
+            if end is not None and (end < len(self._buffer) or self._eof):
+                self._position = end
+                return value
+            if self._eof:
+                raise self.error("Invalid or incomplete JSON value")
+            self._fill(size)
+            # Grow the reads, so large values do not get decoded again for every chunk.
+            size *= 2
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at character {self._offset + self._position}")
+
+    def _fill(self, size: int) -> bool:
+        """Append the next chunk to the buffer and drop the consumed part. Returns False at the end of the stream."""
+        if self._eof:
+            return False
+        data = self._stream.read(size)
+        if isinstance(data, bytes):
+            text = self._decoder.decode(data, final=not data)
+        else:
+            text = data
+        if not data:
+            self._eof = True
+        self._offset += self._position
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        return bool(text) or not self._eof
+
+
+def _streamable_fields(schema: Type[BaseModel]) -> Dict[str, TypeAdapter]:
+    """Adapters for the items of all unconstrained top-level lists of models, keyed by their JSON key."""
+    fields = {}
+    for name, field in schema.model_fields.items():
+        if get_origin(field.annotation) is not list or field.metadata:
+            continue
+        (item_type,) = get_args(field.annotation)
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            fields[field.alias or name] = _item_adapter(item_type)
+    return fields
+
+
+@lru_cache(maxsize=None)
+def _item_adapter(item_type: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(item_type)
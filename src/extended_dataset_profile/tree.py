@@ -0,0 +1,183 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from extended_dataset_profile.models.base.cache import derived_cache
+
+_TREE_REFERENCE_PREFIX = "#/datasetTree/"
+
+DATASET_FIELDS = (
+    "archiveDatasets",
+    "structuredDatasets",
+    "semiStructuredDatasets",
+    "unstructuredTextDatasets",
+    "imageDatasets",
+    "videoDatasets",
+    "audioDatasets",
+    "documentDatasets",
+)
+"""The lists of datasets of an EDP, the dataset of every tree node is an item of one of them."""
+
+NodeOrPosition = Union[Any, int]
+"""A DatasetTreeNode of any schema version or its position inside the datasetTree list."""
+
+
+def parse_tree_reference(reference: Union[str, Any]) -> Optional[int]:
+    """
+    Return the position a reference like "#/datasetTree/3" points to or None for any other reference.
+
+    JsonReference models are not parsed again, their cached segments are used instead.
+    """
+    if not isinstance(reference, str):
+        segments = reference.segments
+        if len(segments) == 2 and segments[0] == "datasetTree" and isinstance(segments[1], int):
+            return segments[1]
+        return None
+    if not reference.startswith(_TREE_REFERENCE_PREFIX):
+        return None
+    return _parse_position(reference[len(_TREE_REFERENCE_PREFIX) :])
+
+
+def parse_dataset_reference(reference: Union[str, Any]) -> Optional[Tuple[str, int]]:
+    """
+    Return the list field and position a reference like "#/structuredDatasets/3" points to or None for any
+    reference that is not an item of one of the `DATASET_FIELDS`.
+    """
+    if not isinstance(reference, str):
+        segments = reference.segments
+        if len(segments) == 2 and segments[0] in DATASET_FIELDS and isinstance(segments[1], int):
+            return segments[0], segments[1]
+        return None
+    if not reference.startswith("#/"):
+        return None
+    field, _, position = reference[2:].partition("/")
+    index = _parse_position(position)
+    if field not in DATASET_FIELDS or index is None:
+        return None
+    return field, index
+
+
+def _parse_position(position: str) -> Optional[int]:
+    # Positions with leading zeros are no list indices (RFC 6901).
+    if not position.isdigit() or (position != "0" and position.startswith("0")):
+        return None
+    return int(position)
+
+
+class DatasetTree:
+    """
+    Navigation index over the flat dataset tree list of an EDP.
+
+    The index is built once in linear time. It stores the children of every node, the depth and the interval of
+    every node in an euler tour of the tree. Children, parents, depths and subtree checks are answered in
+    constant time, descendants in time proportional to their count. Paths to the root are cached.
+    """
+
+    def __init__(self, nodes: Sequence[Any]):
+        self.nodes: List[Any] = list(nodes)
+        self._positions: Dict[int, int] = {id(node): position for position, node in enumerate(self.nodes)}
+        self._parents: List[Optional[int]] = [self._parent_position(node) for node in self.nodes]
+        self._children: List[List[int]] = [[] for _ in self.nodes]
+        self.roots: List[Any] = []
+        root_positions = []
+        for position, parent in enumerate(self._parents):
+            if parent is None:
+                root_positions.append(position)
+                self.roots.append(self.nodes[position])
+            else:
+                self._children[parent].append(position)
+
+        self._depths = [0] * len(self.nodes)
+        self._enter = [-1] * len(self.nodes)
+        self._exit = [-1] * len(self.nodes)
+        self._preorder: List[int] = []
+        stack: List[Tuple[int, bool]] = [(position, False) for position in reversed(root_positions)]
+        while stack:
+            position, finished = stack.pop()
+            if finished:
+                self._exit[position] = len(self._preorder)
+                continue
+            self._enter[position] = len(self._preorder)
+            self._preorder.append(position)
+            stack.append((position, True))
+            for child in reversed(self._children[position]):
+                self._depths[child] = self._depths[position] + 1
+                stack.append((child, False))
+        if len(self._preorder) != len(self.nodes):
+            unreachable = [position for position, enter in enumerate(self._enter) if enter < 0]
+            raise ValueError(f"The dataset tree contains cycles through the nodes at positions {unreachable}")
+        self._paths: Dict[int, Tuple[Any, ...]] = {}
+
+    def _parent_position(self, node: Any) -> Optional[int]:
+        if node.parent is None:
+            return None
+        position = parse_tree_reference(node.parent)
+        if position is None or position >= len(self.nodes):
+            raise ValueError(f'Parent reference "{node.parent.reference}" of "{node.name}" is not a dataset tree node')
+        return position
+
+    def position(self, node: NodeOrPosition) -> int:
+        """Position of a node inside the datasetTree list."""
+        if isinstance(node, int):
+            if not 0 <= node < len(self.nodes):
+                raise IndexError(f"There is no dataset tree node at position {node}")
+            return node
+        try:
+            return self._positions[id(node)]
+        except KeyError:
+            raise KeyError(f'"{node.name}" is not a node of this dataset tree') from None
+
+    def parent(self, node: NodeOrPosition) -> Optional[Any]:
+        parent = self._parents[self.position(node)]
+        return None if parent is None else self.nodes[parent]
+
+    def children(self, node: NodeOrPosition) -> List[Any]:
+        return [self.nodes[child] for child in self._children[self.position(node)]]
+
+    def descendants(self, node: NodeOrPosition) -> List[Any]:
+        """All nodes below the given one in depth first order."""
+        position = self.position(node)
+        return [self.nodes[child] for child in self._preorder[self._enter[position] + 1 : self._exit[position]]]
+
+    def ancestors(self, node: NodeOrPosition) -> Tuple[Any, ...]:
+        """All nodes above the given one, starting with its parent and ending with the root."""
+        return tuple(reversed(self.path(node)[:-1]))
+
+    def path(self, node: NodeOrPosition) -> Tuple[Any, ...]:
+        """All nodes from the root down to and including the given one."""
+        position = self.position(node)
+        path = self._paths.get(position)
+        if path is None:
+            walked = []
+            current: Optional[int] = position
+            while current is not None and current not in self._paths:
+                walked.append(self.nodes[current])
+                current = self._parents[current]
+            prefix = () if current is None else self._paths[current]
+            path = self._paths[position] = prefix + tuple(reversed(walked))
+        return path
+
+    def depth(self, node: NodeOrPosition) -> int:
+        """Distance to the root, which has depth zero."""
+        return self._depths[self.position(node)]
+
+    def is_descendant(self, node: NodeOrPosition, ancestor: NodeOrPosition) -> bool:
+        """Check in constant time, whether a node lies in the subtree below the ancestor."""
+        position = self.position(node)
+        ancestor_position = self.position(ancestor)
+        return self._enter[ancestor_position] < self._enter[position] < self._exit[ancestor_position]
+
+    def walk(self) -> Iterator[Tuple[Any, int]]:
+        """Yield all nodes with their depth in depth first order, e.g. for rendering the tree."""
+        for position in self._preorder:
+            yield self.nodes[position], self._depths[position]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+def get_dataset_tree(edp: Any) -> DatasetTree:
+    """Return the navigation index of the dataset tree of an EDP. It is built on first use and cached."""
+    cache = derived_cache(edp)
+    tree = cache.get("dataset_tree")
+    if tree is None:
+        tree = cache["dataset_tree"] = DatasetTree(edp.datasetTree)
+    return tree
@@ -1 +1,2 @@
 from .version import Version as Version
+from .version import parse_version as parse_version
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Union
 
 from packaging.version import Version as _BuiltinVersion
@@ -8,8 +9,13 @@ from pydantic_core import core_schema as cs
 class Version(_BuiltinVersion):
     """
     Semantic version inheriting the packaging version class with added pydantic parsing.
+
+    Versions are immutable, so validated versions are shared between all models using the same version string.
     """
 
+    __slots__ = ("_string",)
+    _string: str
+
     @classmethod
     def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> cs.CoreSchema:
         return cs.no_info_plain_validator_function(
@@ -33,9 +39,28 @@ class Version(_BuiltinVersion):
         if isinstance(object, Version):
             return object
         if isinstance(object, _BuiltinVersion):
-            return Version(str(object))
+            return parse_version(str(object))
+        if isinstance(object, str):
+            return parse_version(object)
         return Version(object)
 
     @classmethod
     def _serialize_json(cls, instance: "Version"):
         return str(instance)
+
+    def __str__(self) -> str:
+        try:
+            return self._string
+        except AttributeError:
+            self._string = super().__str__()
+            return self._string
+
+
+@lru_cache(maxsize=1024)
+def parse_version(text: str) -> Version:
+    """
+    Return the shared version instance of a version string.
+
+    EDPs mostly use only a handful of different versions, so parsing is cached instead of repeated per document.
+    """
+    return Version(text)
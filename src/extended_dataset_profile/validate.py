@@ -0,0 +1,191 @@
+import os
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import IO, Deque, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Type, Union
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+from extended_dataset_profile.models.registry import SchemaVersions
+
+JsonDocument = Tuple[str, bytes]
+"""A raw JSON document together with a human readable description of where it came from."""
+
+Schema = Union[Type[ExtendedDatasetProfileBase], SchemaVersions]
+"""Either a single EDP model or all registered versions, in which case documents get validated by their major."""
+
+
+class ValidationResult(NamedTuple):
+    """
+    Outcome of validating a single EDP document.
+    """
+
+    source: str
+    edp: Optional[ExtendedDatasetProfileBase]
+    errors: List[ErrorDetails]
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(schema: Type[ExtendedDatasetProfileBase]) -> TypeAdapter[ExtendedDatasetProfileBase]:
+    """Return the cached type adapter used to validate raw JSON documents of the given schema."""
+    return TypeAdapter(schema)
+
+
+def validate_json(source: str, raw: bytes, schema: Schema, include_input: bool = True) -> ValidationResult:
+    """
+    Validate a single raw JSON document without building an intermediate dictionary.
+
+    Without `include_input`, the errors do not contain the invalid input, which may be the whole document.
+    """
+    try:
+        if isinstance(schema, SchemaVersions):
+            edp = get_type_adapter(schema.model_for_json(raw)).validate_json(raw)
+        else:
+            edp = get_type_adapter(schema).validate_json(raw)
+    except ValidationError as error:
+        return ValidationResult(source, None, error.errors(include_url=False, include_input=include_input))
+    except Exception as error:
+        # Validators of the models may raise other exceptions for invalid data, which must not abort a bulk run.
+        return ValidationResult(source, None, [_exception_details(error)])
+    return ValidationResult(source, edp, [])
+
+
+def _exception_details(error: Exception) -> ErrorDetails:
+    return {"type": type(error).__name__, "loc": (), "msg": str(error), "input": None}
+
+
+def validate_documents(documents: Iterable[JsonDocument], schema: Schema) -> Iterator[ValidationResult]:
+    """Lazily validate the given documents, yielding one result per document."""
+    for source, raw in documents:
+        yield validate_json(source, raw, schema)
+
+
+def validate_documents_parallel(
+    documents: Iterable[JsonDocument],
+    schema: Schema,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+) -> Iterator[ValidationResult]:
+    """
+    Validate the given documents in a pool of worker processes.
+
+    The raw JSON bytes are sent to the workers in chunks of `chunk_size` documents. Only a bounded number of chunks
+    is in flight at any time, so memory usage stays constant for arbitrarily large inputs. The validated models
+    are not sent back to this process, thus the results only contain the source and errors of each document.
+    With `ordered` disabled, results are yielded as soon as their chunk finished instead of in input order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    documents = iter(documents)
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = 2 * max_workers
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future[List[ValidationResult]]] = deque()
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(documents, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_validate_chunk, schema, chunk))
+            if not pending:
+                return
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done: Set[Future[List[ValidationResult]]]
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+
+
+def _validate_chunk(schema: Schema, chunk: List[JsonDocument]) -> List[ValidationResult]:
+    # The inputs of the errors are left out, since they may contain whole documents.
+    return [
+        ValidationResult(source, None, validate_json(source, raw, schema, include_input=False).errors)
+        for source, raw in chunk
+    ]
+
+
+def validate_paths(
+    paths: Iterable[Path], schema: Schema, jobs: int = 1, **parallel_options
+) -> Iterator[ValidationResult]:
+    """
+    Lazily validate all EDPs found in the given NDJSON files or directories of JSON files.
+
+    With more than one job, the documents get validated by `validate_documents_parallel`, which receives all
+    additional keyword arguments.
+    """
+    documents = (document for path in paths for document in read_documents(path))
+    if jobs > 1:
+        return validate_documents_parallel(documents, schema, max_workers=jobs, **parallel_options)
+    return validate_documents(documents, schema)
+
+
+def read_documents(path: Path) -> Iterator[JsonDocument]:
+    """
+    Read raw JSON documents from a path.
+
+    Directories yield one document per contained ".json" file, every other path is read as NDJSON with one
+    document per line. The path "-" reads NDJSON from stdin. Only a single document is held in memory at a time.
+    """
+    if str(path) == "-":
+        yield from read_ndjson(sys.stdin.buffer, "<stdin>")
+    elif path.is_dir():
+        for file_path in sorted(path.glob("*.json")):
+            yield str(file_path), file_path.read_bytes()
+    else:
+        with open(path, "rb") as file:
+            yield from read_ndjson(file, str(path))
+
+
+def read_ndjson(file: IO[bytes], name: str) -> Iterator[JsonDocument]:
+    """Read one raw JSON document per non empty line from a binary stream."""
+    for line_number, line in enumerate(file, start=1):
+        if line.strip():
+            yield f"{name}:{line_number}", line
+
+
+def validate_edps(schema: Schema) -> int:
+    args = _get_args()
+    invalid_count = 0
+    total_count = 0
+    results = validate_paths(
+        args.inputs, schema, jobs=args.jobs, chunk_size=args.chunk_size, ordered=not args.unordered
+    )
+    for result in results:
+        total_count += 1
+        if result.valid:
+            continue
+        invalid_count += 1
+        for error in result.errors:
+            location = ".".join(str(part) for part in error["loc"])
+            print(f"{result.source}: {location}: {error['msg']}")
+    print(f"{total_count - invalid_count} of {total_count} documents are valid", file=sys.stderr)
+    return 1 if invalid_count else 0
+
+
+def _get_args():
+    parser = ArgumentParser(description="Validate extended dataset profiles")
+    parser.add_argument(
+        "inputs", type=Path, nargs="+", help='NDJSON files, directories of JSON files or "-" to read from stdin'
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of worker processes used for validation")
+    parser.add_argument(
+        "--chunk-size", type=int, default=64, help="Number of documents sent to a worker process at once"
+    )
+    parser.add_argument(
+        "--unordered", action="store_true", help="Report results as soon as they are available, not in input order"
+    )
+    return parser.parse_args()
@@ -1,4 +1,4 @@
-from extended_dataset_profile.types.version import Version
+from extended_dataset_profile.types.version import parse_version
 
 try:
     from ._version import __version__
@@ -6,4 +6,4 @@ except ImportError:
     __version__ = "0.0.0+dirty"
 
 
-CURRENT_VERSION = Version(__version__)
+CURRENT_VERSION = parse_version(__version__)
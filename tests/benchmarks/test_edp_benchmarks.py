@@ -0,0 +1,141 @@
+import io
+import json
+import logging
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from pytest import importorskip, mark
+
+from extended_dataset_profile.models import v0, v1
+from extended_dataset_profile.patch import apply_patch
+from extended_dataset_profile.stream import EdpStreamParser
+
+pytestmark = mark.benchmark
+
+_LOGGER = logging.getLogger(__name__)
+
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {"structured_datasets": 1, "columns": 6, "word_cloud": 10, "tree_depth": 1},
+    "large": {"structured_datasets": 20, "columns": 60, "word_cloud": 1000, "tree_depth": 4, "tree_breadth": 2},
+}
+REPEATS = 5
+
+# The model modules by their major version. The registry only contains v1 in releases with that major.
+MODELS = {0: v0, 1: v1}
+MAJORS = mark.parametrize("major", list(MODELS))
+SIZE_NAMES = mark.parametrize("size", list(SIZES))
+
+
+def _best_seconds(function: Callable[[], Any], repeats: int = REPEATS) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _peak_bytes(function: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _record(
+    results: List[Dict[str, Any]],
+    benchmark: str,
+    major: int,
+    size: Optional[str],
+    seconds: float,
+    peak_bytes: int,
+    **extra: Any,
+):
+    result = {"benchmark": benchmark, "major": major, "size": size, "seconds": seconds, "peak_bytes": peak_bytes}
+    results.append({**result, **extra})
+    _LOGGER.info("%s v%d %s: %.6f s, peak %d bytes", benchmark, major, size or "-", seconds, peak_bytes)
+
+
+@MAJORS
+@SIZE_NAMES
+def test_benchmark_validate_json(benchmark_results, make_edp_data, major: int, size: str):
+    schema = MODELS[major].ExtendedDatasetProfile
+    raw = json.dumps(make_edp_data(schema=schema, **SIZES[size])).encode()
+    seconds = _best_seconds(lambda: schema.model_validate_json(raw))
+    peak = _peak_bytes(lambda: schema.model_validate_json(raw))
+    _record(benchmark_results, "model_validate_json", major, size, seconds, peak, document_bytes=len(raw))
+
+
+@MAJORS
+@SIZE_NAMES
+def test_benchmark_dump_json(benchmark_results, make_edp_data, major: int, size: str):
+    schema = MODELS[major].ExtendedDatasetProfile
+    edp = schema.model_validate(make_edp_data(schema=schema, **SIZES[size]))
+    seconds = _best_seconds(lambda: edp.model_dump_json(by_alias=True))
+    peak = _peak_bytes(lambda: edp.model_dump_json(by_alias=True))
+    _record(benchmark_results, "model_dump_json", major, size, seconds, peak)
+
+
+@MAJORS
+def test_benchmark_schema_export(benchmark_results, major: int):
+    schema = MODELS[major].ExtendedDatasetProfile
+    seconds = _best_seconds(lambda: schema.model_json_schema(by_alias=True))
+    peak = _peak_bytes(lambda: schema.model_json_schema(by_alias=True))
+    _record(benchmark_results, "model_json_schema", major, None, seconds, peak)
+
+
+@MAJORS
+def test_benchmark_import(benchmark_results, python_runner, major: int):
+    module = f"extended_dataset_profile.models.v{major}"
+    time_code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    seconds = float(python_runner(time_code).stdout)
+    # Tracing slows down the import, so the memory is measured in a separate run.
+    peak_code = f"import tracemalloc; tracemalloc.start(); import {module}; print(tracemalloc.get_traced_memory()[1])"
+    peak = int(python_runner(peak_code).stdout)
+    _record(benchmark_results, "import", major, None, seconds, peak)
+
+
+@MAJORS
+@SIZE_NAMES
+def test_benchmark_binary(benchmark_results, make_edp_data, major: int, size: str):
+    importorskip("msgpack")
+    from extended_dataset_profile.binary import from_bytes, to_bytes
+
+    schema = MODELS[major].ExtendedDatasetProfile
+    edp = schema.model_validate(make_edp_data(schema=schema, **SIZES[size]))
+    data = to_bytes(edp)
+    json_bytes = len(edp.model_dump_json(by_alias=True))
+    seconds = _best_seconds(lambda: to_bytes(edp))
+    peak = _peak_bytes(lambda: to_bytes(edp))
+    _record(benchmark_results, "to_bytes", major, size, seconds, peak, document_bytes=len(data), json_bytes=json_bytes)
+    seconds = _best_seconds(lambda: from_bytes(data, schema))
+    peak = _peak_bytes(lambda: from_bytes(data, schema))
+    _record(benchmark_results, "from_bytes", major, size, seconds, peak, document_bytes=len(data))
+
+
+@MAJORS
+def test_benchmark_stream_parser(benchmark_results, make_edp_data, major: int):
+    schema = MODELS[major].ExtendedDatasetProfile
+    raw = json.dumps(make_edp_data(schema=schema, **SIZES["large"])).encode()
+
+    def parse():
+        for _ in EdpStreamParser(io.BytesIO(raw), schema):
+            pass
+
+    seconds = _best_seconds(parse)
+    peak = _peak_bytes(parse)
+    _record(benchmark_results, "stream_parser", major, "large", seconds, peak, document_bytes=len(raw))
+
+
+@MAJORS
+def test_benchmark_apply_patch(benchmark_results, make_edp_data, major: int):
+    schema = MODELS[major].ExtendedDatasetProfile
+    edp = schema.model_validate(make_edp_data(schema=schema, **SIZES["large"]))
+    patch = [{"op": "replace", "path": "/structuredDatasets/10/numericColumns/5/mean", "value": 1.5}]
+    seconds = _best_seconds(lambda: apply_patch(edp, patch))
+    peak = _peak_bytes(lambda: apply_patch(edp, patch))
+    _record(benchmark_results, "apply_patch", major, "large", seconds, peak)
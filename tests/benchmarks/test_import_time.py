@@ -0,0 +1,51 @@
+import logging
+from typing import Callable, Dict
+
+from pytest import mark
+
+pytestmark = mark.benchmark
+
+_LOGGER = logging.getLogger(__name__)
+
+_LANGUAGE_MODULES = [
+    "extended_dataset_profile.models.v0.languages",
+    "extended_dataset_profile.models.v1.languages",
+]
+
+
+def _import_times_us(run_python: Callable, code: str) -> Dict[str, int]:
+    """Self import time in microseconds of every module imported by the code, as reported by "-X importtime"."""
+    times: Dict[str, int] = {}
+    for line in run_python(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, module = line.removeprefix("import time:").split("|")
+        if self_time.strip().isdigit():
+            times[module.strip()] = times.get(module.strip(), 0) + int(self_time)
+    return times
+
+
+def _record(results, benchmark: str, microseconds: int):
+    results.append({"benchmark": benchmark, "major": None, "size": None, "seconds": microseconds / 1e6})
+    _LOGGER.info("%s: %d µs", benchmark, microseconds)
+
+
+def test_language_import_time(benchmark_results, python_runner):
+    import_code = "; ".join(f"import {module}" for module in _LANGUAGE_MODULES)
+    import_times = _import_times_us(python_runner, import_code)
+    _record(benchmark_results, "import_languages", sum(import_times[module] for module in _LANGUAGE_MODULES))
+
+    lookup_code = (
+        f"import time; from {_LANGUAGE_MODULES[0]} import is_iso639_3; start = time.perf_counter(); "
+        "is_iso639_3('deu'); print(round((time.perf_counter() - start) * 1e6))"
+    )
+    _record(benchmark_results, "first_language_lookup", int(python_runner(lookup_code).stdout))
+
+
+def test_package_import_time(benchmark_results, python_runner):
+    import_times = _import_times_us(python_runner, "import extended_dataset_profile")
+    _record(benchmark_results, "import_package", sum(import_times.values()))
+    model_times = _import_times_us(
+        python_runner, "import extended_dataset_profile; extended_dataset_profile.CURRENT_SCHEMA"
+    )
+    _record(benchmark_results, "import_package_current_schema", sum(model_times.values()))
@@ -0,0 +1,36 @@
+import logging
+import tracemalloc
+
+from extended_dataset_profile.languages import LANGUAGE_REGISTRY, iso639_3_codes
+from extended_dataset_profile.models.v0.languages import Language as V0Language
+from extended_dataset_profile.models.v1.languages import Language as V1Language
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _traced_bytes(function) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current
+
+
+def test_language_table_loaded_once_for_all_versions():
+    iso639_3_codes.cache_clear()
+    table_bytes = _traced_bytes(lambda: LANGUAGE_REGISTRY.is_iso639_3("deu"))
+
+    registries = [LANGUAGE_REGISTRY.overlay(additions=[f"q{index:02d}"]) for index in range(50)]
+    lookup_bytes = _traced_bytes(lambda: [registry.is_iso639_3("deu") for registry in registries])
+
+    _LOGGER.info(
+        "Shared language table: %d bytes, lookups in 50 version registries: %d bytes", table_bytes, lookup_bytes
+    )
+    assert iso639_3_codes.cache_info().misses == 1
+    assert lookup_bytes < table_bytes / 10
+
+
+def test_versions_share_language_type():
+    assert V0Language is V1Language
@@ -0,0 +1,252 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from pytest import fixture, mark
+
+from extended_dataset_profile import CURRENT_SCHEMA, __version__
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+
+EdpDataFactory = Callable[..., Dict[str, Any]]
+
+BENCHMARK_RESULTS_VARIABLE = "EDP_BENCHMARK_RESULTS"
+"""Path of the NDJSON file the benchmark results get appended to, one line per test session."""
+
+
+@fixture
+def edp_data() -> Dict[str, Any]:
+    """Minimal valid EDP of the current schema as python dictionary."""
+    return {
+        "schemaVersion": str(CURRENT_SCHEMA._get_version()),
+        "name": "test asset",
+        "generatedBy": "pytest",
+        "freely_available": True,
+        "volume": 1024,
+        "assetSha256Hash": "0" * 64,
+        "assetRefs": [
+            {
+                "assetId": "asset-1",
+                "assetUrl": "https://example.com/assets/1",
+                "dataSpace": {"name": "test space", "url": "https://example.com"},
+                "publisher": {"name": "publisher"},
+                "publishDate": "2025-01-01T00:00:00",
+                "license": {"name": "MIT"},
+            }
+        ],
+    }
+
+
+@fixture
+def edp_json(edp_data) -> bytes:
+    return json.dumps(edp_data).encode()
+
+
+@fixture
+def make_edp_data() -> EdpDataFactory:
+    """Factory for synthetic EDPs of configurable size, see `generate_edp_data`."""
+    return generate_edp_data
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter, so no module is cached from the test session."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *options, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmarks", action="store_true", help="Run the benchmarks and record their results")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks"):
+        return
+    skip = mark.skip(reason="Benchmarks only run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@fixture(scope="session")
+def python_runner() -> Callable[..., subprocess.CompletedProcess]:
+    return run_python
+
+
+@fixture(scope="session")
+def benchmark_results(pytestconfig):
+    """
+    Collects benchmark results and appends them to the results file at the end of the session.
+
+    The results are written to the path given by the EDP_BENCHMARK_RESULTS environment variable and default to
+    ".benchmarks/results.ndjson". Every session appends one line, so results of different releases can be compared.
+    """
+    results: List[Dict[str, Any]] = []
+    yield results
+    if not results:
+        return
+    path = Path(os.environ.get(BENCHMARK_RESULTS_VARIABLE, pytestconfig.rootpath / ".benchmarks" / "results.ndjson"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    run = {
+        "package_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(run) + "\n")
+
+
+def generate_edp_data(
+    structured_datasets: int = 1,
+    columns: int = 3,
+    word_cloud: int = 10,
+    tree_depth: int = 2,
+    tree_breadth: int = 1,
+    schema: Optional[Type[ExtendedDatasetProfileBase]] = None,
+) -> Dict[str, Any]:
+    """
+    Generate a valid EDP as python dictionary.
+
+    Every structured dataset has `columns` columns, alternating between numeric, datetime and string columns.
+    The dataset tree consists of nested archives with `tree_breadth` sub archives each, up to `tree_depth` levels.
+    All datasets are attached to the archives of the deepest level.
+    """
+    schema = schema or CURRENT_SCHEMA
+    archives: List[Dict[str, Any]] = []
+    tree: List[Dict[str, Any]] = []
+    parents: List[Optional[int]] = [None]
+    for _ in range(tree_depth):
+        level: List[Optional[int]] = []
+        for parent in parents:
+            for _ in range(tree_breadth):
+                level.append(len(tree))
+                tree.append(_tree_node(f"#/archiveDatasets/{len(archives)}", "archive", parent, f"{len(tree)}.zip"))
+                archives.append({"algorithm": "zip", "extractedSize": 1024})
+        parents = level
+
+    structured = [_structured_dataset(columns) for _ in range(structured_datasets)]
+    for index in range(structured_datasets):
+        parent = parents[index % len(parents)]
+        tree.append(_tree_node(f"#/structuredDatasets/{index}", "structured", parent, f"table_{index}.csv"))
+    tree.append(_tree_node("#/unstructuredTextDatasets/0", "unstructuredText", parents[0], "text.txt"))
+
+    data_types = ["structured", "unstructuredText"] + (["archive"] if archives else [])
+    return {
+        "schemaVersion": str(schema._get_version()),
+        "name": "synthetic asset",
+        "generatedBy": "pytest",
+        "freely_available": True,
+        "volume": 1024,
+        "assetSha256Hash": "0" * 64,
+        "assetRefs": [
+            {
+                "assetId": "asset-1",
+                "assetUrl": "https://example.com/assets/1",
+                "dataSpace": {"name": "test space", "url": "https://example.com"},
+                "publisher": {"name": "publisher", "url": "https://example.com/publisher"},
+                "publishDate": "2025-01-01T00:00:00",
+                "license": {"name": "MIT"},
+            }
+        ],
+        "dataTypes": data_types,
+        "temporalCover": {"earliest": "2024-01-01T00:00:00", "latest": "2025-01-01T00:00:00"},
+        "archiveDatasets": archives,
+        "structuredDatasets": structured,
+        "unstructuredTextDatasets": [
+            {
+                "languages": ["deu", "eng"],
+                "wordCloud": [{"word": f"word{index}", "count": word_cloud - index} for index in range(word_cloud)],
+                "lineCount": 100,
+                "wordCount": 1000,
+            }
+        ],
+        "datasetTree": tree,
+    }
+
+
+def _tree_node(dataset: str, dataset_type: str, parent: Optional[int], name: str) -> Dict[str, Any]:
+    return {
+        "dataset": {"$ref": dataset},
+        "datasetType": dataset_type,
+        "parent": None if parent is None else {"$ref": f"#/datasetTree/{parent}"},
+        "name": name,
+        "fileProperties": {"name": name, "fileType": name.rsplit(".", 1)[-1], "size": 1024},
+    }
+
+
+def _structured_dataset(columns: int) -> Dict[str, Any]:
+    numeric = [_numeric_column(f"numeric_{index}") for index in range(0, columns, 3)]
+    datetime = [_datetime_column(f"datetime_{index}") for index in range(1, columns, 3)]
+    string = [_string_column(f"string_{index}") for index in range(2, columns, 3)]
+    return {
+        "rowCount": 1000,
+        "columnCount": columns,
+        "numericColumnCount": len(numeric),
+        "datetimeColumnCount": len(datetime),
+        "stringColumnCount": len(string),
+        "correlationSummary": {"no": 1, "partial": 2, "strong": 3},
+        "numericColumns": numeric,
+        "datetimeColumns": datetime,
+        "stringColumns": string,
+        "primaryDatetimeColumn": datetime[0]["name"] if datetime else None,
+    }
+
+
+def _base_column(name: str) -> Dict[str, Any]:
+    return {"name": name, "nullCount": 1, "inconsistentCount": 2, "interpretableCount": 997, "numberUnique": 500}
+
+
+def _numeric_column(name: str) -> Dict[str, Any]:
+    return {
+        **_base_column(name),
+        "min": 0,
+        "max": 100.5,
+        "mean": 50.25,
+        "median": 50,
+        "variance": 12.5,
+        "stddev": 3.5,
+        "upperPercentile": 99.0,
+        "lowerPercentile": 1.0,
+        "percentileOutlierCount": 20,
+        "upperQuantile": 75.0,
+        "lowerQuantile": 25.0,
+        "quantileOutlierCount": 10,
+        "upperZScore": 3.0,
+        "lowerZScore": -3.0,
+        "zScoreOutlierCount": 5,
+        "upperIQR": 125.0,
+        "lowerIQR": -25.0,
+        "iqr": 50.0,
+        "iqrOutlierCount": 3,
+        "relativeOutlierCount": 0.01,
+        "distribution": "normal",
+        "distributionGraph": f"plots/{name}_distribution.png",
+        "boxPlot": f"plots/{name}_box.png",
+        "trend": "Increasing",
+        "original_series": [{"timeBaseColumn": "datetime_1", "file": f"plots/{name}_series.png"}],
+        "dataType": "float64",
+    }
+
+
+def _datetime_column(name: str) -> Dict[str, Any]:
+    return {
+        **_base_column(name),
+        "temporalCover": {"earliest": "2024-01-01T00:00:00", "latest": "2025-01-01T00:00:00"},
+        "all_entries_are_unique": True,
+        "monotonically_increasing": True,
+        "monotonically_decreasing": False,
+        "periodicity": "daily",
+        "temporalConsistencies": [{"timeScale": "day", "differentAbundancies": 1, "stable": True, "numberOfGaps": 0}],
+        "format": "%Y-%m-%d",
+    }
+
+
+def _string_column(name: str) -> Dict[str, Any]:
+    return {**_base_column(name), "distributionGraph": None}
@@ -1,9 +1,11 @@
+import json
 import sys
 from pathlib import Path
 
 from pytest import MonkeyPatch
 
-from extended_dataset_profile import export_schema
+from extended_dataset_profile import CURRENT_SCHEMA, export_schema, schema_versions
+from extended_dataset_profile.export import get_json_schema
 
 
 def test_export_edp_schema(tmp_path: Path, monkeypatch: MonkeyPatch):
@@ -11,3 +13,24 @@ def test_export_edp_schema(tmp_path: Path, monkeypatch: MonkeyPatch):
     monkeypatch.setattr(sys, "argv", [__name__, "--output", str(schema_file)])
     export_schema()
     assert schema_file.exists()
+
+
+def test_export_all_edp_schemas(tmp_path: Path, monkeypatch: MonkeyPatch):
+    output_dir = tmp_path / "schemas"
+    monkeypatch.setattr(sys, "argv", [__name__, "--output", str(output_dir), "--all-versions"])
+    export_schema()
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        f"edp_schema_v{major}.json" for major in sorted(schema_versions)
+    ]
+    for major in schema_versions:
+        assert (output_dir / f"edp_schema_v{major}.json").read_bytes() == get_json_schema(schema_versions[major])
+
+
+def test_json_schema_is_cached():
+    assert get_json_schema(CURRENT_SCHEMA) is get_json_schema(CURRENT_SCHEMA)
+    assert get_json_schema(CURRENT_SCHEMA, mode="serialization") is not get_json_schema(CURRENT_SCHEMA)
+
+
+def test_json_schema_uses_aliases():
+    schema = json.loads(get_json_schema(CURRENT_SCHEMA))
+    assert "$ref" in schema["$defs"]["JsonReference"]["properties"]
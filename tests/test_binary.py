@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+from pydantic import ValidationError
+from pytest import importorskip, mark, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.models import v0, v1
+
+importorskip("msgpack")
+
+from extended_dataset_profile.binary import from_bytes, to_bytes  # noqa: E402
+
+
+@mark.parametrize("models", [v0, v1], ids=["v0", "v1"])
+def test_binary_round_trip(make_edp_data, models):
+    schema = models.ExtendedDatasetProfile
+    edp = schema.model_validate(make_edp_data(schema=schema, structured_datasets=2, columns=6, tree_depth=3))
+    decoded = from_bytes(to_bytes(edp), schema)
+    assert decoded == edp
+    assert decoded.model_dump() == edp.model_dump()
+
+
+def test_binary_is_smaller_than_json(make_edp_data):
+    edp = ExtendedDatasetProfile.model_validate(make_edp_data(structured_datasets=5, columns=30))
+    assert len(to_bytes(edp)) < len(edp.model_dump_json(by_alias=True)) / 2
+
+
+def test_binary_keeps_native_types(make_edp_data):
+    data = make_edp_data()
+    data["assetRefs"][0]["publishDate"] = datetime(2025, 1, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=2)))
+    data["structuredDatasets"][0]["numericColumns"][0]["min"] = timedelta(days=1, microseconds=5)
+    edp = ExtendedDatasetProfile.model_validate(data)
+    decoded = from_bytes(to_bytes(edp), ExtendedDatasetProfile)
+    publish_date = decoded.assetRefs[0].publishDate
+    assert publish_date == data["assetRefs"][0]["publishDate"]
+    assert publish_date.utcoffset() == timedelta(hours=2)
+    assert decoded.temporalCover is not None
+    assert decoded.temporalCover.earliest.tzinfo is None
+    assert decoded.structuredDatasets[0].numericColumns[0].min == timedelta(days=1, microseconds=5)
+    assert (
+        decoded.structuredDatasets[0].numericColumns[0].boxPlot == edp.structuredDatasets[0].numericColumns[0].boxPlot
+    )
+
+
+def test_binary_trusted(make_edp_data):
+    edp = ExtendedDatasetProfile.model_validate(make_edp_data())
+    decoded = from_bytes(to_bytes(edp), ExtendedDatasetProfile, trusted=True)
+    assert decoded.model_dump() == edp.model_dump()
+
+
+def test_binary_rejects_invalid_data(edp_data):
+    edp = ExtendedDatasetProfile.model_validate(edp_data)
+    edp.assetRefs = []
+    with raises(ValidationError):
+        from_bytes(to_bytes(edp), ExtendedDatasetProfile)
+
+
+def test_binary_rejects_unknown_fields():
+    import msgpack  # type: ignore[import-untyped]
+
+    with raises(ValueError, match="Unknown field ID 999"):
+        from_bytes(msgpack.packb({999: "value"}), ExtendedDatasetProfile)
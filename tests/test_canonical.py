@@ -0,0 +1,74 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.canonical import canonical_json, content_hash, unique_by_content
+from extended_dataset_profile.models.base.cache import clear_derived_cache
+
+
+def test_canonical_json_is_compact_and_sorted(make_edp_data):
+    edp = ExtendedDatasetProfile.model_validate(make_edp_data(structured_datasets=2))
+    data = canonical_json(edp)
+    assert data.count(b": ") == 0 and data.count(b", ") == 0
+    parsed = json.loads(data)
+    assert list(parsed) == sorted(parsed)
+    assert canonical_json(ExtendedDatasetProfile.model_validate(json.loads(edp.model_dump_json(by_alias=True)))) == data
+
+
+def test_canonical_json_sorts_sets(make_edp_data):
+    data = make_edp_data()
+    data["unstructuredTextDatasets"][0]["languages"] = ["fra", "deu", "eng"]
+    first = ExtendedDatasetProfile.model_validate(data)
+    data["unstructuredTextDatasets"][0]["languages"] = ["eng", "fra", "deu"]
+    second = ExtendedDatasetProfile.model_validate(data)
+    assert canonical_json(first) == canonical_json(second)
+    assert json.loads(canonical_json(first))["unstructuredTextDatasets"][0]["languages"] == ["deu", "eng", "fra"]
+
+
+def test_canonical_json_normalizes_floats(make_edp_data):
+    data = make_edp_data()
+    data["structuredDatasets"][0]["numericColumns"][0]["mean"] = 2
+    as_int = ExtendedDatasetProfile.model_validate(data)
+    data["structuredDatasets"][0]["numericColumns"][0]["mean"] = 2.0
+    as_float = ExtendedDatasetProfile.model_validate(data)
+    assert canonical_json(as_int) == canonical_json(as_float)
+    assert b'"mean":2,' in canonical_json(as_float)
+
+
+def test_canonical_json_normalizes_datetimes(make_edp_data):
+    data = make_edp_data()
+    utc = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+    data["assetRefs"][0]["publishDate"] = utc
+    first = ExtendedDatasetProfile.model_validate(data)
+    data["assetRefs"][0]["publishDate"] = utc.astimezone(timezone(timedelta(hours=2)))
+    second = ExtendedDatasetProfile.model_validate(data)
+    assert canonical_json(first) == canonical_json(second)
+    assert json.loads(canonical_json(first))["assetRefs"][0]["publishDate"] == "2024-05-01T12:00:00Z"
+
+
+def test_content_hash_is_cached(make_edp_data):
+    edp = ExtendedDatasetProfile.model_validate(make_edp_data())
+    digest = edp.content_hash()
+    assert len(digest) == 64
+    assert content_hash(edp) is digest
+    edp.description = "changed"
+    assert edp.content_hash() is digest
+    clear_derived_cache(edp)
+    assert edp.content_hash() != digest
+
+
+def test_content_hash_differs_for_changes_and_not_for_copies(make_edp_data):
+    data = make_edp_data()
+    edp = ExtendedDatasetProfile.model_validate(data)
+    assert edp.model_copy(deep=True).content_hash() == edp.content_hash()
+    data["name"] = "other"
+    assert ExtendedDatasetProfile.model_validate(data).content_hash() != edp.content_hash()
+
+
+def test_unique_by_content(make_edp_data):
+    data = make_edp_data()
+    first = ExtendedDatasetProfile.model_validate(data)
+    duplicate = ExtendedDatasetProfile.model_validate(data)
+    data["name"] = "other"
+    other = ExtendedDatasetProfile.model_validate(data)
+    assert list(unique_by_content([first, duplicate, other, first])) == [first, other]
@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+
+from pytest import fixture
+
+from extended_dataset_profile import DataSetType, ExtendedDatasetProfile
+from extended_dataset_profile.catalog import EdpCatalog
+
+
+def _edp(make_edp_data, index: int, data_space: str = "test space", image=None, **changes):
+    data = make_edp_data(columns=3)
+    data["assetSha256Hash"] = f"{index:064x}"
+    data["name"] = f"asset {index}"
+    data["assetRefs"][0]["dataSpace"]["name"] = data_space
+    if image is not None:
+        data["imageDatasets"] = [
+            {
+                "codec": "PNG",
+                "colorMode": "RGB",
+                "resolution": {"width": image[0], "height": image[1]},
+                "dpi": None,
+                "brightness": None,
+                "blurriness": None,
+                "sharpness": None,
+                "brisque": None,
+                "noise": None,
+                "lowContrast": None,
+                "elaScore": None,
+            }
+        ]
+        data["dataTypes"].append("image")
+    data.update(changes)
+    return ExtendedDatasetProfile.model_validate(data)
+
+
+@fixture
+def catalog(tmp_path, make_edp_data):
+    with EdpCatalog(tmp_path / "catalog.sqlite", ExtendedDatasetProfile) as catalog:
+        catalog.add_all(
+            [
+                _edp(make_edp_data, 1, "space X", image=(3840, 2160)),
+                _edp(make_edp_data, 2, "space X", image=(1920, 1080)),
+                _edp(make_edp_data, 3, "space Y", image=(7680, 4320)),
+                _edp(
+                    make_edp_data,
+                    4,
+                    "space X",
+                    temporalCover={"earliest": "2020-01-01T00:00:00Z", "latest": "2020-06-01T00:00:00Z"},
+                ),
+            ]
+        )
+        yield catalog
+
+
+def _names(query):
+    return [entry.name for entry in query]
+
+
+def test_catalog_query_by_data_space_and_image_resolution(catalog):
+    query = (
+        catalog.query().in_data_space("space X").with_data_type(DataSetType.image).with_image_larger_than(3840, 2160)
+    )
+    assert _names(query) == ["asset 1"]
+    assert query.count() == 1
+    assert _names(catalog.query().with_image_larger_than(3840, 2160)) == ["asset 1", "asset 3"]
+    assert catalog.query().with_video_larger_than(1, 1).first() is None
+
+
+def test_catalog_query_by_dates(catalog):
+    assert _names(catalog.query().covering(datetime(2020, 3, 1, tzinfo=timezone.utc))) == ["asset 4"]
+    assert catalog.query().covering(datetime(2019, 1, 1), datetime(2024, 6, 1)).count() == 4
+    assert catalog.query().published_between(datetime(2025, 1, 1)).count() == 4
+    assert catalog.query().published_between(end=datetime(2024, 12, 31)).count() == 0
+
+
+def test_catalog_query_by_columns(catalog):
+    column = catalog.get(f"{1:064x}").structuredDatasets[0].numericColumns[0].name
+    assert catalog.query().with_column(column).count() == 4
+    assert catalog.query().with_column("missing").count() == 0
+    assert catalog.query().with_min_rows(1).count() == 4
+
+
+def test_catalog_entries_load_lazily(catalog, make_edp_data):
+    entry = catalog.query().in_data_space("space Y").first()
+    assert entry is not None
+    assert entry._edp is None
+    assert entry.edp == _edp(make_edp_data, 3, "space Y", image=(7680, 4320))
+    assert entry.edp is entry.edp
+
+
+def test_catalog_replaces_and_removes(catalog, make_edp_data):
+    assert len(catalog) == 4
+    catalog.add(_edp(make_edp_data, 1, "space Z"))
+    assert len(catalog) == 4
+    assert _names(catalog.query().in_data_space("space Z")) == ["asset 1"]
+    assert catalog.query().in_data_space("space X").count() == 2
+    assert catalog.remove(f"{1:064x}")
+    assert not catalog.remove(f"{1:064x}")
+    assert catalog.get(f"{1:064x}") is None
+    assert catalog.query().in_data_space("space Z").count() == 0
+
+
+def test_catalog_queries_use_indexes(catalog):
+    query = catalog.query().in_data_space("space X").with_column("name")
+    plan = catalog._connection.execute(
+        f"EXPLAIN QUERY PLAN SELECT a.id FROM assets a{query._where_clause()}",  # noqa: S608
+        query._parameters,
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "asset_refs_data_space" in details
+    assert "columns_name" in details
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional, Type
+
+from pytest import fixture, importorskip, mark, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.models import v0, v1
+from extended_dataset_profile.models.base import ExtendedDatasetProfileBase
+
+pyarrow = importorskip("pyarrow")
+
+from extended_dataset_profile.columnar import (  # noqa: E402
+    DATETIME_COLUMNS,
+    NUMERIC_COLUMNS,
+    STRING_COLUMNS,
+    ColumnarFormat,
+    column_statistics_tables,
+    write_column_statistics,
+)
+
+
+@fixture
+def edps(make_edp_data):
+    edps = []
+    for index in range(3):
+        data = make_edp_data(structured_datasets=2, columns=6)
+        data["assetSha256Hash"] = str(index) * 64
+        edps.append(ExtendedDatasetProfile.model_validate(data))
+    return edps
+
+
+def test_column_statistics_tables(edps):
+    tables = column_statistics_tables(edps)
+    numeric = tables[NUMERIC_COLUMNS]
+    assert numeric.num_rows == 3 * 2 * 2
+    assert tables[DATETIME_COLUMNS].num_rows == 3 * 2 * 2
+    assert tables[STRING_COLUMNS].num_rows == 3 * 2 * 2
+    assert numeric.column("assetSha256Hash").to_pylist()[:4] == ["0" * 64] * 4
+    assert numeric.column("dataset").to_pylist()[:4] == ["#/structuredDatasets/0"] * 2 + ["#/structuredDatasets/1"] * 2
+    assert numeric.column("datasetName").to_pylist()[0] == "table_0.csv"
+    assert numeric.column("name").to_pylist()[:2] == ["numeric_0", "numeric_3"]
+    assert numeric.column("mean").to_pylist()[0] == 50.25
+    assert numeric.column("trend").to_pylist()[0] == "Increasing"
+    assert numeric.column("boxPlot").to_pylist()[0] == "plots/numeric_0_box.png"
+    datetime_table = tables[DATETIME_COLUMNS]
+    assert datetime_table.column("temporalCover.earliest").to_pylist()[0] == edps[0].temporalCover.earliest
+
+
+def test_column_statistics_timedelta_as_seconds(make_edp_data):
+    data = make_edp_data()
+    data["structuredDatasets"][0]["numericColumns"][0]["min"] = timedelta(minutes=2)
+    tables = column_statistics_tables([ExtendedDatasetProfile.model_validate(data)])
+    assert tables[NUMERIC_COLUMNS].column("min").to_pylist() == [120.0]
+
+
+@mark.parametrize("format", ["arrow", "parquet"])
+def test_write_column_statistics(tmp_path: Path, edps, format: ColumnarFormat):
+    paths = write_column_statistics(edps, tmp_path, format, batch_size=3)
+    expected = column_statistics_tables(edps)
+    for table, path in paths.items():
+        if format == "parquet":
+            written = pyarrow.parquet.read_table(path)
+        else:
+            with pyarrow.ipc.open_file(path) as reader:
+                assert reader.num_record_batches > 1
+                written = reader.read_all()
+        assert written.equals(expected[table])
+
+
+def test_write_column_statistics_of_all_versions(tmp_path: Path, make_edp_data):
+    schemas: List[Type[ExtendedDatasetProfileBase]] = [v0.ExtendedDatasetProfile, v1.ExtendedDatasetProfile]
+    edps = [schema.model_validate(make_edp_data(schema=schema)) for schema in schemas]
+    paths = write_column_statistics(edps, tmp_path)
+    assert pyarrow.parquet.read_table(paths[NUMERIC_COLUMNS]).num_rows == len(edps)
+
+
+class _NumericColumnWithUnit(v1.NumericColumn):
+    unit: Optional[str] = None
+
+
+class _StructuredDataSetWithUnits(v1.StructuredDataSet):
+    numericColumns: List[_NumericColumnWithUnit]  # type: ignore[assignment]
+
+
+class _ExtendedDatasetProfileWithUnits(v1.ExtendedDatasetProfile):
+    structuredDatasets: List[_StructuredDataSetWithUnits]  # type: ignore[assignment]
+
+
+def test_column_statistics_use_the_models_of_the_edps(make_edp_data):
+    data = make_edp_data(schema=v1.ExtendedDatasetProfile)
+    data["structuredDatasets"][0]["numericColumns"][0]["unit"] = "kg"
+    tables = column_statistics_tables([_ExtendedDatasetProfileWithUnits.model_validate(data)])
+    assert tables[NUMERIC_COLUMNS].column("unit").to_pylist() == ["kg"]
+    assert "unit" not in column_statistics_tables([ExtendedDatasetProfile.model_validate(data)])[NUMERIC_COLUMNS]
+
+
+def test_column_statistics_reject_other_column_fields(make_edp_data):
+    data = make_edp_data(schema=v1.ExtendedDatasetProfile)
+    edps = [v1.ExtendedDatasetProfile.model_validate(data), _ExtendedDatasetProfileWithUnits.model_validate(data)]
+    with raises(ValueError, match="numeric_columns"):
+        column_statistics_tables(edps)
+
+
+def test_write_column_statistics_without_datasets(tmp_path: Path, edp_data):
+    paths = write_column_statistics([ExtendedDatasetProfile.model_validate(edp_data)], tmp_path, "arrow")
+    with pyarrow.ipc.open_file(paths[STRING_COLUMNS]) as reader:
+        assert reader.read_all().num_rows == 0
+
+
+def test_write_column_statistics_rejects_unknown_format(tmp_path: Path):
+    with raises(ValueError, match="Unknown format"):
+        write_column_statistics([], tmp_path, "csv")  # type: ignore[arg-type]
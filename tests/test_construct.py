@@ -0,0 +1,107 @@
+from typing import Any, Dict
+
+from pydantic import ValidationError
+from pytest import fixture, raises
+
+from extended_dataset_profile import (
+    CURRENT_SCHEMA,
+    DatasetTreeNode,
+    DataSetType,
+    ExtendedDatasetProfile,
+    StructuredDataSet,
+)
+from extended_dataset_profile.construct import TrustedConstructor, construct_trusted
+
+
+@fixture
+def nested_edp_data(edp_data) -> Dict[str, Any]:
+    numeric_column = {
+        "name": "value",
+        "nullCount": 0,
+        "inconsistentCount": 0,
+        "interpretableCount": 10,
+        "numberUnique": 10,
+        **{key: 1.5 for key in ["min", "max", "mean", "median", "variance", "stddev", "iqr"]},
+        **{key: 1 for key in ["upperPercentile", "lowerPercentile", "upperQuantile", "lowerQuantile"]},
+        **{key: 1 for key in ["upperZScore", "lowerZScore", "upperIQR", "lowerIQR"]},
+        **{key: 0 for key in ["percentileOutlierCount", "quantileOutlierCount", "zScoreOutlierCount"]},
+        "iqrOutlierCount": 0,
+        "relativeOutlierCount": 0.0,
+        "distribution": "normal",
+        "boxPlot": "plots/box.png",
+        "trend": "No Trend",
+        "dataType": "float64",
+    }
+    return {
+        **edp_data,
+        "dataTypes": ["structured", "archive"],
+        "structuredDatasets": [
+            {
+                "rowCount": 10,
+                "columnCount": 1,
+                "numericColumnCount": 1,
+                "datetimeColumnCount": 0,
+                "stringColumnCount": 0,
+                "correlationSummary": {},
+                "numericColumns": [numeric_column],
+                "datetimeColumns": [],
+                "stringColumns": [],
+            }
+        ],
+        "datasetTree": [
+            {
+                "dataset": {"$ref": "#/archiveDatasets/0"},
+                "datasetType": "archive",
+                "name": "archive.zip",
+                "fileProperties": {"name": "archive.zip", "fileType": "zip", "size": 100},
+            },
+            {
+                "dataset": {"$ref": "#/structuredDatasets/0"},
+                "datasetType": "structured",
+                "parent": {"reference": "#/datasetTree/0"},
+                "name": "table.csv",
+                "fileProperties": None,
+            },
+        ],
+    }
+
+
+def test_construct_trusted_matches_validation(nested_edp_data):
+    constructed = construct_trusted(CURRENT_SCHEMA, nested_edp_data)
+    validated = CURRENT_SCHEMA.model_validate(nested_edp_data)
+    assert constructed.model_dump_json(by_alias=True) == validated.model_dump_json(by_alias=True)
+
+
+def test_construct_trusted_builds_submodels(nested_edp_data):
+    edp = construct_trusted(ExtendedDatasetProfile, nested_edp_data)
+    assert isinstance(edp.structuredDatasets[0], StructuredDataSet)
+    assert isinstance(edp.datasetTree[1], DatasetTreeNode)
+    parent = edp.datasetTree[1].parent
+    assert parent is not None
+    assert parent.reference == "#/datasetTree/0"
+    assert edp.dataTypes == {DataSetType.structured, DataSetType.archive}
+
+
+def test_construct_trusted_sets_schema_version(nested_edp_data):
+    del nested_edp_data["schemaVersion"]
+    edp = construct_trusted(CURRENT_SCHEMA, nested_edp_data)
+    assert edp.schemaVersion == CURRENT_SCHEMA._get_version()
+
+
+def test_construct_trusted_does_not_validate(nested_edp_data):
+    nested_edp_data["volume"] = "not a number"
+    assert construct_trusted(ExtendedDatasetProfile, nested_edp_data).volume == "not a number"
+
+
+def test_trusted_constructor_validates_samples(nested_edp_data):
+    constructor = TrustedConstructor(CURRENT_SCHEMA, validate_every=3)
+    nested_edp_data["volume"] = "not a number"
+    constructor(nested_edp_data)
+    constructor(nested_edp_data)
+    with raises(ValidationError):
+        constructor(nested_edp_data)
+
+
+def test_trusted_constructor_rejects_invalid_sampling():
+    with raises(ValueError):
+        TrustedConstructor(CURRENT_SCHEMA, validate_every=0)
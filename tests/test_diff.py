@@ -0,0 +1,124 @@
+import copy
+import json
+from typing import Any, List
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.diff import PatchOperation, diff_edps
+
+
+def _apply(document: Any, operations: List[PatchOperation]) -> Any:
+    """Minimal JSON Patch implementation to check the generated operations."""
+    document = copy.deepcopy(document)
+    for operation in operations:
+        *parents, last = _split(operation["path"])
+        target = _get(document, parents)
+        if operation["op"] == "move":
+            *source_parents, source_last = _split(operation["from"])
+            source = _get(document, source_parents)
+            value = source.pop(int(source_last)) if isinstance(source, list) else source.pop(source_last)
+        else:
+            value = copy.deepcopy(operation.get("value"))
+        if operation["op"] == "remove":
+            del target[int(last) if isinstance(target, list) else last]
+        elif isinstance(target, list) and operation["op"] != "replace":
+            target.insert(int(last), value)
+        else:
+            target[int(last) if isinstance(target, list) else last] = value
+    return document
+
+
+def _split(path: str) -> List[str]:
+    return [part.replace("~1", "/").replace("~0", "~") for part in path.split("/")[1:]]
+
+
+def _get(document: Any, parts: List[str]) -> Any:
+    for part in parts:
+        document = document[int(part)] if isinstance(document, list) else document[part]
+    return document
+
+
+def _dump(edp: ExtendedDatasetProfile) -> Any:
+    return json.loads(edp.model_dump_json(by_alias=True))
+
+
+def _assert_diff_applies(old: ExtendedDatasetProfile, new: ExtendedDatasetProfile) -> List[PatchOperation]:
+    operations = diff_edps(old, new)
+    patched = _apply(_dump(old), operations)
+    assert ExtendedDatasetProfile.model_validate(patched) == new
+    assert patched == _dump(new)
+    return operations
+
+
+def test_diff_of_equal_edps(make_edp_data):
+    data = make_edp_data(structured_datasets=2)
+    assert diff_edps(ExtendedDatasetProfile.model_validate(data), ExtendedDatasetProfile.model_validate(data)) == []
+
+
+def test_diff_of_changed_statistics(make_edp_data):
+    data = make_edp_data(structured_datasets=2, columns=6)
+    old = ExtendedDatasetProfile.model_validate(data)
+    data["structuredDatasets"][1]["numericColumns"][1]["mean"] = 7.5
+    data["description"] = "updated"
+    operations = _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+    assert operations == [
+        {"op": "replace", "path": "/description", "value": "updated"},
+        {"op": "replace", "path": "/structuredDatasets/1/numericColumns/1/mean", "value": 7.5},
+    ]
+
+
+def test_diff_matches_columns_by_name(make_edp_data):
+    data = make_edp_data(columns=12)
+    old = ExtendedDatasetProfile.model_validate(data)
+    columns = data["structuredDatasets"][0]["numericColumns"]
+    columns.reverse()
+    columns[0]["max"] = 200
+    del columns[2]
+    columns.insert(1, {**columns[1], "name": "numeric_new"})
+    operations = _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+    assert {operation["op"] for operation in operations} == {"remove", "move", "add", "replace"}
+    assert len([operation for operation in operations if operation["op"] == "replace"]) == 1
+
+
+def test_diff_matches_asset_refs_and_tree_nodes(make_edp_data):
+    data = make_edp_data(tree_depth=2)
+    data["assetRefs"].append({**data["assetRefs"][0], "assetId": "asset-2"})
+    old = ExtendedDatasetProfile.model_validate(data)
+    data["assetRefs"].reverse()
+    data["assetRefs"][1]["assetUrl"] = "https://example.com/assets/new"
+    data["datasetTree"][-1]["name"] = "renamed.txt"
+    operations = _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+    assert {"op": "move", "from": "/assetRefs/1", "path": "/assetRefs/0"} in operations
+    assert {"op": "replace", "path": "/assetRefs/1/assetUrl", "value": "https://example.com/assets/new"} in operations
+
+
+def test_diff_positional_lists(make_edp_data):
+    data = make_edp_data(word_cloud=5)
+    old = ExtendedDatasetProfile.model_validate(data)
+    word_cloud = data["unstructuredTextDatasets"][0]["wordCloud"]
+    word_cloud[0]["count"] = 100
+    del word_cloud[3:]
+    _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+    word_cloud.extend({"word": f"new{index}", "count": 1} for index in range(4))
+    _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+
+
+def test_diff_with_duplicate_keys_falls_back_to_positions(make_edp_data):
+    data = make_edp_data(tree_depth=2, tree_breadth=2)
+    for node in data["datasetTree"]:
+        node["name"] = "same.zip"
+    old = ExtendedDatasetProfile.model_validate(data)
+    data["datasetTree"][2]["fileProperties"]["size"] = 1
+    operations = _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+    assert operations == [{"op": "replace", "path": "/datasetTree/2/fileProperties/size", "value": 1}]
+
+
+def test_diff_of_optional_models_and_sets(make_edp_data):
+    data = make_edp_data()
+    old = ExtendedDatasetProfile.model_validate(data)
+    data["temporalCover"] = None
+    data["unstructuredTextDatasets"][0]["languages"] = ["fra"]
+    data["datasetTree"][0]["parent"] = {"$ref": "#/datasetTree/1"}
+    operations = _assert_diff_applies(old, ExtendedDatasetProfile.model_validate(data))
+    assert {"op": "replace", "path": "/temporalCover", "value": None} in operations
+    assert {"op": "replace", "path": "/unstructuredTextDatasets/0/languages", "value": ["fra"]} in operations
+    assert {"op": "replace", "path": "/datasetTree/0/parent", "value": {"$ref": "#/datasetTree/1"}} in operations
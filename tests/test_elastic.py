@@ -0,0 +1,102 @@
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from pytest import MonkeyPatch, mark, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile, export_elastic_mapping, schema_versions
+from extended_dataset_profile.elastic import ElasticMappingOptions, get_elastic_mapping
+
+MAJORS = mark.parametrize("major", list(schema_versions))
+
+
+@MAJORS
+def test_elastic_mapping_covers_all_keys(make_edp_data, major: int):
+    schema = schema_versions[major]
+    edp = schema.model_validate(make_edp_data(schema=schema, structured_datasets=2, columns=6))
+    mapping = get_elastic_mapping(schema)
+    assert mapping["dynamic"] == "strict"
+    _assert_mapped(json.loads(edp.model_dump_json(by_alias=True)), mapping, "")
+
+
+def _assert_mapped(value: Any, mapping: Dict[str, Any], path: str):
+    if isinstance(value, list):
+        for item in value:
+            _assert_mapped(item, mapping, path)
+    elif isinstance(value, dict):
+        if mapping.get("enabled") is False:
+            return
+        assert "properties" in mapping, path
+        for key, child in value.items():
+            assert key in mapping["properties"], f"{path}.{key}"
+            _assert_mapped(child, mapping["properties"][key], f"{path}.{key}")
+    elif value is not None:
+        assert "type" in mapping and mapping["type"] not in ("object", "nested"), path
+
+
+def test_elastic_mapping_field_types():
+    properties = get_elastic_mapping(ExtendedDatasetProfile)["properties"]
+    assert properties["assetSha256Hash"] == {"type": "keyword"}
+    assert properties["description"]["type"] == "text"
+    assert properties["description"]["fields"]["keyword"]["type"] == "keyword"
+    assert properties["volume"] == {"type": "long"}
+    assert properties["freely_available"] == {"type": "boolean"}
+    assert properties["temporalCover"]["properties"]["earliest"] == {"type": "date"}
+    assert properties["dataTypes"] == {"type": "keyword"}
+
+    structured = properties["structuredDatasets"]
+    assert structured["type"] == "nested"
+    numeric = structured["properties"]["numericColumns"]
+    assert numeric["type"] == "nested"
+    assert numeric["properties"]["mean"] == {"type": "double", "ignore_malformed": True}
+    assert numeric["properties"]["boxPlot"] == {"type": "keyword"}
+    assert numeric["properties"]["trend"] == {"type": "keyword"}
+
+
+def test_elastic_mapping_references_and_tree():
+    tree = get_elastic_mapping(ExtendedDatasetProfile)["properties"]["datasetTree"]
+    assert "type" not in tree
+    assert tree["properties"]["dataset"]["properties"] == {"$ref": {"type": "keyword"}}
+
+
+def test_elastic_mapping_disabled_fields():
+    properties = get_elastic_mapping(ExtendedDatasetProfile)["properties"]
+    assert properties["unstructuredTextDatasets"]["properties"]["wordCloud"] == {"type": "object", "enabled": False}
+    json_schema = properties["semiStructuredDatasets"]["properties"]["jsonSchema"]
+    assert json_schema == {"type": "keyword", "index": False, "doc_values": False}
+
+
+def test_elastic_mapping_options():
+    options = ElasticMappingOptions(
+        text_fields=frozenset({"generatedBy"}),
+        disabled_fields=frozenset({"structuredDatasets"}),
+        object_fields=frozenset(),
+        dynamic="false",
+    )
+    mapping = get_elastic_mapping(ExtendedDatasetProfile, options)
+    properties = mapping["properties"]
+    assert mapping["dynamic"] == "false"
+    assert properties["generatedBy"]["type"] == "text"
+    assert properties["description"] == {"type": "keyword"}
+    assert properties["structuredDatasets"] == {"type": "object", "enabled": False}
+    assert properties["datasetTree"]["type"] == "nested"
+    assert properties["unstructuredTextDatasets"]["properties"]["wordCloud"]["type"] == "nested"
+
+
+def test_export_all_elastic_mappings(tmp_path: Path, monkeypatch: MonkeyPatch):
+    output_dir = tmp_path / "mappings"
+    monkeypatch.setattr(sys, "argv", [__name__, "--output", str(output_dir), "--all-versions"])
+    export_elastic_mapping()
+    for major in schema_versions:
+        written = json.loads((output_dir / f"edp_mapping_v{major}.json").read_text())
+        assert written == {"mappings": get_elastic_mapping(schema_versions[major])}
+
+
+def test_export_elastic_mapping_help(monkeypatch: MonkeyPatch, capsys):
+    monkeypatch.setattr(sys, "argv", [__name__, "--help"])
+    with raises(SystemExit):
+        export_elastic_mapping()
+    help_text = capsys.readouterr().out
+    assert "Write one mapping per major version" in help_text
+    assert "schema" not in help_text
@@ -0,0 +1,131 @@
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from typing import Iterator, List
+
+from pytest import fixture, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.elastic import BulkBodyWriter, BulkIndexError, index_edps
+
+
+@fixture
+def edps(make_edp_data) -> List[ExtendedDatasetProfile]:
+    edps = []
+    for index in range(10):
+        data = make_edp_data()
+        data["assetSha256Hash"] = f"{index:064x}"
+        edps.append(ExtendedDatasetProfile.model_validate(data))
+    return edps
+
+
+class FakeElastic(HTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _BulkHandler)
+        self.bodies: List[bytes] = []
+        self.rejected_ids: List[str] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _BulkHandler(BaseHTTPRequestHandler):
+    server: FakeElastic
+
+    def do_POST(self):
+        assert self.path == "/_bulk"
+        assert self.headers["Content-Type"] == "application/x-ndjson"
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.bodies.append(body)
+        items = []
+        for line in body.splitlines()[::2]:
+            document_id = json.loads(line)["index"]["_id"]
+            if document_id in self.server.rejected_ids:
+                items.append({"index": {"_id": document_id, "status": 400, "error": {"type": "mapper_parsing"}}})
+            else:
+                items.append({"index": {"_id": document_id, "status": 201}})
+        response = json.dumps({"errors": any("error" in item["index"] for item in items), "items": items}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@fixture
+def fake_elastic() -> Iterator[FakeElastic]:
+    server = FakeElastic()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _documents(body: bytes) -> List[dict]:
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def test_bulk_body_format(edps):
+    (body,) = BulkBodyWriter(index="edps").batches(edps[:2])
+    lines = _documents(body)
+    assert body.endswith(b"\n")
+    assert lines[0] == {"index": {"_index": "edps", "_id": edps[0].assetSha256Hash}}
+    assert ExtendedDatasetProfile.model_validate(lines[1]) == edps[0]
+    assert lines[2] == {"index": {"_index": "edps", "_id": edps[1].assetSha256Hash}}
+    assert b'"$ref"' in body
+
+
+def test_bulk_batches_limited_by_documents(edps):
+    batches = list(BulkBodyWriter(max_documents=4).batches(edps))
+    assert [len(batch.splitlines()) // 2 for batch in batches] == [4, 4, 2]
+    assert b"".join(batches) == b"".join(BulkBodyWriter().batches(edps))
+
+
+def test_bulk_batches_limited_by_bytes(edps):
+    (single,) = BulkBodyWriter().batches(edps[:1])
+    max_bytes = 3 * len(single) + 10
+    batches = list(BulkBodyWriter(max_bytes=max_bytes).batches(edps))
+    assert [len(batch.splitlines()) // 2 for batch in batches] == [3, 3, 3, 1]
+    assert all(len(batch) <= max_bytes for batch in batches)
+
+
+def test_bulk_batches_after_abandoned_call(edps):
+    writer = BulkBodyWriter(max_documents=1)
+    next(writer.batches(edps))
+    first = next(writer.batches(edps))
+    assert len(first.splitlines()) // 2 == 1
+
+
+def test_bulk_batches_oversized_document(edps):
+    batches = list(BulkBodyWriter(max_bytes=10).batches(edps[:3]))
+    assert [len(batch.splitlines()) // 2 for batch in batches] == [1, 1, 1]
+
+
+def test_bulk_batches_escape_ids(edp_data):
+    edp_data["assetSha256Hash"] = 'a"b'
+    (body,) = BulkBodyWriter().batches([ExtendedDatasetProfile.model_validate(edp_data)])
+    assert _documents(body)[0] == {"index": {"_id": 'a"b'}}
+
+
+def test_index_edps(fake_elastic, edps):
+    assert index_edps(fake_elastic.url, edps, index="edps", max_documents=3) == 10
+    assert len(fake_elastic.bodies) == 4
+    assert b"".join(fake_elastic.bodies) == b"".join(BulkBodyWriter(index="edps").batches(edps))
+
+
+def test_index_edps_reports_rejected_documents(fake_elastic, edps):
+    fake_elastic.rejected_ids.append(edps[3].assetSha256Hash)
+    with raises(BulkIndexError) as error:
+        index_edps(fake_elastic.url, edps)
+    assert [item["_id"] for item in error.value.errors] == [edps[3].assetSha256Hash]
+    assert len(fake_elastic.bodies) == 1
+
+
+def test_index_edps_requires_http_url(edps):
+    with raises(ValueError, match="http"):
+        index_edps("file:///etc/passwd", edps)
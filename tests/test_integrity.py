@@ -0,0 +1,86 @@
+import time
+
+from pydantic import ValidationError
+from pytest import fixture, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile, JsonReference
+from extended_dataset_profile.integrity import (
+    CHECK_REFERENCES,
+    ReferenceIntegrityError,
+    check_reference_integrity,
+    find_reference_problems,
+)
+from extended_dataset_profile.tree import parse_dataset_reference
+
+
+@fixture
+def data(make_edp_data):
+    return make_edp_data(structured_datasets=2, tree_depth=2, tree_breadth=2)
+
+
+def test_valid_references(data):
+    assert find_reference_problems(ExtendedDatasetProfile.model_validate(data)) == []
+
+
+def test_missing_dataset(data):
+    data["datasetTree"][3]["dataset"]["$ref"] = "#/structuredDatasets/7"
+    problems = find_reference_problems(ExtendedDatasetProfile.model_validate(data))
+    assert problems == ['datasetTree/3: dataset "#/structuredDatasets/7" does not exist']
+
+
+def test_dataset_is_not_a_dataset(data):
+    targets = ["#/name", "#/assetRefs/0", "#/datasetTree/0", "#/structuredDatasets", "#/structuredDatasets/0/rowCount"]
+    for position, target in enumerate(targets):
+        data["datasetTree"][position]["dataset"]["$ref"] = target
+    problems = find_reference_problems(ExtendedDatasetProfile.model_validate(data))
+    assert problems == [
+        f'datasetTree/{position}: dataset "{target}" is not a dataset' for position, target in enumerate(targets)
+    ]
+
+
+def test_parse_dataset_reference():
+    assert parse_dataset_reference("#/imageDatasets/2") == ("imageDatasets", 2)
+    assert parse_dataset_reference(JsonReference(reference="#/structuredDatasets/0")) == ("structuredDatasets", 0)
+    for reference in ["#/name", "#/structuredDatasets", "#/structuredDatasets/01", "#/datasetTree/0", "#/x/0/y"]:
+        assert parse_dataset_reference(reference) is None
+        assert parse_dataset_reference(JsonReference(reference=reference)) is None
+
+
+def test_parent_outside_of_tree(data):
+    data["datasetTree"][3]["parent"]["$ref"] = "#/structuredDatasets/0"
+    data["datasetTree"][4]["parent"]["$ref"] = "#/datasetTree/100"
+    problems = find_reference_problems(ExtendedDatasetProfile.model_validate(data))
+    assert problems == [
+        'datasetTree/3: parent "#/structuredDatasets/0" is not a dataset tree node',
+        'datasetTree/4: parent "#/datasetTree/100" is not a dataset tree node',
+    ]
+
+
+def test_cycles(data):
+    data["datasetTree"][0]["parent"] = {"$ref": "#/datasetTree/2"}
+    data["datasetTree"][1]["parent"] = {"$ref": "#/datasetTree/1"}
+    problems = find_reference_problems(ExtendedDatasetProfile.model_validate(data))
+    assert problems == [
+        "datasetTree: parents form a cycle through the nodes [0, 2]",
+        "datasetTree: parents form a cycle through the nodes [1]",
+    ]
+    with raises(ReferenceIntegrityError) as error:
+        check_reference_integrity(ExtendedDatasetProfile.model_validate(data))
+    assert error.value.problems == problems
+
+
+def test_integrity_check_is_optional_during_validation(data):
+    data["datasetTree"][3]["dataset"]["$ref"] = "#/structuredDatasets/7"
+    ExtendedDatasetProfile.model_validate(data)
+    with raises(ValidationError, match="does not exist"):
+        ExtendedDatasetProfile.model_validate(data, context={CHECK_REFERENCES: True})
+
+
+def test_large_tree_is_checked_fast(make_edp_data):
+    data = make_edp_data(structured_datasets=0, tree_depth=1)
+    node = data["datasetTree"][0]
+    data["datasetTree"] = [node] + [{**node, "parent": {"$ref": f"#/datasetTree/{index}"}} for index in range(50000)]
+    edp = ExtendedDatasetProfile.model_validate(data)
+    start = time.perf_counter()
+    assert find_reference_problems(edp) == []
+    assert time.perf_counter() - start < 5
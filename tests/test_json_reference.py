@@ -1,6 +1,6 @@
 import pytest
 
-from extended_dataset_profile.models.v1.json_reference import JsonReference
+from extended_dataset_profile.models.v1.json_reference import JsonReference, parse_json_reference
 
 
 def test_json_reference_does_not_match_empty():
@@ -32,3 +32,51 @@ def test_json_reference_matches_path_with_underscore():
 
 def test_json_reference_matches_path_with_minus():
     JsonReference(reference="#/hello-world")
+
+
+def test_json_reference_segments():
+    reference = JsonReference(reference="#/structuredDatasets/12/numericColumns")
+    assert reference.segments == ("structuredDatasets", 12, "numericColumns")
+
+
+def test_json_reference_segments_are_shared():
+    first = JsonReference(reference="#/datasetTree/3")
+    second = JsonReference.model_validate({"$ref": "#/datasetTree/3"})
+    assert first.segments is second.segments
+    assert parse_json_reference("#/datasetTree/3") is first.segments
+
+
+def test_json_reference_equality_and_hash():
+    first = JsonReference(reference="#/datasetTree/3")
+    assert first == JsonReference(reference="#/datasetTree/3")
+    assert first != JsonReference(reference="#/datasetTree/4")
+    assert len({first, JsonReference(reference="#/datasetTree/3")}) == 1
+
+
+def test_parse_json_reference_rejects_invalid():
+    with pytest.raises(ValueError):
+        parse_json_reference("#/hello//world")
+
+
+def test_json_reference_leading_zeros_are_keys():
+    assert parse_json_reference("#/datasetTree/01") == ("datasetTree", "01")
+    assert parse_json_reference("#/datasetTree/0") == ("datasetTree", 0)
+    assert JsonReference(reference="#/datasetTree/01") != JsonReference(reference="#/datasetTree/1")
+
+
+def test_json_reference_segments_follow_assignment():
+    reference = JsonReference(reference="#/datasetTree/0")
+    reference.reference = "#/datasetTree/1"
+    assert reference.segments == ("datasetTree", 1)
+    assert reference == JsonReference(reference="#/datasetTree/1")
+    JsonReference.__pydantic_validator__.validate_assignment(reference, "reference", "#/datasetTree/2")
+    assert reference.segments == ("datasetTree", 2)
+    assert reference.model_copy(update={"reference": "#/datasetTree/3"}).segments == ("datasetTree", 3)
+
+
+def test_json_reference_segments_are_parsed_once():
+    reference = JsonReference(reference="#/datasetTree/3")
+    parse_json_reference.cache_clear()
+    for _ in range(3):
+        assert reference.segments == ("datasetTree", 3)
+    assert parse_json_reference.cache_info().currsize == 0
@@ -0,0 +1,69 @@
+from pydantic import BaseModel
+from pytest import raises
+
+from extended_dataset_profile.languages import LANGUAGE_REGISTRY, LanguageInfo
+
+OverlayLanguage = LANGUAGE_REGISTRY.overlay(additions=["qaa"]).Language
+
+
+def test_registry_contains_iso639_3_codes():
+    assert "deu" in LANGUAGE_REGISTRY
+    assert "de" not in LANGUAGE_REGISTRY
+    assert 1 not in LANGUAGE_REGISTRY
+
+
+def test_overlay_adds_and_removes_codes():
+    registry = LANGUAGE_REGISTRY.overlay(additions=["Qaa"], removals=["deu"])
+    assert registry.is_iso639_3("qaa")
+    assert not registry.is_iso639_3("deu")
+    assert registry.is_iso639_3("eng")
+    assert LANGUAGE_REGISTRY.is_iso639_3("deu")
+    assert not LANGUAGE_REGISTRY.is_iso639_3("qaa")
+
+
+def test_overlay_of_overlay_can_restore_codes():
+    registry = LANGUAGE_REGISTRY.overlay(removals=["deu"]).overlay(additions=["deu"])
+    assert registry.is_iso639_3("deu")
+
+
+def test_overlay_language_type():
+    class Model(BaseModel):
+        language: OverlayLanguage  # type: ignore[valid-type]
+
+    assert Model(language="QAA").language == "qaa"
+    with raises(ValueError):
+        Model(language="en")
+
+
+def test_language_name():
+    assert LANGUAGE_REGISTRY.name("deu") == "German"
+    assert LANGUAGE_REGISTRY.name("DEU") == "German"
+    assert LANGUAGE_REGISTRY.name("xxx") is None
+
+
+def test_language_info():
+    assert LANGUAGE_REGISTRY.info("eng") == LanguageInfo(code="eng", name="English", iso639_1="en")
+    info = LANGUAGE_REGISTRY.info("duo")
+    assert info is not None
+    assert info.iso639_1 is None
+
+
+def test_code_for_normalized_name():
+    assert LANGUAGE_REGISTRY.code_for_name("german") == "deu"
+    assert LANGUAGE_REGISTRY.code_for_name("  Bemba   (Zambia) ") == "bem"
+    assert LANGUAGE_REGISTRY.code_for_name("Arawete") == "awt"
+    assert LANGUAGE_REGISTRY.code_for_name("Klingon-ish") is None
+
+
+def test_iso639_1_to_iso639_3():
+    assert LANGUAGE_REGISTRY.from_iso639_1("de") == "deu"
+    assert LANGUAGE_REGISTRY.from_iso639_1("ZH") == "zho"
+    assert LANGUAGE_REGISTRY.from_iso639_1("xx") is None
+
+
+def test_overlay_removals_hide_metadata():
+    registry = LANGUAGE_REGISTRY.overlay(removals=["deu"])
+    assert registry.name("deu") is None
+    assert registry.code_for_name("German") is None
+    assert registry.from_iso639_1("de") is None
+    assert registry.name("eng") == "English"
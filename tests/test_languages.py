@@ -31,3 +31,12 @@ def test_language_type_doesnt_accept_free_text():
 def test_language_type_case_insensitive():
     model = Model(language="Deu")
     assert model.language == "deu"
+
+
+def test_language_table_is_not_loaded_on_import(python_runner):
+    code = (
+        "import extended_dataset_profile.models.v0.languages, extended_dataset_profile.models.v1.languages\n"
+        "from extended_dataset_profile.languages import iso639_3_codes\n"
+        "print(iso639_3_codes.cache_info().currsize)\n"
+    )
+    assert python_runner(code).stdout.strip() == "0"
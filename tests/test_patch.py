@@ -0,0 +1,149 @@
+from random import Random
+
+from pydantic import ValidationError
+from pytest import fixture, mark, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.diff import diff_edps
+from extended_dataset_profile.integrity import find_reference_problems
+from extended_dataset_profile.patch import PatchError, apply_patch
+from extended_dataset_profile.tree import get_dataset_tree
+
+
+@fixture
+def edp_dict(make_edp_data):
+    return make_edp_data(structured_datasets=2, columns=9, tree_depth=2, tree_breadth=2)
+
+
+@fixture
+def edp(edp_dict) -> ExtendedDatasetProfile:
+    return ExtendedDatasetProfile.model_validate(edp_dict)
+
+
+def test_patch_shares_untouched_parts(edp):
+    patched = apply_patch(edp, [{"op": "replace", "path": "/structuredDatasets/1/numericColumns/1/mean", "value": 7}])
+    column = patched.structuredDatasets[1].numericColumns[1]
+    assert column.mean == 7
+    assert edp.structuredDatasets[1].numericColumns[1].mean == 50.25
+    assert patched.structuredDatasets[0] is edp.structuredDatasets[0]
+    assert patched.structuredDatasets[1].numericColumns[0] is edp.structuredDatasets[1].numericColumns[0]
+    assert patched.structuredDatasets[1].datetimeColumns is edp.structuredDatasets[1].datetimeColumns
+    assert patched.datasetTree is edp.datasetTree
+    assert patched.assetRefs is edp.assetRefs
+
+
+def test_patch_validates_changed_values(edp):
+    patched = apply_patch(edp, [{"op": "replace", "path": "/assetRefs/0/publishDate", "value": "2026-01-01T00:00:00"}])
+    assert patched.assetRefs[0].publishDate.year == 2026
+    with raises(ValidationError):
+        apply_patch(edp, [{"op": "replace", "path": "/structuredDatasets/0/numericColumns/0/mean", "value": "x"}])
+    with raises(ValidationError):
+        apply_patch(edp, [{"op": "remove", "path": "/assetRefs/0"}])
+
+
+def test_patch_validates_added_items(edp, edp_dict):
+    node = {**edp_dict["datasetTree"][0], "name": "added.zip"}
+    patched = apply_patch(edp, [{"op": "add", "path": "/datasetTree/-", "value": node}])
+    assert patched.datasetTree[-1].name == "added.zip"
+    assert patched.datasetTree[:-1] == edp.datasetTree
+    assert all(new is old for new, old in zip(patched.datasetTree, edp.datasetTree))
+    with raises(ValidationError):
+        apply_patch(edp, [{"op": "add", "path": "/datasetTree/0", "value": {"name": "incomplete"}}])
+
+
+def test_patch_move_copy_remove_and_test(edp):
+    first, second = edp.assetRefs[0], edp.assetRefs[0].model_copy(update={"assetId": "asset-2"})
+    edp = edp.model_copy(update={"assetRefs": [first, second]})
+    patched = apply_patch(
+        edp,
+        [
+            {"op": "test", "path": "/assetRefs/1/assetId", "value": "asset-2"},
+            {"op": "move", "from": "/assetRefs/1", "path": "/assetRefs/0"},
+            {"op": "copy", "from": "/assetRefs/1/publisher", "path": "/assetRefs/0/publisher"},
+            {"op": "remove", "path": "/description"},
+        ],
+    )
+    assert [reference.assetId for reference in patched.assetRefs] == ["asset-2", "asset-1"]
+    assert patched.assetRefs[0].publisher is first.publisher
+    assert patched.description is None
+    with raises(PatchError, match="Test"):
+        apply_patch(edp, [{"op": "test", "path": "/assetRefs/1/assetId", "value": "asset-1"}])
+
+
+def test_patch_json_reference_alias(edp):
+    patched = apply_patch(edp, [{"op": "replace", "path": "/datasetTree/2/parent/$ref", "value": "#/datasetTree/1"}])
+    assert patched.datasetTree[2].parent is not None
+    assert patched.datasetTree[2].parent.segments == ("datasetTree", 1)
+    assert get_dataset_tree(patched).parent(2) is patched.datasetTree[1]
+    assert edp.datasetTree[2].parent != patched.datasetTree[2].parent
+    dangling = apply_patch(edp, [{"op": "replace", "path": "/datasetTree/2/parent/$ref", "value": "#/datasetTree/99"}])
+    assert find_reference_problems(dangling) != []
+
+
+def test_patch_replaces_whole_edp(edp, edp_data):
+    patched = apply_patch(edp, [{"op": "replace", "path": "", "value": edp_data}])
+    assert patched == ExtendedDatasetProfile.model_validate(edp_data)
+
+
+@mark.parametrize(
+    "operation",
+    [
+        {"op": "replace", "path": "/unknown", "value": 1},
+        {"op": "replace", "path": "/assetRefs/5/assetId", "value": "x"},
+        {"op": "replace", "path": "/assetRefs/01/assetId", "value": "x"},
+        {"op": "replace", "path": "/name/first", "value": "x"},
+        {"op": "remove", "path": "/name"},
+        {"op": "remove", "path": ""},
+        {"op": "rename", "path": "/name"},
+        {"op": "replace", "path": "name", "value": "x"},
+        {"op": "replace", "path": "/name"},
+        {"op": "move", "from": "/temporalCover", "path": "/temporalCover/earliest"},
+    ],
+)
+def test_patch_rejects_invalid_operations(edp, operation):
+    with raises(PatchError):
+        apply_patch(edp, [operation])
+
+
+def test_patch_applies_diff(edp, edp_dict):
+    columns = edp_dict["structuredDatasets"][0]["stringColumns"]
+    columns.reverse()
+    columns[0]["numberUnique"] = 1
+    edp_dict["structuredDatasets"][1]["numericColumns"].pop()
+    edp_dict["assetRefs"][0]["license"] = {"name": "Apache-2.0"}
+    edp_dict["unstructuredTextDatasets"][0]["languages"] = ["fra"]
+    new = ExtendedDatasetProfile.model_validate(edp_dict)
+    patched = apply_patch(edp, diff_edps(edp, new))
+    assert patched == new
+    assert patched.datasetTree is edp.datasetTree
+
+
+def test_patch_validates_lists_after_all_operations(edp):
+    replaced = edp.assetRefs[0].model_copy(update={"assetId": "asset-2"})
+    new = edp.model_copy(update={"assetRefs": [replaced]})
+    operations = diff_edps(edp, new)
+    assert [operation["op"] for operation in operations] == ["remove", "add"]
+    assert apply_patch(edp, operations) == new
+    with raises(ValidationError):
+        apply_patch(edp, operations[:1])
+
+
+@mark.parametrize("seed", range(50))
+def test_patch_round_trips_random_diffs(edp, seed):
+    random = Random(seed)  # noqa: S311
+    asset_refs = [
+        edp.assetRefs[0].model_copy(update={"assetId": f"asset-{index}"}) for index in range(random.randint(1, 4))
+    ]
+    old = edp.model_copy(update={"assetRefs": asset_refs})
+    new_refs = random.sample(asset_refs, random.randint(1, len(asset_refs)))
+    new_refs.append(asset_refs[0].model_copy(update={"assetId": f"asset-new-{seed}"}))
+    random.shuffle(new_refs)
+    datasets = []
+    for dataset in old.structuredDatasets:
+        columns = random.sample(dataset.numericColumns, random.randint(0, len(dataset.numericColumns)))
+        datasets.append(dataset.model_copy(update={"numericColumns": columns}))
+    new = old.model_copy(
+        update={"assetRefs": new_refs[: random.randint(1, len(new_refs))], "structuredDatasets": datasets}
+    )
+    new = ExtendedDatasetProfile.model_validate(new.model_dump())
+    assert apply_patch(old, diff_edps(old, new)) == new
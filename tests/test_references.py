@@ -0,0 +1,57 @@
+from pytest import fixture, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.references import get_reference_index, resolve_reference, resolve_tree
+
+
+@fixture
+def edp(make_edp_data) -> ExtendedDatasetProfile:
+    return ExtendedDatasetProfile.model_validate(make_edp_data(structured_datasets=3, tree_depth=2, tree_breadth=2))
+
+
+def test_resolve_datasets(edp: ExtendedDatasetProfile):
+    assert resolve_reference(edp, "#/structuredDatasets/2") is edp.structuredDatasets[2]
+    assert resolve_reference(edp, "#/archiveDatasets/0") is edp.archiveDatasets[0]
+    assert resolve_reference(edp, "#/structuredDatasets") is edp.structuredDatasets
+    assert resolve_reference(edp, "#") is edp
+
+
+def test_resolve_json_reference_model(edp: ExtendedDatasetProfile):
+    node = edp.datasetTree[-1]
+    assert resolve_reference(edp, node.dataset) is edp.unstructuredTextDatasets[0]
+
+
+def test_resolve_values(edp: ExtendedDatasetProfile):
+    assert resolve_reference(edp, "#/name") == edp.name
+    assert resolve_reference(edp, "#/structuredDatasets/0/rowCount") == 1000
+    assert resolve_reference(edp, "#/datasetTree/2/parent/$ref") == "#/datasetTree/0"
+
+
+def test_unresolvable_references(edp: ExtendedDatasetProfile):
+    index = get_reference_index(edp)
+    for reference in ["#/structuredDatasets/3", "#/doesNotExist", "#/name/0", "#/structuredDatasets/x"]:
+        assert reference not in index
+        with raises(KeyError):
+            index.resolve(reference)
+    assert index.get("#/doesNotExist") is None
+
+
+def test_reference_index_is_cached(edp: ExtendedDatasetProfile):
+    assert get_reference_index(edp) is get_reference_index(edp)
+    assert get_reference_index(edp) is not get_reference_index(edp.model_copy())
+
+
+def test_pointer_of(edp: ExtendedDatasetProfile):
+    index = get_reference_index(edp)
+    assert index.pointer_of(edp.datasetTree[3]) == "#/datasetTree/3"
+    assert index.pointer_of(edp.datasetTree[3].model_copy()) is None
+
+
+def test_resolve_tree(edp: ExtendedDatasetProfile):
+    resolved = resolve_tree(edp)
+    assert len(resolved) == len(edp.datasetTree)
+    assert resolved[0].parent is None
+    assert resolved[0].dataset is edp.archiveDatasets[0]
+    assert resolved[2].parent is edp.datasetTree[0]
+    structured = [node for node in resolved if node.node.datasetType == "structured"]
+    assert [node.dataset for node in structured] == edp.structuredDatasets
@@ -0,0 +1,131 @@
+import json
+import sys
+from types import ModuleType
+
+from pydantic import ValidationError
+from pytest import MonkeyPatch, raises
+
+import extended_dataset_profile
+from extended_dataset_profile import CURRENT_SCHEMA, CURRENT_VERSION, schema_versions
+from extended_dataset_profile.models import v0, v1
+from extended_dataset_profile.models.registry import SchemaVersions, read_schema_major
+from extended_dataset_profile.types.version import Version
+from extended_dataset_profile.validate import validate_documents
+
+
+def test_schema_versions_import_lazily():
+    versions = SchemaVersions({1: "extended_dataset_profile.models.v1"})
+    assert 1 in versions
+    assert not versions.is_loaded(1)
+    assert versions[1] is v1.ExtendedDatasetProfile
+    assert versions.is_loaded(1)
+
+
+def test_schema_versions_mapping_interface():
+    versions = SchemaVersions({1: "extended_dataset_profile.models.v1"})
+    assert list(versions) == [1]
+    assert len(versions) == 1
+    assert 0 not in versions
+    with raises(KeyError):
+        versions[0]
+
+
+def test_current_schema():
+    assert CURRENT_SCHEMA is v0.ExtendedDatasetProfile
+    assert schema_versions.default == 0
+
+
+def test_v1_is_registered_under_the_major_it_validates():
+    for major in schema_versions:
+        assert schema_versions[major]._get_version().major == major
+    assert (1 in schema_versions) == (CURRENT_VERSION.major == 1)
+
+
+def test_package_forwards_current_version_models():
+    assert extended_dataset_profile.ExtendedDatasetProfile is CURRENT_SCHEMA
+    assert "DatasetTreeNode" in dir(extended_dataset_profile)
+    with raises(AttributeError):
+        extended_dataset_profile.DoesNotExist
+
+
+def test_package_import_does_not_load_models(python_runner):
+    code = "import sys; import extended_dataset_profile; print('extended_dataset_profile.models.v0.edp' in sys.modules)"
+    assert python_runner(code).stdout.strip() == "False"
+
+
+def test_package_star_import(python_runner):
+    code = (
+        "import sys\n"
+        "from extended_dataset_profile import *\n"
+        "assert CURRENT_SCHEMA is ExtendedDatasetProfile\n"
+        "assert DatasetTreeNode.__module__ == 'extended_dataset_profile.models.v0.edp'\n"
+        "assert 'extended_dataset_profile.models.v1' not in sys.modules\n"
+    )
+    python_runner(code)
+
+
+def test_package_submodules_are_not_forwarded(python_runner):
+    code = (
+        "import extended_dataset_profile\n"
+        "assert extended_dataset_profile.ExtendedDatasetProfile\n"
+        "from extended_dataset_profile import languages\n"
+        "assert languages.__name__ == 'extended_dataset_profile.languages'\n"
+        "assert languages.LANGUAGE_REGISTRY\n"
+        "for name in ('edp', 'json_reference'):\n"
+        "    assert not hasattr(extended_dataset_profile, name), name\n"
+    )
+    python_runner(code)
+    python_runner("from extended_dataset_profile import languages\nassert languages.LANGUAGE_REGISTRY\n")
+
+
+def test_package_all_lists_current_version_models():
+    models = {
+        name
+        for name, value in vars(v0.edp).items()
+        if isinstance(value, type) and value.__module__ == v0.edp.__name__ and not name.startswith("_")
+    }
+    assert models <= set(extended_dataset_profile.__all__)
+    assert all(hasattr(extended_dataset_profile, name) for name in extended_dataset_profile.__all__)
+
+
+def test_read_schema_major():
+    assert read_schema_major(b'{"name": "a", "schemaVersion": "1.2.3"}') == 1
+    assert read_schema_major('{"schemaVersion":"v12.0"}') == 12
+    assert read_schema_major(b'{"name": "a"}') is None
+    assert read_schema_major(b'{"description": "\\"schemaVersion\\": \\"1.0\\""}') is None
+
+
+class _ExtendedDatasetProfileV2(v1.ExtendedDatasetProfile):
+    @staticmethod
+    def _get_version() -> Version:
+        return Version("2.0.0")
+
+
+def test_dispatch_mixed_versions(monkeypatch: MonkeyPatch, edp_data):
+    module = ModuleType("edp_test_models_v2")
+    module.ExtendedDatasetProfile = _ExtendedDatasetProfileV2  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    versions = SchemaVersions({0: "extended_dataset_profile.models.v0", 2: module.__name__})
+    v0_json = json.dumps({**edp_data, "schemaVersion": "0.26.1"}).encode()
+    v2_json = json.dumps({**edp_data, "schemaVersion": "2.0.0"}).encode()
+    results = list(validate_documents([("v0", v0_json), ("v2", v2_json)], versions))
+    assert [type(result.edp) for result in results] == [v0.ExtendedDatasetProfile, _ExtendedDatasetProfileV2]
+
+
+def test_dispatch_uses_default_without_schema_version(edp_data):
+    del edp_data["schemaVersion"]
+    versions = SchemaVersions({0: "extended_dataset_profile.models.v0"}, default=0)
+    assert versions.model_for_json(json.dumps(edp_data)) is v0.ExtendedDatasetProfile
+
+
+def test_dispatch_rejects_unknown_major(edp_data):
+    with raises(ValidationError, match="Major schema version 7 is not registered") as error:
+        schema_versions.validate_json(json.dumps({**edp_data, "schemaVersion": "7.0.0"}))
+    assert error.value.errors()[0]["loc"] == ("schemaVersion",)
+
+
+def test_dispatch_requires_schema_version_without_default(edp_data):
+    del edp_data["schemaVersion"]
+    versions = SchemaVersions({0: "extended_dataset_profile.models.v0"})
+    with raises(ValidationError, match="Field required"):
+        versions.validate_json(json.dumps(edp_data))
@@ -0,0 +1,66 @@
+import zlib
+from datetime import timedelta
+
+from pytest import raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.canonical import content_hash
+from extended_dataset_profile.store import BLOB_KEY, EdpStore
+
+
+def _edps(make_edp_data, count: int):
+    edps = []
+    for index in range(count):
+        data = make_edp_data(structured_datasets=2, columns=3)
+        data["assetRefs"][0]["assetId"] = f"asset-{index}"
+        edps.append(ExtendedDatasetProfile.model_validate(data))
+    return edps
+
+
+def test_store_round_trip(tmp_path, make_edp_data):
+    store = EdpStore(tmp_path)
+    data = make_edp_data(structured_datasets=2, columns=6, tree_depth=2)
+    column = data["structuredDatasets"][0]["numericColumns"][0]
+    column["min"] = "PT2M"
+    column["max"] = "PT1H30M"
+    column["dataType"] = "timedelta"
+    edp = ExtendedDatasetProfile.model_validate(data)
+    assert isinstance(edp.structuredDatasets[0].numericColumns[0].min, timedelta)
+    digest = store.put(edp)
+    assert digest == edp.content_hash()
+    assert digest in store
+    restored = store.get(digest, ExtendedDatasetProfile)
+    assert restored.model_dump() == edp.model_dump()
+    assert restored.structuredDatasets[0].numericColumns[0].min == timedelta(minutes=2)
+    restored.model_dump_json()
+    assert restored.content_hash() == digest
+
+
+def test_store_deduplicates_shared_submodels(tmp_path, make_edp_data):
+    store = EdpStore(tmp_path)
+    edps = _edps(make_edp_data, 5)
+    digests = [store.put(edp) for edp in edps]
+    assert len(set(digests)) == 5
+    objects = set(store)
+    assert set(digests) <= objects
+    # The data space, publisher, license and the structured datasets are stored once for all EDPs.
+    assert len(objects) == 5 + 1 + 1 + 1 + len({content_hash(dataset) for dataset in edps[0].structuredDatasets})
+
+
+def test_store_objects_reference_blobs(tmp_path, make_edp_data):
+    store = EdpStore(tmp_path)
+    edp = _edps(make_edp_data, 1)[0]
+    digest = store.put(edp)
+    data = zlib.decompress((tmp_path / "objects" / digest[:2] / digest[2:]).read_bytes())
+    assert f'"dataSpace":{{"{BLOB_KEY}":'.encode() in data
+    assert f'"structuredDatasets":[{{"{BLOB_KEY}":'.encode() in data
+
+
+def test_store_unknown_digest(tmp_path):
+    store = EdpStore(tmp_path)
+    assert "0" * 64 not in store
+    assert "not a digest" not in store
+    with raises(KeyError):
+        store.get("0" * 64, ExtendedDatasetProfile)
+    with raises(ValueError, match="SHA-256"):
+        store.get("../escape", ExtendedDatasetProfile)
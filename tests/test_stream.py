@@ -0,0 +1,83 @@
+import io
+import json
+from pathlib import Path
+
+from pydantic import ValidationError
+from pytest import fixture, mark, raises
+
+from extended_dataset_profile import ExtendedDatasetProfile
+from extended_dataset_profile.stream import EdpStreamParser
+
+
+@fixture
+def large_edp_data(make_edp_data):
+    data = make_edp_data(structured_datasets=3, columns=6, tree_depth=3, tree_breadth=2)
+    data["name"] = "Große Daten 📦"
+    return data
+
+
+@mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_stream_parser_yields_items(large_edp_data, chunk_size: int):
+    raw = json.dumps(large_edp_data, indent=2).encode()
+    edp = ExtendedDatasetProfile.model_validate_json(raw)
+    parser = EdpStreamParser(io.BytesIO(raw), ExtendedDatasetProfile, chunk_size=chunk_size)
+    items = list(parser)
+
+    for field in ["archiveDatasets", "structuredDatasets", "unstructuredTextDatasets", "datasetTree"]:
+        streamed = [item for item in items if item.field == field]
+        assert [item.position for item in streamed] == list(range(len(streamed)))
+        assert [item.value for item in streamed] == getattr(edp, field)
+        assert getattr(parser.header, field) == []
+    assert parser.header.name == "Große Daten 📦"
+    assert parser.header.assetRefs == edp.assetRefs
+    assert parser.header.schemaVersion == edp.schemaVersion
+
+
+def test_stream_parser_reads_text_and_paths(tmp_path: Path, large_edp_data):
+    path = tmp_path / "edp.json"
+    path.write_text(json.dumps(large_edp_data), encoding="utf-8")
+    from_path = EdpStreamParser(path, ExtendedDatasetProfile)
+    from_text = EdpStreamParser(io.StringIO(path.read_text(encoding="utf-8")), ExtendedDatasetProfile, chunk_size=5)
+    assert list(from_path) == list(from_text)
+    assert from_path.header == from_text.header
+
+
+def test_stream_parser_selected_fields(large_edp_data):
+    raw = json.dumps(large_edp_data)
+    parser = EdpStreamParser(io.StringIO(raw), ExtendedDatasetProfile, stream_fields=["datasetTree"])
+    items = list(parser)
+    assert {item.field for item in items} == {"datasetTree"}
+    assert len(parser.header.structuredDatasets) == 3
+
+
+def test_stream_parser_rejects_unknown_fields():
+    with raises(ValueError, match="assetRefs"):
+        EdpStreamParser(io.StringIO("{}"), ExtendedDatasetProfile, stream_fields=["assetRefs"])
+
+
+def test_stream_parser_header_after_items(edp_json):
+    parser = EdpStreamParser(io.BytesIO(edp_json), ExtendedDatasetProfile)
+    with raises(RuntimeError):
+        parser.header
+    assert list(parser) == []
+    assert parser.header == ExtendedDatasetProfile.model_validate_json(edp_json)
+
+
+def test_stream_parser_validates_items(large_edp_data):
+    large_edp_data["datasetTree"][1]["name"] = None
+    items = iter(EdpStreamParser(io.StringIO(json.dumps(large_edp_data)), ExtendedDatasetProfile))
+    assert next(item for item in items if item.field == "datasetTree").position == 0
+    with raises(ValidationError):
+        next(items)
+
+
+def test_stream_parser_validates_header(edp_data):
+    del edp_data["name"]
+    with raises(ValidationError):
+        list(EdpStreamParser(io.StringIO(json.dumps(edp_data)), ExtendedDatasetProfile))
+
+
+@mark.parametrize("raw", ['{"name": "a"', '{"datasetTree": [{}', '{"name": "a"} []', '["name"]', '{"volume": 12'])
+def test_stream_parser_rejects_invalid_json(raw: str):
+    with raises(ValueError):
+        list(EdpStreamParser(io.StringIO(raw), ExtendedDatasetProfile, chunk_size=3))
@@ -0,0 +1,112 @@
+from pytest import fixture, raises
+
+from extended_dataset_profile import DatasetTreeNode, DataSetType, ExtendedDatasetProfile
+from extended_dataset_profile.tree import DatasetTree, get_dataset_tree, parse_tree_reference
+
+
+@fixture
+def edp(make_edp_data) -> ExtendedDatasetProfile:
+    # Nodes 0 and 1 are root archives, 2 and 3 are children of 0, 4 and 5 children of 1.
+    # The structured datasets 6 to 9 and the text 10 are attached to the archives 2 to 5.
+    return ExtendedDatasetProfile.model_validate(make_edp_data(structured_datasets=4, tree_depth=2, tree_breadth=2))
+
+
+def _node(name: str, parent: int) -> DatasetTreeNode:
+    return DatasetTreeNode.model_validate(
+        {
+            "dataset": {"$ref": "#/archiveDatasets/0"},
+            "datasetType": DataSetType.archive,
+            "parent": {"$ref": f"#/datasetTree/{parent}"},
+            "name": name,
+            "fileProperties": None,
+        }
+    )
+
+
+def test_parse_tree_reference():
+    assert parse_tree_reference("#/datasetTree/12") == 12
+    assert parse_tree_reference("#/structuredDatasets/12") is None
+    assert parse_tree_reference("#/datasetTree/x") is None
+
+
+def test_children_and_parents(edp: ExtendedDatasetProfile):
+    tree = get_dataset_tree(edp)
+    nodes = edp.datasetTree
+    assert tree.roots == [nodes[0], nodes[1]]
+    assert tree.children(nodes[0]) == [nodes[2], nodes[3]]
+    assert tree.children(2) == [nodes[6], nodes[10]]
+    assert tree.parent(nodes[6]) is nodes[2]
+    assert tree.parent(0) is None
+
+
+def test_descendants(edp: ExtendedDatasetProfile):
+    tree = get_dataset_tree(edp)
+    nodes = edp.datasetTree
+    assert tree.descendants(0) == [nodes[2], nodes[6], nodes[10], nodes[3], nodes[7]]
+    assert tree.descendants(nodes[6]) == []
+    assert tree.is_descendant(nodes[10], nodes[0])
+    assert not tree.is_descendant(nodes[10], nodes[1])
+    assert not tree.is_descendant(nodes[0], nodes[0])
+
+
+def test_ancestors_and_depth(edp: ExtendedDatasetProfile):
+    tree = get_dataset_tree(edp)
+    nodes = edp.datasetTree
+    assert tree.ancestors(nodes[10]) == (nodes[2], nodes[0])
+    assert tree.path(nodes[10]) == (nodes[0], nodes[2], nodes[10])
+    assert tree.path(nodes[10]) is tree.path(10)
+    assert tree.ancestors(0) == ()
+    assert [tree.depth(position) for position in [0, 2, 10]] == [0, 1, 2]
+
+
+def test_walk(edp: ExtendedDatasetProfile):
+    walked = [(edp.datasetTree.index(node), depth) for node, depth in get_dataset_tree(edp).walk()]
+    assert walked[:4] == [(0, 0), (2, 1), (6, 2), (10, 2)]
+    assert len(walked) == len(edp.datasetTree)
+
+
+def test_unknown_nodes(edp: ExtendedDatasetProfile):
+    tree = get_dataset_tree(edp)
+    with raises(KeyError):
+        tree.children(edp.datasetTree[0].model_copy())
+    with raises(IndexError):
+        tree.children(len(edp.datasetTree))
+
+
+def test_tree_is_cached(edp: ExtendedDatasetProfile):
+    assert get_dataset_tree(edp) is get_dataset_tree(edp)
+
+
+def test_cycles_are_rejected():
+    with raises(ValueError, match="cycles"):
+        DatasetTree([_node("a", 1), _node("b", 0)])
+
+
+def test_parent_must_be_tree_node():
+    with raises(ValueError, match="is not a dataset tree node"):
+        DatasetTree([_node("a", 5)])
+
+
+def test_deep_tree():
+    nodes = [_node(str(position), position - 1) for position in range(20000)]
+    nodes[0].parent = None
+    tree = DatasetTree(nodes)
+    assert tree.depth(19999) == 19999
+    assert len(tree.descendants(0)) == 19999
+    assert len(tree.ancestors(19999)) == 19999
+
+
+def test_parse_tree_reference_uses_segments():
+    node = _node("a", 7)
+    assert node.parent is not None
+    assert parse_tree_reference(node.parent) == 7
+    assert parse_tree_reference(node.dataset) is None
+
+
+def test_parse_tree_reference_rejects_leading_zeros():
+    assert parse_tree_reference("#/datasetTree/0") == 0
+    assert parse_tree_reference("#/datasetTree/01") is None
+    node = _node("a", 7)
+    assert node.parent is not None
+    node.parent.reference = "#/datasetTree/07"
+    assert parse_tree_reference(node.parent) is None
@@ -0,0 +1,100 @@
+import json
+import sys
+from pathlib import Path
+
+from pytest import MonkeyPatch, raises
+
+from extended_dataset_profile import CURRENT_SCHEMA, validate_edps
+from extended_dataset_profile.validate import (
+    get_type_adapter,
+    read_documents,
+    validate_documents,
+    validate_documents_parallel,
+    validate_paths,
+)
+
+
+def _write_ndjson(path: Path, *lines: bytes) -> Path:
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    return path
+
+
+def test_type_adapter_is_cached():
+    assert get_type_adapter(CURRENT_SCHEMA) is get_type_adapter(CURRENT_SCHEMA)
+
+
+def test_read_ndjson_skips_empty_lines(tmp_path: Path, edp_json: bytes):
+    path = _write_ndjson(tmp_path / "edps.ndjson", edp_json, b"", edp_json)
+    sources = [source for source, _ in read_documents(path)]
+    assert sources == [f"{path}:1", f"{path}:3"]
+
+
+def test_validate_ndjson_reports_errors_per_record(tmp_path: Path, edp_data, edp_json: bytes):
+    del edp_data["volume"]
+    path = _write_ndjson(tmp_path / "edps.ndjson", edp_json, json.dumps(edp_data).encode(), b"{broken")
+    results = list(validate_paths([path], CURRENT_SCHEMA))
+    assert [result.valid for result in results] == [True, False, False]
+    assert isinstance(results[0].edp, CURRENT_SCHEMA)
+    assert results[1].edp is None
+    assert results[1].errors[0]["loc"] == ("volume",)
+    assert results[2].errors[0]["type"] == "json_invalid"
+
+
+def test_validate_reports_other_exceptions_per_record(make_edp_data, edp_json: bytes):
+    edp_data = make_edp_data()
+    edp_data["unstructuredTextDatasets"][0]["embeddedTables"] = [
+        {"startLine": 5, "endLine": 2, "structuredDatasetName": "table"}
+    ]
+    documents = [("0", json.dumps(edp_data).encode()), ("1", edp_json)]
+    for results in (
+        list(validate_documents(documents, CURRENT_SCHEMA)),
+        list(validate_documents_parallel(documents, CURRENT_SCHEMA, max_workers=2, chunk_size=1)),
+    ):
+        assert [result.valid for result in results] == [False, True]
+        assert results[0].errors[0]["type"] == "RuntimeError"
+        assert "End line index" in results[0].errors[0]["msg"]
+
+
+def test_validate_directory(tmp_path: Path, edp_json: bytes):
+    (tmp_path / "b.json").write_bytes(edp_json)
+    (tmp_path / "a.json").write_bytes(b"{}")
+    (tmp_path / "ignored.txt").write_bytes(b"{}")
+    results = list(validate_paths([tmp_path], CURRENT_SCHEMA))
+    assert [Path(result.source).name for result in results] == ["a.json", "b.json"]
+    assert [result.valid for result in results] == [False, True]
+
+
+def test_validate_edps_script(tmp_path: Path, monkeypatch: MonkeyPatch, capsys, edp_json: bytes):
+    path = _write_ndjson(tmp_path / "edps.ndjson", edp_json, b"{}")
+    monkeypatch.setattr(sys, "argv", [__name__, str(path)])
+    assert validate_edps() == 1
+    output = capsys.readouterr()
+    assert f"{path}:2: name: Field required" in output.out
+    assert "1 of 2 documents are valid" in output.err
+
+
+def test_validate_parallel_ordered(edp_json: bytes):
+    documents = [(str(index), edp_json if index % 3 else b"{}") for index in range(20)]
+    results = list(validate_documents_parallel(documents, CURRENT_SCHEMA, max_workers=2, chunk_size=3))
+    assert [result.source for result in results] == [str(index) for index in range(20)]
+    assert [result.valid for result in results] == [bool(index % 3) for index in range(20)]
+    assert all(result.edp is None for result in results)
+    assert all("input" not in error for result in results for error in result.errors)
+
+
+def test_validate_parallel_unordered(edp_json: bytes):
+    documents = [(str(index), edp_json) for index in range(20)]
+    results = list(validate_documents_parallel(documents, CURRENT_SCHEMA, max_workers=2, chunk_size=4, ordered=False))
+    assert sorted(int(result.source) for result in results) == list(range(20))
+    assert all(result.valid for result in results)
+
+
+def test_validate_parallel_rejects_empty_chunks(edp_json: bytes):
+    with raises(ValueError):
+        next(validate_documents_parallel([("0", edp_json)], CURRENT_SCHEMA, chunk_size=0))
+
+
+def test_validate_edps_script_parallel(tmp_path: Path, monkeypatch: MonkeyPatch, edp_json: bytes):
+    path = _write_ndjson(tmp_path / "edps.ndjson", *([edp_json] * 10))
+    monkeypatch.setattr(sys, "argv", [__name__, "--jobs", "2", "--chunk-size", "2", str(path)])
+    assert validate_edps() == 0
@@ -2,7 +2,8 @@ import pytest
 from packaging.version import Version as BuiltInVersion
 from pydantic import TypeAdapter
 
-from extended_dataset_profile.types import Version
+from extended_dataset_profile import CURRENT_SCHEMA
+from extended_dataset_profile.types import Version, parse_version
 
 
 @pytest.fixture(scope="session")
@@ -33,3 +34,24 @@ def test_version_serializes_json(adapter):
     json = json_bytes.decode()
     assert isinstance(json, str)
     assert json == '"1.2.3"'
+
+
+def test_version_strings_share_instance(adapter):
+    first = adapter.validate_python("1.2.3")
+    assert adapter.validate_strings("1.2.3") is first
+    assert adapter.validate_python(BuiltInVersion("1.2.3")) is first
+    assert parse_version("1.2.3") is first
+
+
+def test_version_rejects_invalid(adapter):
+    with pytest.raises(ValueError):
+        adapter.validate_python("not a version")
+    with pytest.raises(ValueError):
+        adapter.validate_python(None)
+
+
+def test_edps_share_schema_version(edp_data):
+    first = CURRENT_SCHEMA.model_validate(edp_data)
+    second = CURRENT_SCHEMA.model_validate(edp_data)
+    assert first.schemaVersion is second.schemaVersion
+    assert str(first.schemaVersion) is str(second.schemaVersion)